@@ -1 +1 @@
-from jaxatari.core import make, list_available_games
\ No newline at end of file
+from jaxatari.core import make, make_vec, list_available_games, rollout, compile_env, enable_compilation_cache
@@ -0,0 +1,108 @@
+"""Narrow storage layouts for game states, used by the compact_state/expand_state hooks of the games."""
+
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+import chex
+import jax
+import jax.numpy as jnp
+
+
+@dataclass(frozen=True)
+class FixedPoint:
+    """
+    Layout of a real valued field stored as round(value * scale) in an integer dtype.
+    The round trip is exact for values that are multiples of 1 / scale (use a power of two) and fit the dtype.
+    """
+    dtype: Any
+    scale: int
+
+
+@dataclass(frozen=True)
+class Columns:
+    """
+    Layout of a table field whose last axis is split into one array per column, so every column can be
+    stored in its own dtype (or FixedPoint).
+    """
+    layouts: Tuple[Any, ...]
+
+
+def _compact_leaf(layout: Any, value: chex.Array) -> Any:
+    if isinstance(layout, Columns):
+        return tuple(_compact_leaf(column_layout, value[..., i]) for i, column_layout in enumerate(layout.layouts))
+    if isinstance(layout, FixedPoint):
+        return jnp.round(value * layout.scale).astype(layout.dtype)
+    return value.astype(layout)
+
+
+def _expand_leaf(layout: Any, value: Any, like: Any) -> chex.Array:
+    if isinstance(layout, Columns):
+        return jnp.stack(
+            [_expand_leaf(column_layout, column, like) for column_layout, column in zip(layout.layouts, value)],
+            axis=-1,
+        )
+    if isinstance(layout, FixedPoint):
+        return (value.astype(like.dtype) / layout.scale).astype(like.dtype)
+    return value.astype(like.dtype)
+
+
+def _leaf_fits(layout: Any, value: chex.Array) -> chex.Array:
+    if isinstance(layout, Columns):
+        return jnp.all(
+            jnp.stack([_leaf_fits(column_layout, value[..., i]) for i, column_layout in enumerate(layout.layouts)])
+        )
+    if isinstance(layout, FixedPoint):
+        value, dtype = value * layout.scale, jnp.dtype(layout.dtype)
+    else:
+        dtype = jnp.dtype(layout)
+    if not jnp.issubdtype(dtype, jnp.integer) or jnp.issubdtype(value.dtype, jnp.bool_):
+        return jnp.asarray(True)
+    low, high = jnp.iinfo(dtype).min, jnp.iinfo(dtype).max
+    if jnp.issubdtype(value.dtype, jnp.integer):
+        # Bounds beyond the range of the value's own dtype can't be compared against, and can't be exceeded
+        low, high = max(low, jnp.iinfo(value.dtype).min), min(high, jnp.iinfo(value.dtype).max)
+    exact = jnp.logical_and(value >= jnp.asarray(low, value.dtype), value <= jnp.asarray(high, value.dtype))
+    if jnp.issubdtype(value.dtype, jnp.floating):
+        exact = jnp.logical_and(exact, jnp.round(value) == value)
+    return jnp.all(exact)
+
+
+def fits_layout(state: Any, layout: Any) -> Any:
+    """
+    Checks that compact_fields stores every value of state exactly, i.e. that no integer field leaves the range
+    of its storage dtype and no float field stored as an integer (or FixedPoint) has a fraction it cannot hold.
+    The casts in compact_fields wrap or truncate such values without any signal, so use this to validate a layout.
+    Args:
+        state: The (possibly batched) state pytree.
+        layout: The layout to check state against.
+
+    Returns: A pytree with the structure of layout with one boolean per field, True if all its values fit.
+    """
+    return jax.tree.map(_leaf_fits, layout, state)
+
+
+def compact_fields(state: Any, layout: Any) -> Any:
+    """
+    Stores every field of state in the layout given for it. Values outside a field's storage range are not
+    detected here (see fits_layout).
+    Args:
+        state: The (possibly batched) state pytree.
+        layout: A pytree with the structure of state whose leaves are dtypes, FixedPoint or Columns.
+
+    Returns: The compact state; Columns fields become tuples of column arrays.
+    """
+    return jax.tree.map(_compact_leaf, layout, state)
+
+
+def expand_fields(compact_state: Any, layout: Any, state_like: Any) -> Any:
+    """
+    Inverse of compact_fields.
+    Args:
+        compact_state: The (possibly batched) compact state.
+        layout: The layout compact_state was created with.
+        state_like: A state pytree (arrays or jax.ShapeDtypeStruct, e.g. from jax.eval_shape of reset)
+            whose leaves give the dtypes to restore.
+
+    Returns: The state with its original structure and dtypes.
+    """
+    return jax.tree.map(_expand_leaf, layout, compact_state, state_like)
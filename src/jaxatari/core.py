@@ -1,34 +1,86 @@
+import functools
 import importlib
-import inspect
+from typing import Any, Callable, NamedTuple, Optional, Sequence, Tuple
+
+import chex
+import jax
+import jax.numpy as jnp
 
 from jaxatari.environment import JaxEnvironment
 from jaxatari.renderers import JAXGameRenderer
-from jaxatari.wrappers import JaxatariWrapper
+from jaxatari.rendering.jax_rendering_utils import RendererConfig
+from jaxatari.wrappers import AtariWrapper, JaxatariWrapper, VecEnvWrapper
 
 
-# Map of game names to their module paths
-GAME_MODULES = {
-    "pong": "jaxatari.games.jax_pong",
-    "seaquest": "jaxatari.games.jax_seaquest",
-    "kangaroo": "jaxatari.games.jax_kangaroo",
-    "freeway": "jaxatari.games.jax_freeway",
-    "breakout": "jaxatari.games.jax_breakout",
+class GameSpec(NamedTuple):
+    """Registry entry of a game: where its classes live and what they are called."""
+    module: str
+    env_class: str
+    renderer_class: str
+    mod_module: Optional[str] = None
+    mod_classes: Tuple[str, ...] = ()
+
+
+# Explicit registry of all games. Classes are only imported when a game is first requested.
+GAME_REGISTRY = {
+    "pong": GameSpec(
+        "jaxatari.games.jax_pong", "JaxPong", "PongRenderer",
+        "jaxatari.games.mods.pong_mods", ("LazyEnemyWrapper", "RandomizedEnemyWrapper"),
+    ),
+    "seaquest": GameSpec(
+        "jaxatari.games.jax_seaquest", "JaxSeaquest", "SeaquestRenderer",
+        "jaxatari.games.mods.seaquest_mods", ("DisableEnemiesWrapper",),
+    ),
+    "kangaroo": GameSpec(
+        "jaxatari.games.jax_kangaroo", "JaxKangaroo", "KangarooRenderer",
+        "jaxatari.games.mods.kangaroo_mods", ("DisableThreadsWrapper",),
+    ),
+    "freeway": GameSpec(
+        "jaxatari.games.jax_freeway", "JaxFreeway", "FreewayRenderer",
+        "jaxatari.games.mods.freeway_mods", ("StopAllCars", "AlwaysStopAllCars", "SpeedMode"),
+    ),
+    "breakout": GameSpec(
+        "jaxatari.games.jax_breakout", "JaxBreakout", "BreakoutRenderer",
+        "jaxatari.games.mods.breakout_mods",
+        ("SpeedMode", "SmallPaddle", "BigPaddle", "BallDrift", "BallGravity", "BallColor", "BlockColor", "PlayerColor"),
+    ),
+    "choppercommand": GameSpec("jaxatari.games.jax_choppercommand", "JaxChopperCommand", "ChopperCommandRenderer"),
+    "asteroids": GameSpec("jaxatari.games.jax_asteroids", "JaxAsteroids", "AsteroidsRenderer"),
+    "atlantis": GameSpec("jaxatari.games.jax_atlantis", "JaxAtlantis", "AtlantisRenderer"),
+    "tetris": GameSpec("jaxatari.games.jax_tetris", "JaxTetris", "TetrisRenderer"),
+    "surround": GameSpec("jaxatari.games.jax_surround", "JaxSurround", "SurroundRenderer"),
     # Add new games here
 }
 
-MOD_MODULES = {
-    "pong": "jaxatari.games.mods.pong_mods",
-    "seaquest": "jaxatari.games.mods.seaquest_mods",
-    "kangaroo": "jaxatari.games.mods.kangaroo_mods",
-    "freeway": "jaxatari.games.mods.freeway_mods",
-    "breakout": "jaxatari.games.mods.breakout_mods",
-}
+# Map of game names to their module paths
+GAME_MODULES = {name: spec.module for name, spec in GAME_REGISTRY.items()}
+
+MOD_MODULES = {name: spec.mod_module for name, spec in GAME_REGISTRY.items() if spec.mod_module is not None}
+
+# Renderers handed out by make_renderer, keyed by game name and renderer config
+_RENDERER_CACHE = {}
 
 def list_available_games() -> list[str]:
     """Lists all available, registered games."""
-    return list(GAME_MODULES.keys())
+    return list(GAME_REGISTRY.keys())
+
+def _get_spec(game_name: str) -> GameSpec:
+    if game_name not in GAME_REGISTRY:
+        raise NotImplementedError(
+            f"The game '{game_name}' does not exist. Available games: {list_available_games()}"
+        )
+    return GAME_REGISTRY[game_name]
+
+@functools.lru_cache(maxsize=None)
+def _resolve_class(module_path: str, class_name: str, base_class: type) -> type:
+    """Imports a registered class once and checks that it has the expected base class."""
+    module = importlib.import_module(module_path)
+    cls = getattr(module, class_name, None)
+    if not (isinstance(cls, type) and issubclass(cls, base_class)):
+        raise ImportError(f"No {base_class.__name__} subclass '{class_name}' found in {module_path}")
+    return cls
 
-def make(game_name: str, mode: int = 0, difficulty: int = 0) -> JaxEnvironment:
+def make(game_name: str, mode: int = 0, difficulty: int = 0, renderer_config: Optional[RendererConfig] = None, reward_funcs: Optional[Sequence[Callable]] = None) -> JaxEnvironment:
     """
     Creates and returns a JaxAtari game environment instance.
     This is the main entry point for creating environments.
@@ -37,70 +89,95 @@ def make(game_name: str, mode: int = 0, difficulty: int = 0) -> JaxEnvironment:
         game_name: Name of the game to load (e.g., "pong").
         mode: Game mode.
         difficulty: Game difficulty.
+        renderer_config: Optional renderer config. Its channels and downscale are applied when rendering,
+            e.g. RendererConfig(channels=1, downscale=(84, 84)) renders 84x84x1 frames directly.
+        reward_funcs: Optional reward functions or a RewardRegistry. Their rewards are returned as
+            info["all_rewards"] by step.
 
     Returns:
         An instance of the specified game environment.
     """
-    if game_name not in GAME_MODULES:
-        raise NotImplementedError(
-            f"The game '{game_name}' does not exist. Available games: {list_available_games()}"
-        )
-    
+    spec = _get_spec(game_name)
+
     try:
-        # 1. Dynamically load the module
-        module = importlib.import_module(GAME_MODULES[game_name])
-        
-        # 2. Find the correct environment class within the module
-        env_class = None
-        for _, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and issubclass(obj, JaxEnvironment) and obj is not JaxEnvironment:
-                env_class = obj
-                break # Found it
-        
-        if env_class is None:
-            raise ImportError(f"No JaxEnvironment subclass found in {GAME_MODULES[game_name]}")
-        
-        # 3. Instantiate the class, passing along the arguments, and return it
+        env_class = _resolve_class(spec.module, spec.env_class, JaxEnvironment)
+
         # TODO: none of our environments use mode / difficulty yet, but we might want to add it here and in the single envs
-        return env_class()
+        env = env_class() if reward_funcs is None else env_class(reward_funcs=reward_funcs)
 
     except (ImportError, AttributeError) as e:
         raise ImportError(f"Failed to load game '{game_name}': {e}") from e
 
-def make_renderer(game_name: str) -> JAXGameRenderer:
+    if renderer_config is not None:
+        # image_space follows the frame shape of the renderer config
+        env.renderer = make_renderer(game_name, renderer_config)
+    return env
+
+
+def make_renderer(game_name: str, config: Optional[RendererConfig] = None) -> JAXGameRenderer:
     """
     Creates and returns a JaxAtari game environment renderer.
+    Renderers are stateless, so one instance per game and config is built and reused by later calls.
 
     Args:
         game_name: Name of the game to load (e.g., "pong").
+        config: Optional renderer config. Its channels and downscale are used, the game dimensions
+            always come from the game itself.
 
     Returns:
         An instance of the specified game environment renderer.
     """
-    if game_name not in GAME_MODULES:
-        raise NotImplementedError(
-            f"The game '{game_name}' does not exist. Available games: {list_available_games()}"
-        )
-    
+    spec = _get_spec(game_name)
+
+    cache_key = (game_name, config)
+    if cache_key in _RENDERER_CACHE:
+        return _RENDERER_CACHE[cache_key]
+
     try:
-        # 1. Dynamically load the module
-        module = importlib.import_module(GAME_MODULES[game_name])
-        
-        # 2. Find the correct environment class within the module
-        renderer_class = None
-        for _, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and issubclass(obj, JAXGameRenderer) and obj is not JAXGameRenderer:
-                renderer_class = obj
-                break # Found it
-
-        if renderer_class is None:
-            raise ImportError(f"No AXGameRenderer subclass found in {GAME_MODULES[game_name]}")
-
-        # 3. Instantiate the class, passing along the arguments, and return it
-        return renderer_class()
+        renderer_class = _resolve_class(spec.module, spec.renderer_class, JAXGameRenderer)
+        renderer = renderer_class() if config is None else renderer_class(config=config)
     except (ImportError, AttributeError) as e:
         raise ImportError(f"Failed to load renderer for '{game_name}': {e}") from e
-    
+
+    _RENDERER_CACHE[cache_key] = renderer
+    return renderer
+
+def make_vec(
+    game_name: str,
+    num_envs: int,
+    wrappers: Sequence[Callable] = (AtariWrapper,),
+    mode: int = 0,
+    difficulty: int = 0,
+    renderer_config: Optional[RendererConfig] = None,
+    donate_state: bool = True,
+    shard: bool = False,
+    reward_funcs: Optional[Sequence[Callable]] = None,
+) -> VecEnvWrapper:
+    """
+    Creates a batched JaxAtari environment running num_envs copies of a game.
+    Only one env and wrapper stack is built, reset and step are vmapped over the env batch.
+
+    Args:
+        game_name: Name of the game to load (e.g., "pong").
+        num_envs: Number of envs in the batch.
+        wrappers: Wrappers (or any callables taking and returning an env) applied in order to the raw env.
+            Must include an AtariWrapper, which resets episodes automatically when they end.
+        mode: Game mode.
+        difficulty: Game difficulty.
+        renderer_config: Optional renderer config, see make.
+        donate_state: If True, step donates the incoming states, which must not be used afterwards.
+        shard: If True, the env batch is split across all local devices. num_envs must be divisible by their number.
+            On CPU, more devices can be created with XLA_FLAGS=--xla_force_host_platform_device_count=N.
+        reward_funcs: Optional reward functions or a RewardRegistry, see make.
+
+    Returns:
+        A VecEnvWrapper with batched reset(keys) and step(states, actions).
+    """
+    env = make(game_name, mode, difficulty, renderer_config=renderer_config, reward_funcs=reward_funcs)
+    for wrapper in wrappers:
+        env = wrapper(env)
+    return VecEnvWrapper(env, num_envs, donate_state=donate_state, shard=shard)
+
 def modify(env: JaxEnvironment, game_name: str, mod_name: str) -> JaxatariWrapper:
     """
     Modifies a JaxAtari game environment with a specified modification using wrappers.
@@ -110,24 +187,180 @@ def modify(env: JaxEnvironment, game_name: str, mod_name: str) -> JaxatariWrappe
         mod_name: Name of the modification to apply (e.g., "lazy_enemy").
 
     Returns:
-        An wrapped instance of the specified game environment with the modification applied. 
+        An wrapped instance of the specified game environment with the modification applied.
     """
     try:
-        # 1. Dynamically load the module
-        module = importlib.import_module(MOD_MODULES[game_name])
-        
-        # 2. Find the correct environment class within the module
-        wrapper_class = None
-        for _, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and issubclass(obj, JaxatariWrapper) and obj.__name__.lower() == mod_name.lower():
-                wrapper_class = obj
-                break # Found it
-
-        if wrapper_class is None:
-            raise ImportError(f"No mod {mod_name} subclass found in {MOD_MODULES[game_name]}")
-        
-        # 3. Instantiate the class, passing along the arguments, and return it
+        spec = GAME_REGISTRY[game_name]
+        if spec.mod_module is None:
+            raise ImportError(f"No mods registered for game '{game_name}'")
+
+        # Mod names are matched case-insensitively
+        mod_classes = {name.lower(): name for name in spec.mod_classes}
+        if mod_name.lower() not in mod_classes:
+            raise ImportError(f"No mod {mod_name} subclass found in {spec.mod_module}")
+
+        wrapper_class = _resolve_class(spec.mod_module, mod_classes[mod_name.lower()], JaxatariWrapper)
         return wrapper_class(env)
 
     except (ImportError, AttributeError) as e:
-        raise ImportError(f"Failed to load mod '{mod_name}': {e}") from e
\ No newline at end of file
+        raise ImportError(f"Failed to load mod '{mod_name}': {e}") from e
+
+
+class Trajectory(NamedTuple):
+    """Data collected by rollout. Every leaf has the leading shape (num_steps, num_envs)."""
+    obs: Any  # observation the action was chosen on
+    actions: chex.Array
+    rewards: chex.Array
+    dones: chex.Array
+    infos: Any
+    policy_info: Any  # extra outputs of the policy, e.g. log probs and values (None if it returns only actions)
+
+
+class RolloutState(NamedTuple):
+    """Where a rollout stopped. Pass it to the next rollout to continue the episodes."""
+    obs: Any
+    env_state: Any
+    key: chex.PRNGKey
+
+
+def _rollout(env, policy_fn: Callable, num_steps: int, params: Any, rollout_state: RolloutState, buffers: Optional[Trajectory]):
+    """Runs policy and batched env for num_steps in one lax.scan, writing every step into the buffers."""
+    batched_step = jax.vmap(env.step)
+
+    def policy_step(obs, env_state, key):
+        key, policy_key = jax.random.split(key)
+        policy_out = policy_fn(params, obs, policy_key)
+        actions, policy_info = policy_out if isinstance(policy_out, tuple) else (policy_out, None)
+        next_obs, env_state, rewards, dones, infos = batched_step(env_state, actions)
+        return Trajectory(obs, actions, rewards, dones, infos, policy_info), RolloutState(next_obs, env_state, key)
+
+    if buffers is None:
+        step_shapes, _ = jax.eval_shape(policy_step, *rollout_state)
+        buffers = jax.tree.map(lambda x: jnp.zeros((num_steps,) + x.shape, x.dtype), step_shapes)
+
+    def body_fn(carry, t):
+        rollout_state, buffers = carry
+        step_data, rollout_state = policy_step(*rollout_state)
+        buffers = jax.tree.map(
+            lambda buffer, x: jax.lax.dynamic_update_index_in_dim(buffer, x.astype(buffer.dtype), t, axis=0),
+            buffers, step_data
+        )
+        return (rollout_state, buffers), None
+
+    (rollout_state, buffers), _ = jax.lax.scan(body_fn, (rollout_state, buffers), jnp.arange(num_steps))
+    return buffers, rollout_state
+
+_rollout_jit = jax.jit(_rollout, static_argnums=(0, 1, 2))
+_rollout_donated_jit = jax.jit(_rollout, static_argnums=(0, 1, 2), donate_argnums=(4, 5))
+
+def rollout(
+    env,
+    policy_fn: Callable,
+    num_steps: int,
+    num_envs: Optional[int] = None,
+    key: Optional[chex.PRNGKey] = None,
+    params: Any = None,
+    rollout_state: Optional[RolloutState] = None,
+    buffers: Optional[Trajectory] = None,
+    donate: bool = False,
+) -> Tuple[Trajectory, RolloutState]:
+    """
+    Collects num_steps steps of num_envs envs with a single jitted lax.scan over the vmapped env.
+
+    Args:
+        env: A single (wrapped) env, which is vmapped over the envs, or a VecEnvWrapper.
+            Episodes are reset automatically by the AtariWrapper in the stack.
+        policy_fn: policy_fn(params, obs, key) returning the actions for the batch of observations, or a tuple of
+            the actions and extra outputs to record (e.g. log probs and values). Use the same function object
+            across calls, the rollout is compiled once per env, policy_fn and num_steps.
+        num_steps: Number of steps to collect.
+        num_envs: Number of envs. Taken from the env if it is a VecEnvWrapper.
+        key: Key for resetting the envs and the policy. Only needed if no rollout_state is passed.
+        params: Policy parameters, passed through to policy_fn.
+        rollout_state: The state a previous rollout returned, to continue its episodes.
+        buffers: A Trajectory of a previous rollout with the same shapes, its arrays are written over.
+        donate: If True, rollout_state and buffers are donated, so the next rollout writes into their memory.
+            They must not be used after the call.
+
+    Returns:
+        The Trajectory of the rollout and the RolloutState to continue from.
+    """
+    if isinstance(env, VecEnvWrapper):
+        num_envs = env.num_envs
+        env = env._env
+
+    if rollout_state is None:
+        if num_envs is None or key is None:
+            raise ValueError("rollout needs num_envs and key to reset the envs")
+        key, reset_key = jax.random.split(key)
+        obs, env_state = jax.vmap(env.reset)(jax.random.split(reset_key, num_envs))
+        rollout_state = RolloutState(obs, env_state, key)
+
+    rollout_fn = _rollout_donated_jit if donate else _rollout_jit
+    return rollout_fn(env, policy_fn, num_steps, params, rollout_state, buffers)
+
+
+class CompiledEnv(NamedTuple):
+    """reset and step of an env, compiled ahead of time for fixed input shapes."""
+    env: JaxEnvironment
+    batch_size: Optional[int]
+    reset: jax.stages.Compiled
+    step: jax.stages.Compiled
+
+
+def enable_compilation_cache(cache_dir: str, min_compile_time_secs: float = 1.0) -> None:
+    """
+    Enables the persistent JAX compilation cache, so compiled executables are written to cache_dir and
+    loaded from there by later processes instead of being compiled again.
+    Entries are keyed by the lowered program and the compile options, i.e. by game, wrapper configuration,
+    batch shape, device type and JAX version, so one cache_dir can be shared by all workers of a sweep.
+
+    Args:
+        cache_dir: Directory of the cache. Created if it does not exist.
+        min_compile_time_secs: Only executables that took at least this long to compile are cached.
+    """
+    jax.config.update("jax_compilation_cache_dir", cache_dir)
+    jax.config.update("jax_persistent_cache_min_compile_time_secs", min_compile_time_secs)
+    jax.config.update("jax_persistent_cache_min_entry_size_bytes", 0)
+
+
+def compile_env(
+    env: JaxEnvironment,
+    batch_size: Optional[int] = None,
+    donate_state: bool = False,
+    cache_dir: Optional[str] = None,
+) -> CompiledEnv:
+    """
+    Compiles reset and step of an env ahead of time with jit(...).lower(...).compile().
+    Tracing and compilation happen here once, calls to the returned functions only dispatch the executables.
+
+    Args:
+        env: A single (wrapped) env, or a VecEnvWrapper (its num_envs is used as batch_size).
+        batch_size: If given, reset and step are vmapped over a batch of this many envs. reset then takes
+            batch_size keys and step batch_size states and actions.
+        donate_state: If True, the compiled step donates the incoming state, which must not be used afterwards.
+        cache_dir: If given, the persistent compilation cache in cache_dir is enabled first
+            (see enable_compilation_cache), so other processes compiling the same env load the executables.
+
+    Returns:
+        A CompiledEnv. Its reset takes raw uint32 PRNG keys (jax.random.PRNGKey) and step int32 actions.
+    """
+    if cache_dir is not None:
+        enable_compilation_cache(cache_dir)
+    if isinstance(env, VecEnvWrapper):
+        batch_size = env.num_envs
+        env = env._env
+
+    reset_fn, step_fn = env.reset, env.step
+    batch_shape = ()
+    if batch_size is not None:
+        reset_fn, step_fn = jax.vmap(reset_fn), jax.vmap(step_fn)
+        batch_shape = (batch_size,)
+
+    key = jax.ShapeDtypeStruct(batch_shape + (2,), jnp.uint32)
+    action = jax.ShapeDtypeStruct(batch_shape, jnp.int32)
+    _, state = jax.eval_shape(reset_fn, key)
+
+    reset = jax.jit(reset_fn).lower(key).compile()
+    step = jax.jit(step_fn, donate_argnums=(0,) if donate_state else ()).lower(state, action).compile()
+    return CompiledEnv(env, batch_size, reset, step)
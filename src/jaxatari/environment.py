@@ -1,5 +1,7 @@
 from enum import Enum
-from typing import Tuple, Generic, TypeVar
+from functools import partial
+from typing import Any, Tuple, Generic, TypeVar
+import jax
 import jax.numpy as jnp
 import jax.random as jrandom
 from jaxatari.spaces import Space
@@ -10,6 +12,9 @@ EnvState = TypeVar("EnvState")
 EnvInfo = TypeVar("EnvInfo")
 EnvConstants = TypeVar("EnvConstants")
 
+# Names of the outputs of JaxEnvironment.step, in order.
+STEP_OUTPUTS = ("obs", "state", "reward", "done", "info")
+
 class JAXAtariAction:
     """
     "Namespace" for Atari action integer constants.
@@ -79,6 +84,26 @@ class JaxEnvironment(Generic[EnvState, EnvObs, EnvInfo, EnvConstants]):
         """
         raise NotImplementedError("Abstract method")
 
+    @partial(jax.jit, static_argnums=(0, 3))
+    def lean_step(self, state: EnvState, action, outputs: Tuple[str, ...] = ("state", "reward", "done")) -> Tuple:
+        """
+        Takes a step in the environment, but returns only the selected outputs of step.
+        Outputs that are not selected (e.g. the object-centric observation for pixel-based agents, or info and
+        all_rewards when no reward_funcs are configured) are dead code in the compiled step and XLA drops them.
+        Args:
+            state: The current environment state.
+            action: The action to take.
+            outputs: Static tuple of names from STEP_OUTPUTS ("obs", "state", "reward", "done", "info").
+
+        Returns: The selected outputs of step, in the order given by outputs.
+
+        """
+        unknown = set(outputs) - set(STEP_OUTPUTS)
+        if unknown:
+            raise ValueError(f"Unknown step outputs {sorted(unknown)}, expected names from {STEP_OUTPUTS}")
+        results = dict(zip(STEP_OUTPUTS, self.step(state, action)))
+        return tuple(results[name] for name in outputs)
+
     def render(self, state: EnvState) -> Tuple[jnp.ndarray]:
         """
         Renders the environment state to a single image.
@@ -153,6 +178,31 @@ class JaxEnvironment(Generic[EnvState, EnvObs, EnvInfo, EnvConstants]):
         """
         raise NotImplementedError("Abstract method")
 
+    def compact_state(self, state: EnvState) -> Any:
+        """
+        Converts the environment state to a compact representation for storage, e.g. of large batches of
+        resident envs. Games override this to store fields in the smallest dtype that holds their values,
+        usually with a module level COMPACT_STATE_LAYOUT for jaxatari.compact.compact_fields, whose ranges
+        are checked with jaxatari.compact.fits_layout.
+        Args:
+            state: The environment state (may be batched).
+
+        Returns: The compact state. expand_state converts it back exactly.
+
+        """
+        return state
+
+    def expand_state(self, compact_state: Any) -> EnvState:
+        """
+        Converts a state produced by compact_state back to the environment state that step expects.
+        Args:
+            compact_state: The compact state (may be batched).
+
+        Returns: The environment state.
+
+        """
+        return compact_state
+
     def _get_done(self, state: EnvState) -> bool:
         """
         Determines if the environment state is a terminal state
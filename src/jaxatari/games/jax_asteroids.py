@@ -13,6 +13,9 @@ import jaxatari.spaces as spaces
 from jaxatari.renderers import JAXGameRenderer
 from jaxatari.rendering import jax_rendering_utils as render_utils
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rewards import RewardRegistry
+from jaxatari.physics import aabb_overlap, first_hit, masked_scatter, pairwise_overlaps
+from jaxatari.compact import Columns, compact_fields, expand_fields
 
 class AsteroidsConstants(NamedTuple):
     # Constants for game environment
@@ -184,6 +187,29 @@ class AsteroidsState(NamedTuple):
     step_counter: chex.Array
     rng_key: chex.PRNGKey
 
+# Storage layout of AsteroidsState for compact_state (see jaxatari.compact), with the range each field can take.
+# Player positions and speeds are already fixed point integers (256 subpixels per pixel, halved).
+COMPACT_STATE_LAYOUT = AsteroidsState(
+    player_x=jnp.int16,                         # [MIN_PLAYER_X, MAX_PLAYER_X], MAX_PLAYER_X = 20479
+    player_y=jnp.int16,                         # [MIN_PLAYER_Y, MAX_PLAYER_Y], MAX_PLAYER_Y = 24959
+    player_speed_x=jnp.int16,                   # |speed| < MAX_PLAYER_SPEED = 16383
+    player_speed_y=jnp.int16,
+    player_rotation=jnp.uint8,                  # [0, 15]
+    # [x, y (screen pixels), speed_x, speed_y (MISSILE_SPEED_PER_ROTATION), rotation, lifespan (<= MISSILE_LIFESPAN)]
+    missile_states=Columns((jnp.int16, jnp.int16, jnp.int8, jnp.int8, jnp.uint8, jnp.uint8)),
+    # [x, y (screen pixels, a few pixels off screen while wrapping), rotation (< 4), size (< 5), color (< 8)]
+    asteroid_states=Columns((jnp.int16, jnp.int16, jnp.uint8, jnp.uint8, jnp.uint8)),
+    missile_rdy=jnp.bool_,
+    # [asteroid index or -1, size, animation color]
+    colliding_asteroids=Columns((jnp.int8, jnp.uint8, jnp.uint8)),
+    score=jnp.int32,
+    lives=jnp.int8,                             # [0, MAX_LIVES]
+    respawn_timer=jnp.uint8,                    # [0, RESPAWN_DELAY + H_SPACE_DELAY]
+    side_step_counter=jnp.uint8,                # [0, 115]
+    step_counter=jnp.int32,
+    rng_key=jnp.uint32,
+)
+
 class EntityPosition(NamedTuple):
     x: jnp.ndarray
     y: jnp.ndarray
@@ -209,9 +235,8 @@ class JaxAsteroids(JaxEnvironment[AsteroidsState, AsteroidsObservation, Asteroid
     def __init__(self, consts: AsteroidsConstants = None, reward_funcs: list[callable]=None):
         consts = consts or AsteroidsConstants()
         super().__init__(consts)
-        self.frame_stack_size = 4
         if reward_funcs is not None:
-            reward_funcs = tuple(reward_funcs)
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
         self.action_set = jnp.array([
             Action.NOOP,
@@ -507,221 +532,112 @@ class JaxAsteroids(JaxEnvironment[AsteroidsState, AsteroidsObservation, Asteroid
 
         return asteroid_states, side_step_counter, rng_key
 
-    @partial(jax.jit, static_argnums=(0,))
-    def entities_collide(
-        self, 
-        e1_x: chex.Array,
-        e1_y: chex.Array,
-        e1_w: chex.Array,
-        e1_h: chex.Array,
-        e2_x: chex.Array,
-        e2_y: chex.Array,
-        e2_w: chex.Array,
-        e2_h: chex.Array,
-    ) -> chex.Array:
+    def asteroid_dims(self, sizes: chex.Array) -> Tuple[chex.Array, chex.Array]:
         """
-        Checks whether two entities are colliding
+        Returns the widths and heights of asteroids with the given size values (0 for inactive asteroids)
         """
-        overlap_start_x = jnp.maximum(e1_x, e2_x)
-        overlap_end_x = jnp.minimum(e1_x + e1_w, e2_x + e2_w)
-        overlap_start_y = jnp.maximum(e1_y, e2_y)
-        overlap_end_y = jnp.minimum(e1_y + e1_h, e2_y + e2_h)
-
-        return jnp.logical_and(overlap_start_x < overlap_end_x, overlap_start_y < overlap_end_y)
+        dims = jnp.array([
+            (0, 0),
+            self.consts.ASTEROID_SIZE_L,
+            self.consts.ASTEROID_SIZE_L,
+            self.consts.ASTEROID_SIZE_M,
+            self.consts.ASTEROID_SIZE_S
+        ])[sizes]
+        return dims[..., 0], dims[..., 1]
 
     @partial(jax.jit, static_argnums=(0,))
-    def player_hit(self, player_x, player_y, player_active, asteroid_states) -> int:
+    def colliders_hit(self, collider_x, collider_y, collider_w, collider_h, collider_active, asteroid_states) -> chex.Array:
         """
-        Returns index of asteroid hit by player (or -1 if no asteroid is hit)
+        Returns for each collider (e.g. player and missiles) the index of the asteroid it hits (or -1 if no asteroid is hit).
+        All colliders are checked against all asteroids at once. If a collider overlaps several asteroids,
+        the one with the highest index is hit.
         """
-        @jax.jit
-        def get_hit_asteroid(i, index):
-            asteroid_dims = jax.lax.switch(
-                asteroid_states[i][3],
-                [
-                    lambda: (0, 0),
-                    lambda: self.consts.ASTEROID_SIZE_L,
-                    lambda: self.consts.ASTEROID_SIZE_L,
-                    lambda: self.consts.ASTEROID_SIZE_M,
-                    lambda: self.consts.ASTEROID_SIZE_S
-                ]
-            )
-            # return i if collision with asteroids at index i occurred, old index otherwise
-            return jax.lax.cond(
-                self.entities_collide(player_x, player_y,
-                                      self.consts.PLAYER_SIZE[0], self.consts.PLAYER_SIZE[1],
-                                      asteroid_states[i][0], asteroid_states[i][1],
-                                      asteroid_dims[0], asteroid_dims[1]),
-                lambda: i,
-                lambda: index
-            )
-
-        return jax.lax.cond(
-            player_active,
-            lambda: jax.lax.fori_loop(0, self.consts.MAX_NUMBER_OF_ASTEROIDS, get_hit_asteroid, -1),
-            lambda: -1
+        asteroid_w, asteroid_h = self.asteroid_dims(asteroid_states[:, 3])
+        overlaps = pairwise_overlaps(
+            jnp.stack([collider_x, collider_y], axis=1), jnp.stack([collider_w, collider_h], axis=1),
+            asteroid_states[:, :2], jnp.stack([asteroid_w, asteroid_h], axis=1),
+            active1=collider_active
         )
+        return first_hit(overlaps, last=True)
 
     @partial(jax.jit, static_argnums=(0,))
-    def missile_hit(
-        self,
-        missile_1_x,
-        missile_1_y,
-        missile_1_active,
-        missile_2_x,
-        missile_2_y,
-        missile_2_active,
-        asteroid_states
-    ):
+    def resolve_collisions(self, asteroid_states, hits, side_step, score, rng_key: jax.random.PRNGKey):
         """
-        Returns indices of asteroids hit by missiles (or -1 if no asteroid is hit)
+        Destroys the hit asteroids in the order of the colliders and writes all resulting asteroids with one scatter.
+        A destroyed large or medium asteroid shrinks in place, a destroyed large asteroid adds a second
+        medium asteroid, and a destroyed small asteroid becomes inactive.
+        The outcome equals destroying the asteroids one collider after the other: later colliders see the asteroids
+        written by earlier ones through the pending writes, which only ever cover a handful of rows.
+        Returns the new asteroid states, the colliding asteroids (index, size, animation color) of each collider,
+        the new score and the new rng key.
         """
-        @jax.jit
-        def get_hit_asteroid(missile_x, missile_y, i, index):
-            asteroid_dims = jax.lax.switch(
-                asteroid_states[i][3],
-                [
-                    lambda: (0, 0),
-                    lambda: self.consts.ASTEROID_SIZE_L,
-                    lambda: self.consts.ASTEROID_SIZE_L,
-                    lambda: self.consts.ASTEROID_SIZE_M,
-                    lambda: self.consts.ASTEROID_SIZE_S
-                ]
-            )
-            # return i if collision with asteroids at index i occurred, old index otherwise
-            return jax.lax.cond(
-                self.entities_collide(missile_x, missile_y,
-                                      self.consts.MISSILE_SIZE[0], self.consts.MISSILE_SIZE[1],
-                                      asteroid_states[i][0], asteroid_states[i][1],
-                                      asteroid_dims[0], asteroid_dims[1]),
-                lambda: i,
-                lambda: index)
-
-        missile_1_hit = jax.lax.cond(
-            missile_1_active,
-            lambda: jax.lax.fori_loop(0, asteroid_states.shape[0],
-                        lambda i, index: get_hit_asteroid(missile_1_x, missile_1_y, i, index), -1),
-            lambda: -1
-        )
-        missile_2_hit = jax.lax.cond(
-            missile_2_active,
-            lambda: jax.lax.fori_loop(0, asteroid_states.shape[0],
-                        lambda i, index: get_hit_asteroid(missile_2_x, missile_2_y, i, index), -1),
-            lambda: -1
-        )
-
-        return missile_1_hit, missile_2_hit
-
-    @partial(jax.jit, static_argnums=(0,))
-    def destroy_asteroid(self, asteroid_states, index, side_step, rng_key: jax.random.PRNGKey):
-        """
-        Removes destroyed asteroids from asteroid_states and returns generated score
-        """
-        asteroid_count = jnp.count_nonzero(asteroid_states, 0)[3]
-
-        # get size of new asteroid(s)
-        new_asteroid_size = jax.lax.switch(
-            asteroid_states[index][3],
-            (
-                lambda: self.consts.INACTIVE,
-                lambda: self.consts.MEDIUM,
-                lambda: self.consts.MEDIUM,
-                lambda: self.consts.SMALL,
-                lambda: self.consts.INACTIVE
-            )
-        )
-
-        # get score according to size of destroyed asteroid
-        score = jax.lax.switch(
-            asteroid_states[index][3],
-            (
-                lambda: 0,
-                lambda: 20,
-                lambda: 20,
-                lambda: 50,
-                lambda: 100
-            )
-        )
-
-        rng_key, subkey = jax.random.split(rng_key)
-        flip_x = jax.random.randint(subkey, [], 0, 4)
-
-        rng_key, subkey = jax.random.split(rng_key)
-
-        # get new asteroid direction
-        asteroid_rot = jax.lax.cond( # flip direction with 50% chance
-            flip_x % 2 == 1,
-            lambda: jnp.bitwise_xor(asteroid_states[index][2], 1),
-            lambda: asteroid_states[index][2]
-        )
-        x_direction = jax.lax.switch(
-                asteroid_rot,
-                [
-                    lambda: self.consts.ASTEROID_SPEED[0],
-                    lambda: -self.consts.ASTEROID_SPEED[0],
-                    lambda: -self.consts.ASTEROID_SPEED[0],
-                    lambda: self.consts.ASTEROID_SPEED[0]
-                ]
-            )
-
-        # get new asteroid x-position
-        asteroid_x = jax.lax.cond(
-            side_step,
-            lambda: asteroid_states[index][0] + x_direction,
-            lambda: asteroid_states[index][0] # same x postition
-        )
-
-        # set new asteroid
-        new_asteroid_states = asteroid_states.at[index].set(jnp.array([
-            asteroid_x,
-            asteroid_states[index][1], # same y position
-            asteroid_rot,
-            new_asteroid_size,
-            jax.random.randint(rng_key, [], 0, 8)])) # random color
-
-        # add second new medium asteroid for destruction of large asteroids
-        rng_key, subkey = jax.random.split(rng_key)
-
-        # get additional asteroid direction
-        asteroid_rot = jax.lax.cond( # flip direction with 50% chance
-            flip_x >= 2,
-            lambda: jnp.bitwise_xor(asteroid_states[index][2], 1),
-            lambda: asteroid_states[index][2]
-        )
-        x_direction = jax.lax.switch(
-                asteroid_rot,
-                [
-                    lambda: self.consts.ASTEROID_SPEED[0],
-                    lambda: -self.consts.ASTEROID_SPEED[0],
-                    lambda: -self.consts.ASTEROID_SPEED[0],
-                    lambda: self.consts.ASTEROID_SPEED[0]
-                ]
-            )
-
-        # get additional asteroid x-position
-        asteroid_x = jax.lax.cond(
-            side_step,
-            lambda: asteroid_states[index][0] + x_direction,
-            lambda: asteroid_states[index][0] # same x position
-        )
-
-        # set additional asteroid if applicable
-        new_asteroid_states = jax.lax.cond(
-            jnp.logical_and(
-                jnp.logical_and(
-                    asteroid_count < self.consts.MAX_NUMBER_OF_ASTEROIDS,
-                    new_asteroid_size != self.consts.SMALL),
-                new_asteroid_size != self.consts.INACTIVE),
-            lambda: new_asteroid_states.at[asteroid_count].set(jnp.array([
-                asteroid_x,
-                asteroid_states[index][1] + 20,  # y position for second asteroid is increased by 20
-                asteroid_rot,
-                new_asteroid_size,
-                jax.random.randint(rng_key, [], 0, 8)])), # random color
-            lambda: new_asteroid_states,
-        )
-
-        return new_asteroid_states, score, rng_key
+        num_asteroids = asteroid_states.shape[0]
+        new_sizes = jnp.array([self.consts.INACTIVE, self.consts.MEDIUM, self.consts.MEDIUM, self.consts.SMALL, self.consts.INACTIVE])
+        scores = jnp.array([0, 20, 20, 50, 100])
+        x_directions = jnp.array([self.consts.ASTEROID_SPEED[0], -self.consts.ASTEROID_SPEED[0], -self.consts.ASTEROID_SPEED[0], self.consts.ASTEROID_SPEED[0]])
+
+        # Pending writes as (index, row); an index of num_asteroids marks a write that does not happen
+        write_indices, write_rows = [], []
+
+        def row_at(index):
+            row = asteroid_states[index]
+            for write_index, write_row in zip(write_indices, write_rows):
+                row = jnp.where(write_index == index, write_row, row)
+            return row
+
+        def write(index, row):
+            nonlocal asteroid_count
+            old_row = row_at(jnp.minimum(index, num_asteroids - 1))
+            valid = index < num_asteroids
+            asteroid_count = asteroid_count + jnp.where(valid, (row[3] != 0).astype(jnp.int32) - (old_row[3] != 0), 0)
+            write_indices.append(index)
+            write_rows.append(row)
+
+        def split_asteroid(row, flip):
+            rotation = jnp.where(flip, jnp.bitwise_xor(row[2], 1), row[2])
+            x = jnp.where(side_step, row[0] + x_directions[rotation], row[0])
+            return rotation, x
+
+        # The random numbers only depend on which colliders hit, so they are drawn up front.
+        # The key is advanced once per collider, and three more times on a hit.
+        def draw_random(key, hit):
+            key, sub_key = jax.random.split(key)
+            animation_color = jax.random.randint(sub_key, [], 0, 2)
+            destroy_key, sub_key = jax.random.split(key)
+            flip_x = jax.random.randint(sub_key, [], 0, 4)
+            destroy_key, _ = jax.random.split(destroy_key)
+            color_1 = jax.random.randint(destroy_key, [], 0, 8)
+            destroy_key, _ = jax.random.split(destroy_key)
+            color_2 = jax.random.randint(destroy_key, [], 0, 8)
+            return jnp.where(hit, destroy_key, key), (animation_color, flip_x, color_1, color_2)
+
+        rng_key, (animation_colors, flips_x, colors_1, colors_2) = jax.lax.scan(draw_random, rng_key, hits >= 0)
+
+        asteroid_count = jnp.count_nonzero(asteroid_states[:, 3])
+        colliding_asteroids = []
+        for i in range(hits.shape[0]):
+            index = hits[i]
+            hit = index >= 0
+            flip_x, color_1, color_2 = flips_x[i], colors_1[i], colors_2[i]
+            row = row_at(index % num_asteroids)
+            colliding_asteroids.append(jnp.array([index, row[3], animation_colors[i]]))
+
+            new_size = new_sizes[row[3]]
+            score = score + jnp.where(hit, scores[row[3]], 0)
+            slot = asteroid_count
+
+            # the destroyed asteroid is replaced by the first new one
+            rotation, x = split_asteroid(row, flip_x % 2 == 1)
+            write(jnp.where(hit, index, num_asteroids), jnp.array([x, row[1], rotation, new_size, color_1]))
+
+            # large asteroids add a second medium asteroid, its y position is increased by 20
+            rotation, x = split_asteroid(row, flip_x >= 2)
+            add_second = hit & (slot < num_asteroids) & (new_size != self.consts.SMALL) & (new_size != self.consts.INACTIVE)
+            write(jnp.where(add_second, slot, num_asteroids), jnp.array([x, row[1] + 20, rotation, new_size, color_2]))
+
+        asteroid_states = masked_scatter(asteroid_states, jnp.stack(write_indices), jnp.stack(write_rows))
+
+        return asteroid_states, jnp.stack(colliding_asteroids), score, rng_key
 
     @partial(jax.jit, static_argnums=(0,))
     def new_stage(self, player_x, player_y, rng_key: jax.random.PRNGKey):
@@ -787,33 +703,14 @@ class JaxAsteroids(JaxEnvironment[AsteroidsState, AsteroidsObservation, Asteroid
         """
         Returns True if no asteroid is within the safe zone around the player
         """
-        def get_index_safe(i, safe):
-            asteroid_dims = jax.lax.switch(
-                asteroid_states[i][3],
-                [
-                    lambda: (0, 0),
-                    lambda: self.consts.ASTEROID_SIZE_L,
-                    lambda: self.consts.ASTEROID_SIZE_L,
-                    lambda: self.consts.ASTEROID_SIZE_M,
-                    lambda: self.consts.ASTEROID_SIZE_S
-                ]
-            )
-            # returns True if player is safe from asteroid i and was safe previously
-            return jnp.logical_and(safe,
-                jnp.logical_not(
-                    self.entities_collide(
-                        self.to_screen_pos(player_x) - self.consts.SAFE_ZONE[0],
-                        self.to_screen_pos(player_y) - self.consts.SAFE_ZONE[1],
-                        self.consts.PLAYER_SIZE[0] + 2*self.consts.SAFE_ZONE[0],
-                        self.consts.PLAYER_SIZE[1] + 2*self.consts.SAFE_ZONE[1],
-                        asteroid_states[i][0], asteroid_states[i][1], asteroid_dims[0], asteroid_dims[1])))
-
-        return jax.lax.fori_loop(
-            0,
-            self.consts.MAX_NUMBER_OF_ASTEROIDS,
-            get_index_safe,
-            True
-        )
+        asteroid_w, asteroid_h = self.asteroid_dims(asteroid_states[:, 3])
+        in_safe_zone = aabb_overlap(
+            self.to_screen_pos(player_x) - self.consts.SAFE_ZONE[0],
+            self.to_screen_pos(player_y) - self.consts.SAFE_ZONE[1],
+            self.consts.PLAYER_SIZE[0] + 2*self.consts.SAFE_ZONE[0],
+            self.consts.PLAYER_SIZE[1] + 2*self.consts.SAFE_ZONE[1],
+            asteroid_states[:, 0], asteroid_states[:, 1], asteroid_w, asteroid_h)
+        return jnp.logical_not(jnp.any(in_safe_zone))
 
 
     def reset(self, key: jax.random.PRNGKey = jax.random.PRNGKey(1234)) -> Tuple[AsteroidsObservation, AsteroidsState]:
@@ -871,41 +768,21 @@ class JaxAsteroids(JaxEnvironment[AsteroidsState, AsteroidsObservation, Asteroid
         # update asteroids
         asteroid_states, side_step_counter, rng_key = self.asteroids_step(state)
 
-        # get all colliding asteroids
-        p_hit = self.player_hit(self.to_screen_pos(player_x), self.to_screen_pos(player_y), respawn_timer==0, asteroid_states)
-        m_hit = self.missile_hit(missile_states[0][0], missile_states[0][1],
-                                 missile_states[0][5] > 0, missile_states[1][0],
-                                 missile_states[1][1], missile_states[1][5] > 0,
-                                 asteroid_states)
+        # get the asteroids hit by the player and both missiles at once
+        hits = self.colliders_hit(
+            jnp.array([self.to_screen_pos(player_x), missile_states[0][0], missile_states[1][0]]),
+            jnp.array([self.to_screen_pos(player_y), missile_states[0][1], missile_states[1][1]]),
+            jnp.array([self.consts.PLAYER_SIZE[0], self.consts.MISSILE_SIZE[0], self.consts.MISSILE_SIZE[0]]),
+            jnp.array([self.consts.PLAYER_SIZE[1], self.consts.MISSILE_SIZE[1], self.consts.MISSILE_SIZE[1]]),
+            jnp.array([respawn_timer == 0, missile_states[0][5] > 0, missile_states[1][5] > 0]),
+            asteroid_states
+        )
+        p_hit, m_hit = hits[0], hits[1:]
         side_step = side_step_counter > state.side_step_counter
 
-        # update asteroids and score after collisions
-        def update_collisions(i, vals):
-            index = jax.lax.switch(
-                i,
-                [
-                    lambda: p_hit,
-                    lambda: m_hit[0],
-                    lambda: m_hit[1],
-                ]
-            )
-
-            # add asteroid to colliding asteroids
-            new_rng_key, sub_key = jax.random.split(vals[3])
-            colliding_asteroid = jnp.array([index, vals[0][index][3], jax.random.randint(sub_key, [], 0, 2)])
-            new_colliding_asteroids = vals[1].at[i].set(colliding_asteroid)
-
-            # destroy asteroid on hit. DESTRUCTION!!!!!
-            new_asteroid_states, add_score, new_rng_key = jax.lax.cond(
-                index >= 0,
-                lambda: self.destroy_asteroid(vals[0], index, side_step, new_rng_key),
-                lambda: (vals[0], 0, new_rng_key)
-            )
-            return new_asteroid_states, new_colliding_asteroids, vals[2] + add_score, new_rng_key
-
-        colliding_asteroids = jnp.array([[-1, 0, 0], [-1, 0, 0], [-1, 0, 0]])
-        asteroid_states, colliding_asteroids, score, rng_key = jax.lax.fori_loop(
-            0, 3, update_collisions, (asteroid_states, colliding_asteroids, state.score, rng_key)
+        # update asteroids and score after collisions. DESTRUCTION!!!!!
+        asteroid_states, colliding_asteroids, score, rng_key = self.resolve_collisions(
+            asteroid_states, hits, side_step, state.score, rng_key
         )
 
         # reset score if it exceeds maximum
@@ -1128,12 +1005,12 @@ class JaxAsteroids(JaxEnvironment[AsteroidsState, AsteroidsObservation, Asteroid
 
     def image_space(self) -> spaces.Box:
         """Returns the image space for Asteroids.
-        The image is a RGB image with shape (210, 160, 3).
+        The image is a RGB image with the frame shape of the renderer, (210, 160, 3) by default.
         """
         return spaces.Box(
             low=0,
             high=255,
-            shape=(210, 160, 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8
         )
 
@@ -1149,11 +1026,18 @@ class JaxAsteroids(JaxEnvironment[AsteroidsState, AsteroidsObservation, Asteroid
     def _get_all_rewards(self, previous_state: AsteroidsState, state: AsteroidsState):
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array(
-            [reward_func(previous_state, state) for reward_func in self.reward_funcs]
-        )
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
+    @partial(jax.jit, static_argnums=(0,))
+    def compact_state(self, state: AsteroidsState) -> AsteroidsState:
+        return compact_fields(state, COMPACT_STATE_LAYOUT)
+
+    @partial(jax.jit, static_argnums=(0,))
+    def expand_state(self, compact_state: AsteroidsState) -> AsteroidsState:
+        _, state_like = jax.eval_shape(self.reset, jax.random.PRNGKey(0))
+        return expand_fields(compact_state, COMPACT_STATE_LAYOUT, state_like)
+
     @partial(jax.jit, static_argnums=(0,))
     def _get_done(self, state: AsteroidsState) -> bool:
         return state.lives <= 0
@@ -1161,12 +1045,14 @@ class JaxAsteroids(JaxEnvironment[AsteroidsState, AsteroidsObservation, Asteroid
 class AsteroidsRenderer(JAXGameRenderer):
     """JAX-based Asteroids game renderer, optimized with the declarative asset pipeline."""
 
-    def __init__(self, consts: AsteroidsConstants = None):
+    def __init__(self, consts: AsteroidsConstants = None, config: render_utils.RendererConfig = None):
         """Initializes the renderer by loading and processing all assets."""
-        super().__init__()
+        super().__init__(consts, config)
         self.consts = consts or AsteroidsConstants()
         self.config = render_utils.RendererConfig(
-            game_dimensions=(self.consts.HEIGHT, self.consts.WIDTH)
+            game_dimensions=(self.consts.HEIGHT, self.consts.WIDTH),
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
         self.jr = render_utils.JaxRenderingUtils(self.config)
 
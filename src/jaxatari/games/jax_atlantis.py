@@ -18,6 +18,7 @@ from jaxatari.environment import (
     JAXAtariAction as Action,
     EnvObs,
 )
+from jaxatari.rewards import RewardRegistry
 import jaxatari.spaces as spaces
 
 
@@ -210,8 +211,7 @@ class JaxAtlantis(
     Attributes:
         config (GameConfig): Current game configuration
         frameskip (int): Frame skipping factor
-        frame_stack_size (int): Number of frames to stack for observations
-        reward_funcs (tuple): Tuple of reward functions for multi-objective RL
+        reward_funcs (RewardRegistry): Reward functions for multi-objective RL
     """
 
     def __init__(
@@ -224,13 +224,12 @@ class JaxAtlantis(
         # Use provided config or create default configuration
         self.config = config or GameConfig()
         self.frameskip = frameskip
-        self.frame_stack_size = 4  # Standard for Atari environments
 
-        # Convert reward functions to tuple for JAX compatibility
+        # Stack reward functions into a registry evaluated as one reward vector
         if reward_funcs is not None:
-            reward_funcs = tuple(reward_funcs)
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
-        self.renderer = AtlantisRenderer(config=self.config)
+        self.renderer = AtlantisRenderer(self.config)
         self.action_set = [
             Action.NOOP,
             Action.FIRE,
@@ -1335,12 +1334,7 @@ class JaxAtlantis(
     ):
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array(
-            [
-                reward_func(previous_state, state)
-                for reward_func in self.reward_funcs
-            ]
-        )
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
     def _get_reward(
@@ -1387,25 +1381,25 @@ class JaxAtlantis(
         return self.renderer.render(state)
 
     def image_space(self) -> spaces.Box:
-        cfg = self.config
         return spaces.Box(
             low=0,
             high=255,
-            shape=(cfg.screen_height, cfg.screen_width, 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8,
         )
 
 
 
 class AtlantisRenderer(JAXGameRenderer):
-    def __init__(self, config: GameConfig | None = None):
-        super().__init__()
-        self.config = config or GameConfig()
-        self.jr = render_utils.JaxRenderingUtils(
-            render_utils.RendererConfig(
-                game_dimensions=(self.config.screen_height, self.config.screen_width)
-            )
+    def __init__(self, consts: GameConfig | None = None, config: render_utils.RendererConfig | None = None):
+        super().__init__(consts, config)
+        self.consts = consts or GameConfig()
+        self.config = render_utils.RendererConfig(
+            game_dimensions=(self.consts.screen_height, self.consts.screen_width),
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
+        self.jr = render_utils.JaxRenderingUtils(self.config)
 
         asset_config = self._get_asset_config()
         sprite_path = f"{os.path.dirname(os.path.abspath(__file__))}/sprites/atlantis"
@@ -1466,8 +1460,8 @@ class AtlantisRenderer(JAXGameRenderer):
             color = jnp.array(list(rgb) + [255], dtype=jnp.uint8)
             return jnp.tile(color, (height, width, 1))
         procedural_assets = [
-            {'name': 'bullet', 'data': _solid_sprite_data(self.config.bullet_width, self.config.bullet_height, (255, 255, 255))},
-            {'name': 'beam_light_blue', 'data': _solid_sprite_data(3, self.config.height_upper_beam, (90, 204, 165))},
+            {'name': 'bullet', 'data': _solid_sprite_data(self.consts.bullet_width, self.consts.bullet_height, (255, 255, 255))},
+            {'name': 'beam_light_blue', 'data': _solid_sprite_data(3, self.consts.height_upper_beam, (90, 204, 165))},
             {'name': 'beam_green', 'data': _solid_sprite_data(3, 50, (61, 151, 60))},
         ]
         for asset in procedural_assets:
@@ -1477,7 +1471,7 @@ class AtlantisRenderer(JAXGameRenderer):
 
     @partial(jax.jit, static_argnums=(0,))
     def render(self, state: AtlantisState) -> chex.Array:
-        cfg = self.config
+        cfg = self.consts
         raster = self.jr.create_object_raster(self.BACKGROUND)
 
         # --- Render Cannons ---
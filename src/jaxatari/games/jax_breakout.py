@@ -8,6 +8,7 @@ import chex
 import pygame
 
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rewards import RewardRegistry
 import jaxatari.spaces as spaces
 from jaxatari.renderers import JAXGameRenderer
 import jaxatari.rendering.jax_rendering_utils as render_utils
@@ -113,7 +114,7 @@ class JaxBreakout(JaxEnvironment[BreakoutState, BreakoutObservation, BreakoutInf
         super().__init__(consts)
         self.renderer = BreakoutRenderer(self.consts)
         if reward_funcs is not None:
-            reward_funcs = tuple(reward_funcs) 
+            reward_funcs = RewardRegistry(reward_funcs) 
         self.reward_funcs = reward_funcs 
 
     def get_human_action(self) -> chex.Array:
@@ -742,9 +743,7 @@ class JaxBreakout(JaxEnvironment[BreakoutState, BreakoutObservation, BreakoutInf
     def _get_all_reward(self, previous_state: BreakoutState, state: BreakoutState):
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array(
-            [reward_func(previous_state, state) for reward_func in self.reward_funcs]
-        )
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
     @partial(jax.jit, static_argnums=(0,))
@@ -794,12 +793,12 @@ class JaxBreakout(JaxEnvironment[BreakoutState, BreakoutObservation, BreakoutInf
 
     def image_space(self) -> spaces.Box:
         """Returns the image space for Breakout.
-        The image is a RGB image with shape (210, 160, 3).
+        The image is a RGB image with the frame shape of the renderer, (210, 160, 3) by default.
         """
         return spaces.Box(
             low=0,
             high=255,
-            shape=(210, 160, 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8
         )
 
@@ -821,13 +820,13 @@ class JaxBreakout(JaxEnvironment[BreakoutState, BreakoutObservation, BreakoutInf
 
 
 class BreakoutRenderer(JAXGameRenderer):
-    def __init__(self, consts: BreakoutConstants = None):
-        super().__init__()
+    def __init__(self, consts: BreakoutConstants = None, config: render_utils.RendererConfig = None):
+        super().__init__(consts, config)
         self.consts = consts or BreakoutConstants()
         self.config = render_utils.RendererConfig(
             game_dimensions=(210, 160),
-            channels=3,
-            #downscale=(84, 84)
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
         self.jr = render_utils.JaxRenderingUtils(self.config)
 
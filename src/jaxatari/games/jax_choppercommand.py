@@ -11,11 +11,13 @@ from typing import Tuple, NamedTuple, Callable
 import jax
 import jax.numpy as jnp
 import chex
-import pygame
-import jaxatari.rendering.jax_rendering_utils as jru
+from jaxatari.rendering import jax_rendering_utils as render_utils
 import numpy as np
 import jaxatari.spaces as spaces
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action, EnvState
+from jaxatari.rewards import RewardRegistry
+from jaxatari.physics import aabb_overlap, pairwise_overlaps
+from jaxatari.compact import Columns, FixedPoint, compact_fields, expand_fields
 from jaxatari.renderers import JAXGameRenderer
 import time
 
@@ -189,11 +191,40 @@ class ChopperCommandState(NamedTuple):
     player_collision: chex.Array            # boolean flag indicating whether the player has collided this frame
     step_counter: chex.Array                # total number of game ticks/frames elapsed so far
     pause_timer: chex.Array                 # counter for how many frames remain in the game pause before respawning; 0 = fully dead, respawn initiated, 1 = either no lives left, infinite pause or ->, 1 - DEATH_PAUSE_FRAMES: counting down for the duration of pause, DEATH_PAUSE_FRAMES + 1 = death_pause, DEATH_PAUSE_FRAMES + 2 = no_move_pause
-    obs_stack: chex.ArrayTree               # stacked sequence of past observations (for frame‐stacking in the agent)
     rng_key: chex.PRNGKey                   # current PRNG key for any stochastic operations (e.g., random enemy spawns)
     difficulty: chex.Array                  # states the difficulty which can be either 1 or 2
     enemy_speed: chex.Array                 # states the speed of the enemies e.g. all enemies are killed
 
+# Storage layout of ChopperCommandState for compact_state (see jaxatari.compact), with the range each field can take.
+# World x positions, the player velocity and the enemy missile y positions and speeds (drawn uniformly at random)
+# carry arbitrary fractions and stay float32; the world also scrolls without bound.
+COMPACT_STATE_LAYOUT = ChopperCommandState(
+    player_x=jnp.float32,
+    player_y=jnp.uint8,                         # PLAYER_BOUNDS[1], within [52, 150]
+    player_velocity_x=jnp.float32,
+    local_player_offset=jnp.int8,               # [-60, 60]
+    player_facing_direction=jnp.int8,           # -1 or 1
+    score=jnp.int32,                            # capped at 999999
+    lives=jnp.int8,                             # at most 3 + save_lives
+    save_lives=jnp.int8,                        # score // 10000, at most 99
+    # [x, y (156), direction (-1, 0), death_timer (<= FRAMES_DEATH_ANIMATION_TRUCK)]
+    truck_positions=Columns((jnp.float32, jnp.uint8, jnp.int8, jnp.uint8)),
+    # [x, y (half pixels in [0, 133]), direction (-1, 0, 1), death_timer or lane (< 150)]
+    jet_positions=Columns((jnp.float32, FixedPoint(jnp.int16, 2), jnp.int8, jnp.uint8)),
+    chopper_positions=Columns((jnp.float32, FixedPoint(jnp.int16, 2), jnp.int8, jnp.uint8)),
+    # [x, y, y_speed, did_split flag (0, 42 or 187)]
+    enemy_missile_positions=Columns((jnp.float32, jnp.float32, jnp.float32, jnp.uint8)),
+    # [x, y (< 256), direction (-1, 0, 1), spawn_x]
+    player_missile_positions=Columns((jnp.float32, jnp.uint8, jnp.int8, jnp.float32)),
+    player_missile_cooldown=jnp.uint8,          # [0, MISSILE_COOLDOWN_FRAMES]
+    player_collision=jnp.bool_,
+    step_counter=jnp.int32,
+    pause_timer=jnp.uint8,                      # [0, DEATH_PAUSE_FRAMES + 2]
+    rng_key=jnp.uint32,
+    difficulty=jnp.uint8,                       # 1 or 2
+    enemy_speed=FixedPoint(jnp.uint16, 2),      # grows by 0.5 per cleared wave
+)
+
 class PlayerEntity(NamedTuple):
     x: jnp.ndarray
     y: jnp.ndarray
@@ -223,168 +254,13 @@ class ChopperCommandInfo(NamedTuple):
     step_counter: jnp.ndarray  # Current step count
     all_rewards: jnp.ndarray  # All rewards for the current step
 
-# RENDER CONSTANTS
-def load_sprites():
-    MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
-    # Load sprites - no padding needed for background since it's already full size
-    pl_chopper1 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/player_chopper/1.npy"))
-    pl_chopper2 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/player_chopper/2.npy"))
-    friendly_truck1 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/friendly_truck/1.npy"))
-    friendly_truck2 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/friendly_truck/2.npy"))
-    enemy_jet = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/enemy_jet/normal.npy"))
-    enemy_chopper1 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/enemy_chopper/1.npy"))
-    enemy_chopper2 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/enemy_chopper/2.npy"))
-    enemy_bomb = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/bomb/1.npy"))
-
-    bg_sprites = []
-    for i in range(1, 161):
-        temp = jru.loadFrame(os.path.join(MODULE_DIR, f"sprites/choppercommand/bg/{i}.npy"))
-        bg_sprites.append(temp)
-        bg_sprites[i - 1] = jnp.expand_dims(bg_sprites[i - 1], axis=0)
-
-    pl_missile_sprites_temp = []
-    for i in range(0, 16):
-        temp = jru.loadFrame(os.path.join(MODULE_DIR, f"sprites/choppercommand/player_missiles/missile_{i}.npy"))
-        pl_missile_sprites_temp.append(temp)
-        pl_missile_sprites_temp[i] = jnp.expand_dims(pl_missile_sprites_temp[i], axis=0)
-
-    minimap_mountains_temp = []
-    for i in range(1, 9):
-        temp = jru.loadFrame(os.path.join(MODULE_DIR, f"sprites/choppercommand/minimap/mountains/{i}.npy"))
-        minimap_mountains_temp.append(temp)
-        minimap_mountains_temp[i - 1] = jnp.expand_dims(minimap_mountains_temp[i - 1], axis=0)
-
-    # Pad player helicopter sprites to match each other
-    pl_chopper_sprites, _ = jru.pad_to_match([pl_chopper1, pl_chopper2])
-
-    # Pad friendly truck sprites to match each other
-    friendly_truck_sprites, _ = jru.pad_to_match([friendly_truck1, friendly_truck2])
-
-    # Pad enemy jet sprites to match each other
-    enemy_jet_sprites = [enemy_jet]
-
-    # Pad enemy helicopter sprites to match each other
-    enemy_heli_sprites, _ = jru.pad_to_match([enemy_chopper1, enemy_chopper2])
-
-    # Pad player missile sprites to match each other
-    pl_missile_sprites = pl_missile_sprites_temp
-
-    # Pad enemy missile sprites to match each other
-    enemy_missile_sprites = [enemy_bomb]
-
-    # Background sprite (no padding needed)
-    SPRITE_BG = jnp.concatenate(bg_sprites, axis=0) # jnp.expand_dims(bg1, axis=0)
-
-    # Player helicopter sprites
-    SPRITE_PL_CHOPPER = jnp.concatenate(
-        [
-            jnp.repeat(pl_chopper_sprites[0][None], 3, axis=0),    # PLAYER_ROTOR_SPEED = 3
-            jnp.repeat(pl_chopper_sprites[1][None], 3, axis=0),    # PLAYER_ROTOR_SPEED = 3
-        ]
-    )
-
-    # Friendly truck sprites
-    SPRITE_FRIENDLY_TRUCK = jnp.concatenate(
-        [
-            jnp.repeat(friendly_truck_sprites[0][None], 4, axis=0),
-            jnp.repeat(friendly_truck_sprites[1][None], 4, axis=0),
-        ]
-    )
-
-    # Enemy jet sprite
-    SPRITE_ENEMY_JET = jnp.repeat(enemy_jet_sprites[0][None], 1, axis=0)
-
-    # Enemy helicopter sprites
-    SPRITE_ENEMY_CHOPPER = jnp.concatenate(
-        [
-            jnp.repeat(enemy_heli_sprites[0][None], 4, axis=0),
-            jnp.repeat(enemy_heli_sprites[1][None], 4, axis=0),
-        ]
-    )
-
-    DIGITS = jru.load_and_pad_digits(os.path.join(MODULE_DIR, "./sprites/choppercommand/score/{}.npy"))
-    LIFE_INDICATOR = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/score/chopper.npy"))
-
-    #Death Sprites
-    PLAYER_DEATH_1 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/player_chopper/death_1.npy"))
-    PLAYER_DEATH_2 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/player_chopper/death_2.npy"))
-    PLAYER_DEATH_3 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/player_chopper/death_3.npy"))
-
-    ENEMY_DEATH_1 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/enemy_death/death_1.npy"))
-    ENEMY_DEATH_2 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/enemy_death/death_2.npy"))
-    ENEMY_DEATH_3 = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/enemy_death/death_3.npy"))
-
-    # Player missile sprites
-    SPRITE_PL_MISSILE = jnp.concatenate(pl_missile_sprites, axis=0)
-
-    # Enemy missile sprites
-    SPRITE_ENEMY_MISSILE = jnp.repeat(enemy_missile_sprites[0][None], 1, axis=0)
-
-    #Everything having to do with the minimap
-    MINIMAP_BG = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/minimap/background.npy"))
-    MINIMAP_PLAYER = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/minimap/player.npy"))
-    MINIMAP_TRUCK = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/minimap/truck.npy"))
-    MINIMAP_ACTIVISION_LOGO = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/minimap/activision_logo.npy")) #delete if necessary
-    MINIMAP_ENEMY = jru.loadFrame(os.path.join(MODULE_DIR, "sprites/choppercommand/minimap/enemy.npy"))
-    MINIMAP_MOUNTAINS = jnp.concatenate(minimap_mountains_temp, axis=0)
-
-
-    return (
-        SPRITE_BG,
-        SPRITE_PL_CHOPPER,
-        SPRITE_FRIENDLY_TRUCK,
-        SPRITE_ENEMY_JET,
-        SPRITE_ENEMY_CHOPPER,
-        SPRITE_PL_MISSILE,
-        SPRITE_ENEMY_MISSILE,
-        DIGITS,
-        LIFE_INDICATOR,
-        PLAYER_DEATH_1,
-        PLAYER_DEATH_2,
-        PLAYER_DEATH_3,
-        ENEMY_DEATH_1,
-        ENEMY_DEATH_2,
-        ENEMY_DEATH_3,
-        MINIMAP_BG,
-        MINIMAP_MOUNTAINS,
-        MINIMAP_PLAYER,
-        MINIMAP_TRUCK,
-        MINIMAP_ENEMY,
-        MINIMAP_ACTIVISION_LOGO, #delete if necessary
-    )
-
-# Load sprites once at module level
-(
-    SPRITE_BG,
-    SPRITE_PL_CHOPPER,
-    SPRITE_FRIENDLY_TRUCK,
-    SPRITE_ENEMY_JET,
-    SPRITE_ENEMY_HELI,
-    SPRITE_PL_MISSILE,
-    SPRITE_ENEMY_MISSILE,
-    DIGITS,
-    LIFE_INDICATOR,
-    PLAYER_DEATH_1,
-    PLAYER_DEATH_2,
-    PLAYER_DEATH_3,
-    ENEMY_CHOPPER_DEATH_1,
-    ENEMY_CHOPPER_DEATH_2,
-    ENEMY_CHOPPER_DEATH_3,
-    MINIMAP_BG,
-    MINIMAP_MOUNTAINS,
-    MINIMAP_PLAYER,
-    MINIMAP_TRUCK,
-    MINIMAP_ENEMY,
-    MINIMAP_ACTIVISION_LOGO, #delete if necessary
-) = load_sprites()
-
 class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObservation, ChopperCommandInfo, ChopperCommandConstants]):
     def __init__(self, consts: ChopperCommandConstants = None, frameskip: int = 1, reward_funcs: list[Callable] =None):
         consts = consts or ChopperCommandConstants()
         super().__init__(consts)
         self.frameskip = frameskip
         if reward_funcs is not None:
-            reward_funcs = tuple(reward_funcs)
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
         self.action_set = [
             Action.NOOP,
@@ -406,16 +282,15 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             Action.DOWNRIGHTFIRE,
             Action.DOWNLEFTFIRE
         ]
-        self.frame_stack_size = 4
-        self.obs_size = 5 + self.consts.MAX_JETS * 5 + self.consts.MAX_CHOPPERS * 5 + self.consts.MAX_PLAYER_MISSILES * 5 + 5 + 5
-        self.renderer = ChopperCommandRenderer()
+        self.obs_size = 6 + (self.consts.MAX_TRUCKS + self.consts.MAX_JETS + self.consts.MAX_CHOPPERS + self.consts.MAX_ENEMY_MISSILES) * 5 + 5 + 2
+        self.renderer = ChopperCommandRenderer(self.consts)
 
     def render(self, state: ChopperCommandState) -> jnp.ndarray:
         """Render the game state to a raster image."""
         return self.renderer.render(state)
 
     def flatten_entity_position(self, entity: EntityPosition) -> jnp.ndarray:
-        return jnp.concatenate([entity.x, entity.y, entity.width, entity.height, entity.active])
+        return jnp.concatenate([jnp.array([entity.x]), jnp.array([entity.y]), jnp.array([entity.width]), jnp.array([entity.height]), jnp.array([entity.active])])
 
     def flatten_player_entity(self, entity: PlayerEntity) -> jnp.ndarray:
         return jnp.concatenate([jnp.array([entity.x]), jnp.array([entity.y]), jnp.array([entity.o]), jnp.array([entity.width]), jnp.array([entity.height]), jnp.array([entity.active])])
@@ -440,53 +315,60 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
     #     return jnp.array(self.action_set)
 
     def observation_space(self) -> spaces.Dict:
-        """Returns the observation space for Seaquest.
+        """Returns the observation space for ChopperCommand.
+        x positions are world coordinates, the world scrolls endlessly with the player.
         The observation contains:
         - player: PlayerEntity (x, y, o, width, height, active)
-        - sharks: array of shape (12, 5) with x,y,width,height,active for each shark
-        - submarines: array of shape (12, 5) with x,y,width,height,active for each submarine
-        - divers: array of shape (4, 5) with x,y,width,height,active for each diver
-        - enemy_missiles: array of shape (4, 5) with x,y,width,height,active for each missile
-        - surface_submarine: EntityPosition (x, y, width, height, active)
+        - trucks: array of shape (MAX_TRUCKS, 5) with x,y,width,height,active for each truck
+        - jets: array of shape (MAX_JETS, 5) with x,y,width,height,active for each jet
+        - choppers: array of shape (MAX_CHOPPERS, 5) with x,y,width,height,active for each chopper
+        - enemy_missiles: array of shape (MAX_ENEMY_MISSILES, 5) with x,y,width,height,active for each missile
         - player_missile: EntityPosition (x, y, width, height, active)
-        - collected_divers: int (0-6)
         - player_score: int (0-999999)
-        - lives: int (0-3)
-        - oxygen_level: int (0-255)
+        - lives: int (0-102), one extra life is granted per 10000 points
         """
+        world_x = (-2 ** 24, 2 ** 24)
+
+        def entities(n):
+            return spaces.Box(
+                low=jnp.array([world_x[0], 0, 0, 0, 0]),
+                high=jnp.array([world_x[1], 210, 160, 210, 1]),
+                shape=(n, 5),
+                dtype=jnp.int32,
+            )
+
         return spaces.Dict({
             "player": spaces.Dict({
-                "x": spaces.Box(low=0, high=160, shape=(), dtype=jnp.int32),
+                "x": spaces.Box(low=world_x[0], high=world_x[1], shape=(), dtype=jnp.int32),
                 "y": spaces.Box(low=0, high=210, shape=(), dtype=jnp.int32),
-                "o": spaces.Box(low=0, high=1, shape=(), dtype=jnp.int32),
+                "o": spaces.Box(low=-1, high=1, shape=(), dtype=jnp.int32),
                 "width": spaces.Box(low=0, high=160, shape=(), dtype=jnp.int32),
                 "height": spaces.Box(low=0, high=210, shape=(), dtype=jnp.int32),
                 "active": spaces.Box(low=0, high=1, shape=(), dtype=jnp.int32),
             }),
-            "trucks": spaces.Box(low=0, high=160, shape=(self.consts.MAX_TRUCKS, 4), dtype=jnp.int32),
-            "jets": spaces.Box(low=0, high=160, shape=(self.consts.MAX_JETS, 4), dtype=jnp.int32),
-            "choppers": spaces.Box(low=0, high=160, shape=(self.consts.MAX_CHOPPERS, 4), dtype=jnp.int32),
-            "enemy_missiles": spaces.Box(low=0, high=160, shape=(self.consts.MAX_ENEMY_MISSILES, 4), dtype=jnp.int32),
+            "trucks": entities(self.consts.MAX_TRUCKS),
+            "jets": entities(self.consts.MAX_JETS),
+            "choppers": entities(self.consts.MAX_CHOPPERS),
+            "enemy_missiles": entities(self.consts.MAX_ENEMY_MISSILES),
             "player_missile": spaces.Dict({
-                "x": spaces.Box(low=0, high=160, shape=(), dtype=jnp.int32),
+                "x": spaces.Box(low=world_x[0], high=world_x[1], shape=(), dtype=jnp.int32),
                 "y": spaces.Box(low=0, high=210, shape=(), dtype=jnp.int32),
                 "width": spaces.Box(low=0, high=160, shape=(), dtype=jnp.int32),
                 "height": spaces.Box(low=0, high=210, shape=(), dtype=jnp.int32),
                 "active": spaces.Box(low=0, high=1, shape=(), dtype=jnp.int32),
             }),
-            "collected_divers": spaces.Box(low=0, high=6, shape=(), dtype=jnp.int32),
             "player_score": spaces.Box(low=0, high=999999, shape=(), dtype=jnp.int32),
-            "lives": spaces.Box(low=0, high=3, shape=(), dtype=jnp.int32),
+            "lives": spaces.Box(low=0, high=3 + 999999 // 10000, shape=(), dtype=jnp.int32),
         })
 
     def image_space(self) -> spaces.Box:
         """Returns the image space for ChopperCommand.
-        The image is a RGB image with shape (160, 210, 3).
+        The image is a RGB image with the frame shape of the renderer, (192, 160, 3) by default.
         """
         return spaces.Box(
             low=0,
             high=255,
-            shape=(160, 210, 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8,
         )
 
@@ -494,12 +376,12 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
     def _get_observation(self, state: ChopperCommandState) -> ChopperCommandObservation:
         # Create player (already scalar, no need for vectorization)
         player = PlayerEntity(
-            x=state.player_x,
-            y=state.player_y,
-            o=state.player_velocity_x,
-            width=jnp.array(self.consts.PLAYER_SIZE[0]),
-            height=jnp.array(self.consts.PLAYER_SIZE[1]),
-            active=jnp.array(1),  # Player is always active
+            x=state.player_x.astype(jnp.int32),
+            y=state.player_y.astype(jnp.int32),
+            o=state.player_facing_direction.astype(jnp.int32),
+            width=jnp.array(self.consts.PLAYER_SIZE[0], dtype=jnp.int32),
+            height=jnp.array(self.consts.PLAYER_SIZE[1], dtype=jnp.int32),
+            active=jnp.array(1, dtype=jnp.int32),  # Player is always active
         )
 
         # Define a function to convert enemy positions to entity format
@@ -510,7 +392,7 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
                 size[0],  # width
                 size[1],  # height
                 pos[2] != 0,  # active flag
-            ])
+            ]).astype(jnp.int32)
 
         # Apply conversion to each type of entity using vmap
 
@@ -534,14 +416,15 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             state.enemy_missile_positions
         )
 
-        # Player missile (scalar)
-        missile_pos = state.player_missile_positions
+        # Player missile (scalar): the first active missile slot
+        missile_active = state.player_missile_positions[:, 2] != 0
+        missile_pos = state.player_missile_positions[jnp.argmax(missile_active)]
         player_missile = EntityPosition(
-            x=missile_pos[0],
-            y=missile_pos[1],
-            width=jnp.array(self.consts.PLAYER_MISSILE_SIZE[0]),
-            height=jnp.array(self.consts.PLAYER_MISSILE_SIZE[1]),
-            active=jnp.array(missile_pos[2] != 0),
+            x=missile_pos[0].astype(jnp.int32),
+            y=missile_pos[1].astype(jnp.int32),
+            width=jnp.array(self.consts.PLAYER_MISSILE_SIZE[0], dtype=jnp.int32),
+            height=jnp.array(self.consts.PLAYER_MISSILE_SIZE[1], dtype=jnp.int32),
+            active=jnp.any(missile_active).astype(jnp.int32),
         )
 
         # Return observation
@@ -552,8 +435,8 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             choppers=choppers,
             enemy_missiles=enemy_missiles,
             player_missile=player_missile,
-            player_score=state.score,
-            lives=state.lives,
+            player_score=state.score.astype(jnp.int32),
+            lives=state.lives.astype(jnp.int32),
         )
 
     @partial(jax.jit, static_argnums=(0,))
@@ -571,9 +454,18 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
     def _get_all_rewards(self, previous_state: ChopperCommandState, state: ChopperCommandState) -> jnp.ndarray:
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array([reward_func(previous_state, state) for reward_func in self.reward_funcs])
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
+    @partial(jax.jit, static_argnums=(0,))
+    def compact_state(self, state: ChopperCommandState) -> ChopperCommandState:
+        return compact_fields(state, COMPACT_STATE_LAYOUT)
+
+    @partial(jax.jit, static_argnums=(0,))
+    def expand_state(self, compact_state: ChopperCommandState) -> ChopperCommandState:
+        _, state_like = jax.eval_shape(self.reset, jax.random.PRNGKey(0))
+        return expand_fields(compact_state, COMPACT_STATE_LAYOUT, state_like)
+
     @partial(jax.jit, static_argnums=(0,))
     def _get_done(self, state: ChopperCommandState) -> bool:
         return state.lives < 0
@@ -583,64 +475,14 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             self, pos1, size1, pos2, size2
     ):
         """Check collision between two single entities"""
-        # Calculate edges for rectangle 1
-        rect1_left = pos1[0]
-        rect1_right = pos1[0] + size1[0]
-        rect1_top = pos1[1]
-        rect1_bottom = pos1[1] + size1[1]
-
-        # Calculate edges for rectangle 2
-        rect2_left = pos2[0]
-        rect2_right = pos2[0] + size2[0]
-        rect2_top = pos2[1]
-        rect2_bottom = pos2[1] + size2[1]
-
-        # Check overlap
-        horizontal_overlap = jnp.logical_and(
-            rect1_left < rect2_right,
-            rect1_right > rect2_left
-        )
-
-        vertical_overlap = jnp.logical_and(
-            rect1_top < rect2_bottom,
-            rect1_bottom > rect2_top
-        )
-
-        return jnp.logical_and(horizontal_overlap, vertical_overlap)
+        return aabb_overlap(pos1[0], pos1[1], size1[0], size1[1], pos2[0], pos2[1], size2[0], size2[1])
 
     @partial(jax.jit, static_argnums=(0,))
     def check_collision_batch(
             self, pos1, size1, pos2_array, size2
     ):
         """Check collision between one entity and an array of entities"""
-        # Calculate edges for rectangle 1
-        rect1_left = pos1[0]
-        rect1_right = pos1[0] + size1[0]
-        rect1_top = pos1[1]
-        rect1_bottom = pos1[1] + size1[1]
-
-        # Calculate edges for all rectangles in pos2_array
-        rect2_left = pos2_array[:, 0]
-        rect2_right = pos2_array[:, 0] + size2[0]
-        rect2_top = pos2_array[:, 1]
-        rect2_bottom = pos2_array[:, 1] + size2[1]
-
-        # Check overlap for all entities
-        horizontal_overlaps = jnp.logical_and(
-            rect1_left < rect2_right,
-            rect1_right > rect2_left
-        )
-
-        vertical_overlaps = jnp.logical_and(
-            rect1_top < rect2_bottom,
-            rect1_bottom > rect2_top
-        )
-
-        # Combine checks for each entity
-        collisions = jnp.logical_and(horizontal_overlaps, vertical_overlaps)
-
-        # Return true if any collision detected
-        return jnp.any(collisions)
+        return jnp.any(pairwise_overlaps(jnp.asarray(pos1)[None], size1, pos2_array, size2))
 
     def kill_entity(
             self,
@@ -754,28 +596,20 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
         player_pos = jnp.array([player_x, player_y])
         offset = (self.consts.PLAYER_SIZE[0] // 2 - entity_size[0] // 2) - (player_velocity * self.consts.DISTANCE_WHEN_FLYING)
 
-        def check_single(entity):
-            #any_collision_inner, updated_entities = carry
+        is_active = entity_list[:, 3] > death_threshold
 
-            world_x, world_y = entity[0], entity[1]
-            death_timer = entity[3]
-            is_active = death_timer > death_threshold
-
-            # Passe die Position an, wie sie auch im Renderer korrigiert wird
-            adjusted_entity_pos = jnp.array([world_x + offset, world_y])
-
-            # Prüfe Kollision nur bei aktiven Gegnern
-            collision = jnp.logical_and(
-                is_active,
-                self.check_collision_single(player_pos, self.consts.PLAYER_SIZE, adjusted_entity_pos, entity_size)
+        # Passe die Position an, wie sie auch im Renderer korrigiert wird
+        # Prüfe Kollision nur bei aktiven Gegnern
+        collision = jnp.logical_and(
+            is_active,
+            aabb_overlap(
+                player_pos[0], player_pos[1], self.consts.PLAYER_SIZE[0], self.consts.PLAYER_SIZE[1],
+                entity_list[:, 0] + offset, entity_list[:, 1], entity_size[0], entity_size[1]
             )
+        )
 
-            # Markiere getroffenen Gegner
-            new_entity = jnp.where(collision, self.kill_entity(entity, death_threshold), entity)
-
-            return new_entity
-
-        updated_entity_list = jax.vmap(check_single)(entity_list)
+        # Markiere getroffenen Gegner
+        updated_entity_list = jnp.where(collision[:, None], entity_list.at[:, 3].set(death_threshold), entity_list)
 
         return jnp.invert(jnp.array_equal(entity_list, updated_entity_list)), updated_entity_list
 
@@ -788,61 +622,26 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             missile_size: Tuple[int, int],  # (width, height)
     ) -> Tuple[chex.Array, chex.Array]:
 
-        def check_single_missile(missile, trucks):
-            mx, my, _, _ = missile
-            missile_active = my > 2
-
-            def check_single_truck(truck):
-                tx, ty, tdir, tdeath = truck
-                truck_active = jnp.logical_and(tdir != 0, tdeath > 0)
+        missile_active = missile_positions[:, 1] > 2
+        truck_active = jnp.logical_and(truck_positions[:, 2] != 0, truck_positions[:, 3] > 0)
 
-                collision = (
-                        missile_active & truck_active &
-                        self.check_collision_single(
-                            jnp.array([mx, my]), missile_size,
-                            jnp.array([tx, ty]), truck_size
-                        )
-                )
-
-                updated_truck = jnp.where(
-                    collision,
-                    jnp.array([tx, ty, tdir, self.consts.FRAMES_DEATH_ANIMATION_TRUCK], dtype=truck.dtype),
-                    truck
-                )
-
-                return collision, updated_truck
-
-            # Check all trucks against this missile
-            collision_flags, updated_trucks = jax.vmap(check_single_truck)(trucks)
-
-            # If any collision occurred, mark missile as dead
-            collided = jnp.any(collision_flags)
-            updated_missile = jnp.where(
-                collided,
-                jnp.array([0.0, 0.0, 0.0, 187.0], dtype=missile.dtype),
-                missile
-            )
-
-            return updated_missile, updated_trucks, collision_flags
-
-        # Apply to all missiles
-        updated_results = jax.vmap(
-            lambda m: check_single_missile(m, truck_positions)
-        )(missile_positions)
-
-        updated_missiles = updated_results[0]  # shape: (MAX_MISSILES, 4)
-        updated_truck_list = updated_results[1]  # shape: (MAX_MISSILES, MAX_TRUCKS, 4)
-        collision_flags_all = updated_results[2]  # shape: (MAX_MISSILES, MAX_TRUCKS)
-
-        # Combine all truck updates from each missile pass
-        def reduce_trucks(i, carry):
-            combined = carry
-            flags = collision_flags_all[i]
-            trucks = updated_truck_list[i]
-            return jnp.where(flags[:, None], trucks, combined)
+        # (MAX_MISSILES, MAX_TRUCKS)
+        collisions = pairwise_overlaps(
+            missile_positions, missile_size, truck_positions, truck_size,
+            active1=missile_active, active2=truck_active
+        )
 
-        initial_trucks = truck_positions
-        updated_trucks = jax.lax.fori_loop(0, missile_positions.shape[0], reduce_trucks, initial_trucks)
+        # Every hit truck starts its death animation, every missile that hit a truck is removed
+        updated_trucks = jnp.where(
+            jnp.any(collisions, axis=0)[:, None],
+            truck_positions.at[:, 3].set(self.consts.FRAMES_DEATH_ANIMATION_TRUCK),
+            truck_positions
+        )
+        updated_missiles = jnp.where(
+            jnp.any(collisions, axis=1)[:, None],
+            jnp.array([0.0, 0.0, 0.0, 187.0], dtype=missile_positions.dtype),
+            missile_positions
+        )
 
         return updated_trucks, updated_missiles
 
@@ -853,9 +652,6 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
         This prevents origin-spawn artifacts during the no-move pause and keeps
         the minimap consistent immediately after respawn.
         """
-        jet_positions = jnp.zeros((self.consts.MAX_ENEMIES, 4), dtype=jnp.float32)
-        chopper_positions = jnp.zeros((self.consts.MAX_ENEMIES, 4), dtype=jnp.float32)
-
         # Wrap helper: put x within +-624 of ref
         def wrap_near_ref(x, ref):
             period = jnp.asarray(1248.0, dtype=x.dtype)  # 2 * 624
@@ -878,72 +674,44 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
         keys_for_chopper_amount = jax.random.split(key1, fleet_count)
         keys_for_offsets = jax.random.split(key2, fleet_count * units_per_fleet)
 
-        carry = (jet_positions, chopper_positions, 0)
-
-        def spawn_fleet(fleet_idx, carry):
-            jet_positions, chopper_positions, global_idx = carry
-
-            # Base anchor and wrap it near ref_x
-            base_anchor = fleet_start_x + fleet_spacing_x * jnp.asarray(fleet_idx, dtype=jnp.float32)
-            anchor_x = wrap_near_ref(base_anchor, ref_x)
-
-            # Random directions per unit
-            directions = jax.random.choice(
-                keys_for_direction[fleet_idx],
-                jnp.array([-1.0, 1.0], dtype=jnp.float32),
-                shape=(units_per_fleet,),
-                replace=True
-            )
-
-            # Random number of choppers in this fleet
-            chopper_count = jax.random.randint(keys_for_chopper_amount[fleet_idx], (), 0, units_per_fleet + 1)
-
-            # X offsets per unit
-            x_offset_array = jnp.array([
-                jax.random.randint(keys_for_offsets[fleet_idx * units_per_fleet + 0], (),
-                                   -self.consts.ENEMY_MAXIMUM_SPAWN_OFFSET + 5,
-                                   self.consts.ENEMY_MAXIMUM_SPAWN_OFFSET - 5),
-                jax.random.randint(keys_for_offsets[fleet_idx * units_per_fleet + 1], (),
-                                   -self.consts.ENEMY_MAXIMUM_SPAWN_OFFSET + 5,
-                                   self.consts.ENEMY_MAXIMUM_SPAWN_OFFSET - 5),
-                jax.random.randint(keys_for_offsets[fleet_idx * units_per_fleet + 2], (),
-                                   -self.consts.ENEMY_MAXIMUM_SPAWN_OFFSET + 5,
-                                   self.consts.ENEMY_MAXIMUM_SPAWN_OFFSET - 5),
-            ], dtype=jnp.float32)
-
-            def place_unit(i, unit_carry):
-                jet_positions, chopper_positions, jet_idx, chopper_idx = unit_carry
-                y = jnp.asarray(y_start + i * vertical_spacing, dtype=jnp.float32)
-                offset_x = x_offset_array[i]
-                direction = directions[i]
-                pos = jnp.array([anchor_x + offset_x, y, direction, self.consts.FRAMES_DEATH_ANIMATION_ENEMY + 5.0], dtype=jnp.float32)
-
-                is_chopper = i < chopper_count
-                chopper_positions = jax.lax.cond(
-                    is_chopper,
-                    lambda cp: cp.at[chopper_idx].set(pos),
-                    lambda cp: cp,
-                    chopper_positions
-                )
-                jet_positions = jax.lax.cond(
-                    is_chopper,
-                    lambda jp: jp,
-                    lambda jp: jp.at[jet_idx].set(pos),
-                    jet_positions
-                )
-
-                jet_idx = jet_idx + jnp.where(is_chopper, 0, 1)
-                chopper_idx = chopper_idx + jnp.where(is_chopper, 1, 0)
-                return jet_positions, chopper_positions, jet_idx, chopper_idx
-
-            jet_positions, chopper_positions, jet_idx, chopper_idx = jax.lax.fori_loop(
-                0, units_per_fleet, place_unit, (jet_positions, chopper_positions, global_idx, global_idx)
-            )
-
-            new_global_idx = global_idx + units_per_fleet
-            return (jet_positions, chopper_positions, new_global_idx)
+        # Draw all fleet randoms at once (same keys as drawing them fleet by fleet)
+        directions = jax.vmap(
+            lambda k: jax.random.choice(k, jnp.array([-1.0, 1.0], dtype=jnp.float32), shape=(units_per_fleet,), replace=True)
+        )(keys_for_direction)                                                                                   # (fleets, units)
+        chopper_counts = jax.vmap(
+            lambda k: jax.random.randint(k, (), 0, units_per_fleet + 1)
+        )(keys_for_chopper_amount)                                                                              # (fleets,)
+        x_offsets = jax.vmap(
+            lambda k: jax.random.randint(k, (), -self.consts.ENEMY_MAXIMUM_SPAWN_OFFSET + 5, self.consts.ENEMY_MAXIMUM_SPAWN_OFFSET - 5)
+        )(keys_for_offsets).reshape(fleet_count, units_per_fleet).astype(jnp.float32)                           # (fleets, units)
+
+        # Base anchors, wrapped near ref_x
+        anchors = wrap_near_ref(fleet_start_x + fleet_spacing_x * jnp.arange(fleet_count, dtype=jnp.float32), ref_x)
+        unit_y = jnp.asarray(y_start + jnp.arange(units_per_fleet) * vertical_spacing, dtype=jnp.float32)
+
+        # (fleets, units, 4): [x, y, direction, lane flag]
+        units = jnp.stack([
+            anchors[:, None] + x_offsets,
+            jnp.broadcast_to(unit_y, (fleet_count, units_per_fleet)),
+            directions,
+            jnp.full((fleet_count, units_per_fleet), self.consts.FRAMES_DEATH_ANIMATION_ENEMY + 5.0, dtype=jnp.float32),
+        ], axis=-1)
+
+        # The first chopper_count units of a fleet are choppers and fill the fleet's chopper slots in order,
+        # the remaining units are jets and fill the fleet's jet slots in order. Unused slots stay empty.
+        slots = jnp.arange(units_per_fleet)
+        chopper_mask = slots[None, :] < chopper_counts[:, None]
+        fleet_choppers = jnp.where(chopper_mask[..., None], units, 0.0)
+
+        jet_source = slots[None, :] + chopper_counts[:, None]
+        jet_mask = jet_source < units_per_fleet
+        jet_units = jnp.take_along_axis(units, jnp.minimum(jet_source, units_per_fleet - 1)[..., None], axis=1)
+        fleet_jets = jnp.where(jet_mask[..., None], jet_units, 0.0)
 
-        jet_positions, chopper_positions, _ = jax.lax.fori_loop(0, fleet_count, spawn_fleet, carry)
+        jet_positions = jnp.zeros((self.consts.MAX_ENEMIES, 4), dtype=jnp.float32)
+        chopper_positions = jnp.zeros((self.consts.MAX_ENEMIES, 4), dtype=jnp.float32)
+        jet_positions = jet_positions.at[:fleet_count * units_per_fleet].set(fleet_jets.reshape(-1, 4))
+        chopper_positions = chopper_positions.at[:fleet_count * units_per_fleet].set(fleet_choppers.reshape(-1, 4))
         return jet_positions, chopper_positions
 
     @partial(jax.jit, static_argnums=(0,))
@@ -1229,23 +997,17 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
 
 
     @partial(jax.jit, static_argnums=(0,))
-    def initialize_truck_positions(self) -> chex.Array:     # TODO: change to vmap (via positioning array) if possible
-        initial_truck_positions = jnp.zeros((self.consts.MAX_TRUCKS, 4))
-        anchor = -748
-        carry = (initial_truck_positions, anchor)
-
-        def spawn_trucks(i, carry):
-            truck_positions, anchor = carry
-
-            anchor = jnp.where(
-                i % 3 == 0,
-                anchor + 248,
-                anchor + 32,
-            )
-            truck_positions = truck_positions.at[i].set(jnp.array([anchor, 156, -1, self.consts.FRAMES_DEATH_ANIMATION_TRUCK + 1]))
-            return truck_positions, anchor
-
-        return jax.lax.fori_loop(0, 12, spawn_trucks, carry)[0]
+    def initialize_truck_positions(self) -> chex.Array:
+        # Every third truck starts a new fleet (248px apart), trucks within a fleet are 32px apart
+        ids = jnp.arange(self.consts.MAX_TRUCKS)
+        anchors = -748 + jnp.cumsum(jnp.where(ids % 3 == 0, 248, 32))
+
+        return jnp.stack([
+            anchors,
+            jnp.full_like(anchors, 156),
+            jnp.full_like(anchors, -1),
+            jnp.full_like(anchors, self.consts.FRAMES_DEATH_ANIMATION_TRUCK + 1),
+        ], axis=-1).astype(jnp.float32)
 
     @partial(jax.jit, static_argnums=(0,))
     def step_truck_movement(
@@ -1273,7 +1035,7 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
 
 
     @partial(jax.jit, static_argnums=(0,))
-    def enemy_missiles_step(        # TODO: vmap
+    def enemy_missiles_step(
             self,
             jet_positions: chex.Array,  # (MAX_ENEMIES, 4)
             chopper_positions: chex.Array,  # (MAX_ENEMIES, 4)
@@ -1283,136 +1045,78 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
 
         enemies = jnp.concatenate([jet_positions, chopper_positions], axis=0)
 
-        def step_both_missiles(i, carry):
-            missiles, key, eni = carry
-            # Split key into spawn, split, speed, and next key
-            key, key_spawn, key_split, key_speed = jax.random.split(key, 4)
+        # Every enemy owns one pair of missiles: (num_enemies, 2, 4) with [upper, lower]
+        missile_pairs = missile_states.reshape(enemies.shape[0], 2, 4)
 
-            # Get current enemy
-            current_enemy = enemies[eni]
+        # Spawn, split and speed keys for all enemies at once
+        keys = jax.random.split(rng, (enemies.shape[0], 3))
+
+        dead_missile = jnp.array([0.0, 0.0, 0.0, 187.0], dtype=jnp.float32)
+
+        def step_both_missiles(current_enemy, missiles, pair_keys):
+            key_spawn, key_split, key_speed = pair_keys
 
             # Upper and lower missile
-            missile_upper = missiles[i]
-            missile_lower = missiles[i + 1]
+            missile_upper, missile_lower = missiles
 
             def maybe_spawn():
-                def do_spawn():
-                    # Coordinates of upper missile part
-                    x_upper_spawn = current_enemy[0]
-                    y_upper_spawn = current_enemy[1]
-
-                    # Coordinates of lower missile part
-                    x_lower_spawn = current_enemy[0]
-                    y_lower_spawn = current_enemy[1] + 1
-
-                    # Random Y Velocity
-                    y_speed_spawn = jax.random.uniform(
-                        key_speed,
-                        (),
-                        minval=-self.consts.ENEMY_MISSILE_MAXIMUM_Y_SPEED_BEFORE_SPLIT,
-                        maxval=self.consts.ENEMY_MISSILE_MAXIMUM_Y_SPEED_BEFORE_SPLIT
-                    )
-
-                    # We also set the did_split flag to false
-                    spawned_upper_missile = jnp.array([x_upper_spawn, y_upper_spawn, y_speed_spawn, 187.0], dtype=jnp.float32)
-                    spawned_lower_missile = jnp.array([x_lower_spawn, y_lower_spawn, y_speed_spawn, 187.0], dtype=jnp.float32)
+                # Random Y Velocity
+                y_speed_spawn = jax.random.uniform(
+                    key_speed,
+                    (),
+                    minval=-self.consts.ENEMY_MISSILE_MAXIMUM_Y_SPEED_BEFORE_SPLIT,
+                    maxval=self.consts.ENEMY_MISSILE_MAXIMUM_Y_SPEED_BEFORE_SPLIT
+                )
 
-                    return spawned_upper_missile, spawned_lower_missile
+                # The lower missile part spawns one pixel below the upper one, the did_split flag is false
+                spawned_missiles = jnp.array([
+                    [current_enemy[0], current_enemy[1], y_speed_spawn, 187.0],
+                    [current_enemy[0], current_enemy[1] + 1, y_speed_spawn, 187.0],
+                ], dtype=jnp.float32)
 
-                return jax.lax.cond(
+                # Leave dead if nothing spawns
+                return jnp.where(
                     jax.random.bernoulli(key_spawn, p=self.consts.ENEMY_MISSILE_SPAWN_PROBABILITY),
-                    lambda _: do_spawn(), # Actually spawn
-                    lambda _: (           # Leave dead
-                        jnp.array([0.0, 0.0, 0.0, 187.0], dtype=jnp.float32),
-                        jnp.array([0.0, 0.0, 0.0, 187.0], dtype=jnp.float32)
-                    ),
-                    operand=None
+                    spawned_missiles,
+                    dead_missile
                 )
 
             def do_step():
-                x_upper_step, y_upper_step, y_upper_speed, did_split_upper_step = missile_upper
-                x_lower_step, y_lower_step, y_lower_speed, did_split_lower_step = missile_lower
-
-                def dont_split():
-                    y_upper_step_inner = y_upper_step + y_upper_speed
-                    y_lower_step_inner = y_lower_step + y_lower_speed
-                    return (
-                        y_upper_step_inner.astype(jnp.float32),
-                        y_upper_speed.astype(jnp.float32),
-                        y_lower_step_inner.astype(jnp.float32),
-                        y_lower_speed.astype(jnp.float32),
-                        187.0
-                    )
-
-                def do_split():
-                    y_upper_speed_inner = jnp.array(self.consts.ENEMY_MISSILE_Y_SPEED_AFTER_SPLIT, dtype=jnp.float32)
-                    y_lower_speed_inner = jnp.array(-self.consts.ENEMY_MISSILE_Y_SPEED_AFTER_SPLIT, dtype=jnp.float32)
-                    y_upper_step_inner = y_upper_step + y_upper_speed_inner
-                    y_lower_step_inner = y_lower_step + y_lower_speed_inner
-                    return (
-                        y_upper_step_inner.astype(jnp.float32),
-                        y_upper_speed_inner,
-                        y_lower_step_inner.astype(jnp.float32),
-                        y_lower_speed_inner,
-                        42.0
-                    )
-
                 split_condition = jnp.logical_and(
                     jax.random.bernoulli(key_split, p=self.consts.ENEMY_MISSILE_SPLIT_PROBABILITY),
-                    jnp.logical_and(did_split_upper_step != 42.0, did_split_lower_step != 42.0)
+                    jnp.logical_and(missile_upper[3] != 42.0, missile_lower[3] != 42.0)
                 )
 
-                y_upper_changed, y_upper_speed_changed, y_lower_changed, y_lower_speed_changed, flag = jax.lax.cond(
-                    split_condition,
-                    lambda _: do_split(),
-                    lambda _: dont_split(),
-                    operand=None
-                )
-
-                stepped_upper_missile = jnp.array([x_upper_step, y_upper_changed, y_upper_speed_changed, flag], dtype=jnp.float32)
-                stepped_lower_missile = jnp.array([x_lower_step, y_lower_changed, y_lower_speed_changed, flag], dtype=jnp.float32)
-
-                # Kill upper if out of bounds
-                stepped_upper_missile = jnp.where(
-                    jnp.logical_or(y_upper_changed < 44.0, y_upper_changed > 163.0),
-                    jnp.array([0.0, 0.0, 0.0, 187.0], dtype=jnp.float32),
-                    stepped_upper_missile,
+                # After a split the upper part moves down and the lower part moves up
+                split_speeds = jnp.array(
+                    [self.consts.ENEMY_MISSILE_Y_SPEED_AFTER_SPLIT, -self.consts.ENEMY_MISSILE_Y_SPEED_AFTER_SPLIT],
+                    dtype=jnp.float32
                 )
-
-                # Kill lower if out of bounds
-                stepped_lower_missile = jnp.where(
-                    jnp.logical_or(y_lower_changed < 44.0, y_lower_changed > 163.0),
-                    jnp.array([0.0, 0.0, 0.0, 187.0], dtype=jnp.float32),
-                    stepped_lower_missile
+                y_speeds = jnp.where(split_condition, split_speeds, missiles[:, 2].astype(jnp.float32))
+                y_changed = (missiles[:, 1] + y_speeds).astype(jnp.float32)
+                flag = jnp.where(split_condition, 42.0, 187.0)
+
+                stepped_missiles = jnp.stack([
+                    missiles[:, 0].astype(jnp.float32),
+                    y_changed,
+                    y_speeds,
+                    jnp.broadcast_to(flag, (2,)),
+                ], axis=1)
+
+                # Kill missiles that are out of bounds
+                return jnp.where(
+                    jnp.logical_or(y_changed < 44.0, y_changed > 163.0)[:, None],
+                    dead_missile,
+                    stepped_missiles
                 )
 
-                return stepped_upper_missile, stepped_lower_missile
-
             # Check if missile is "alive"
-            upper_dead = jnp.all(missile_upper == jnp.array([0.0, 0.0, 0.0, 187.0], dtype=jnp.float32))
-            lower_dead = jnp.all(missile_lower == jnp.array([0.0, 0.0, 0.0, 187.0], dtype=jnp.float32))
+            both_dead = jnp.all(missiles == dead_missile)
 
-            updated_missile_upper, updated_missile_lower = jax.lax.cond(
-                jnp.logical_and(upper_dead, lower_dead),
-                lambda _: maybe_spawn(),
-                lambda _: do_step(),
-                operand=None
-            )
+            return jnp.where(both_dead, maybe_spawn(), do_step())
 
-            missiles = missiles.at[i].set(updated_missile_upper)
-            missiles = missiles.at[i + 1].set(updated_missile_lower)
-
-            return missiles, key
-
-        def step_even(i, carry):
-            a, b = carry
-            carry = a, b, i
-            return step_both_missiles(i * 2, carry)
-
-        updated, _ = jax.lax.fori_loop(
-            0, enemies.shape[0], step_even, (missile_states, rng)
-        )
-        return updated
+        updated = jax.vmap(step_both_missiles)(enemies, missile_pairs, keys)
+        return updated.reshape(missile_states.shape)
 
 
     @partial(jax.jit, static_argnums=(0,))
@@ -1620,19 +1324,11 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             step_counter=jnp.array(0).astype(jnp.int32),                                    # Frame counter starts from 0.
             pause_timer=jnp.array(self.consts.DEATH_PAUSE_FRAMES + 2).astype(jnp.int32),    # The game starts in the no_move_pause (DEATH_PAUSE_FRAMES + 2) to allow for visual startup or intro.
             rng_key=new_key0,                                                               # Pseudo random number generator seed key, based on current time and initial key used.
-            obs_stack=jnp.zeros((self.frame_stack_size, self.obs_size)),                    # Observation stack starts empty (zeros). Used for agent state.
             difficulty=jnp.array(self.consts.GAME_DIFFICULTY).astype(jnp.float32),          # difficulty of game
             enemy_speed=jnp.array(0).astype(jnp.float32),                                   # enemy_speed which is 0 on start
         )
 
         initial_obs = self._get_observation(reset_state)
-
-        def expand_and_copy(x):
-            x_expanded = jnp.expand_dims(x, axis=0)
-            return jnp.concatenate([x_expanded] * self.frame_stack_size, axis=0)
-
-        initial_obs = jax.tree.map(expand_and_copy, initial_obs)
-        reset_state = reset_state._replace(obs_stack=initial_obs)
         return initial_obs, reset_state
 
 
@@ -1662,7 +1358,10 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
         )
 
         # -------- Branches --------
-        def do_normal(_):
+        # The normal update is computed once up front and shared by the phase branches, which only apply
+        # cheap fix-ups to it. Under vmap every branch of the switch is evaluated, so running the game update
+        # inside the death and respawn branches would run it up to three times per step.
+        def do_normal():
             # RNG split
             k_move, k_mis, new_rng = jax.random.split(state.rng_key, 3)
 
@@ -1740,21 +1439,17 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             )
             return _match_state_dtypes(out, state)
 
-        def do_death(_):
+        def do_death(normal_state):
             in_pause = (state.pause_timer <= self.consts.DEATH_PAUSE_FRAMES) & (state.pause_timer > 0)
             pt_dtype = state.pause_timer.dtype
             new_pause = jnp.where(in_pause, state.pause_timer - jnp.asarray(1, dtype=pt_dtype), state.pause_timer)
             new_pause = jnp.where(state.lives == 0, jnp.maximum(new_pause, jnp.asarray(1, dtype=pt_dtype)), new_pause)
 
-            # Use normal-state to progress timers/animations
-            normal_state = do_normal(None)
-
             all_dead = jnp.all(state.jet_positions == 0) & jnp.all(state.chopper_positions == 0)
 
             def trucks_normal():
-                temp_truck = self.step_truck_movement(normal_state.truck_positions, normal_state.player_x)
-                updated_truck_death_timers = temp_truck[:, 3]
-                new_trucks = state.truck_positions.at[:, 3].set(updated_truck_death_timers)
+                # Trucks stay in place, only their death timers advance (the truck movement leaves them unchanged)
+                new_trucks = state.truck_positions.at[:, 3].set(normal_state.truck_positions[:, 3])
                 add_to_score = jnp.asarray(0, dtype=state.score.dtype)
                 return new_trucks, add_to_score
 
@@ -1787,14 +1482,9 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             new_trucks, add_score = jax.lax.cond(all_dead, lambda _: trucks_points(), lambda _: trucks_normal(), operand=None)
             new_score = state.score + add_score
 
-            # Advance death animation timers
-            temp_jet, temp_chop, _ = self.step_enemy_movement(
-                normal_state.truck_positions, normal_state.jet_positions, normal_state.chopper_positions,
-                normal_state.rng_key, normal_state.player_x, normal_state.local_player_offset,
-                normal_state.difficulty, normal_state.enemy_speed,
-            )
-            new_jet = state.jet_positions.at[:, 3].set(temp_jet[:, 3])
-            new_chop = state.chopper_positions.at[:, 3].set(temp_chop[:, 3])
+            # Enemies stay in place, their death animation timers advance as in the normal update
+            new_jet = state.jet_positions.at[:, 3].set(normal_state.jet_positions[:, 3])
+            new_chop = state.chopper_positions.at[:, 3].set(normal_state.chopper_positions[:, 3])
 
             # Player missile keeps traveling during the pause
             new_player_mis, new_cd = self.player_missile_step(normal_state, normal_state.player_x, normal_state.player_y, action)
@@ -1817,7 +1507,7 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             )
             return _match_state_dtypes(out, state)
 
-        def do_no_move(_):
+        def do_no_move():
             no_input = jnp.isin(action, Action.NOOP)
 
             on_screen = (self.consts.WIDTH // 2) - 8 + state.local_player_offset + (state.player_velocity_x * self.consts.DISTANCE_WHEN_FLYING)
@@ -1835,9 +1525,8 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
             out = state._replace(local_player_offset=new_lpo, pause_timer=new_pause)
             return _match_state_dtypes(out, state)
 
-        def do_respawn(_):
+        def do_respawn(soft):
             # Soft = state during the death pause; we do NOT need a hard reset here
-            soft = do_death(None)
 
             # Only when ALL enemies are dead we spawn new fleets; otherwise we keep them.
             cleared = jnp.logical_and(jnp.all(soft.jet_positions == 0),
@@ -1931,8 +1620,18 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
                                 lambda _: respawn_keep_enemies(),
                                 operand=None)
 
-        # Switch over phases
-        step_state = jax.lax.switch(phase, (do_normal, do_death, do_no_move, do_respawn), operand=None)
+        # Only the no-move pause does without the normal update; unbatched, the cond skips it there
+        normal_state = jax.lax.cond(phase == 2, lambda: state, do_normal)
+
+        # The death pause and the respawn both build on the death update; it is built once and, unbatched, only
+        # runs in those phases
+        death_state = jax.lax.cond((phase == 1) | (phase == 3), lambda: do_death(normal_state), lambda: normal_state)
+
+        # Switch over phases, unbatched only the branch of the current phase runs
+        step_state = jax.lax.switch(
+            phase,
+            (lambda: normal_state, lambda: death_state, do_no_move, lambda: do_respawn(death_state)),
+        )
 
         # Initialize/hold death pause
         all_dead  = jnp.all(step_state.jet_positions == 0) & jnp.all(step_state.chopper_positions == 0)
@@ -1944,27 +1643,60 @@ class JaxChopperCommand(JaxEnvironment[ChopperCommandState, ChopperCommandObserv
                                   step_state.pause_timer)
         )
 
-        # Obs/Reward/Done/Info + stack
+        # Obs/Reward/Done/Info
         observation = self._get_observation(step_state)
         done        = self._get_done(step_state)
         env_reward  = self._get_env_reward(prev, step_state)
         all_rewards = self._get_all_rewards(prev, step_state)
         info        = self._get_info(step_state, all_rewards)
 
-        new_obs_stack = jax.tree.map(
-            lambda stack, o: jnp.concatenate([stack[1:], jnp.expand_dims(o, 0)], axis=0),
-            step_state.obs_stack, observation
-        )
-        step_state = step_state._replace(obs_stack=new_obs_stack)
-
-        # Return matching your caller (obs, state, reward, done, info)
-        return new_obs_stack, step_state, env_reward, done, info
+        return observation, step_state, env_reward, done, info
 
 
 class ChopperCommandRenderer(JAXGameRenderer):
-    def __init__(self, consts: ChopperCommandConstants = None):
-        super().__init__()
+    def __init__(self, consts: ChopperCommandConstants = None, config: render_utils.RendererConfig = None):
+        super().__init__(consts, config)
         self.consts = consts or ChopperCommandConstants()
+        self.config = render_utils.RendererConfig(
+            game_dimensions=(self.consts.HEIGHT, self.consts.WIDTH),
+            channels=self.config.channels,
+            downscale=self.config.downscale,
+        )
+        self.jr = render_utils.JaxRenderingUtils(self.config)
+
+        asset_config = self._get_asset_config()
+        sprite_path = f"{os.path.dirname(os.path.abspath(__file__))}/sprites/choppercommand"
+
+        (
+            self.PALETTE,
+            self.SHAPE_MASKS,
+            self.BACKGROUND,
+            self.COLOR_TO_ID,
+            self.FLIP_OFFSETS
+        ) = self.jr.load_and_setup_assets(asset_config, sprite_path)
+
+    def _get_asset_config(self) -> list:
+        """Returns the declarative manifest of all assets for the game."""
+        return [
+            # The scrolling background frames are horizontal rolls of the first frame, so only that one is loaded
+            {'name': 'background', 'type': 'background', 'file': 'bg/1.npy'},
+            {'name': 'player_chopper', 'type': 'group', 'files': ['player_chopper/1.npy', 'player_chopper/2.npy']},
+            {'name': 'player_death', 'type': 'group', 'files': ['player_chopper/death_1.npy', 'player_chopper/death_2.npy', 'player_chopper/death_3.npy']},
+            {'name': 'friendly_truck', 'type': 'group', 'files': ['friendly_truck/1.npy', 'friendly_truck/2.npy']},
+            {'name': 'enemy_jet', 'type': 'single', 'file': 'enemy_jet/normal.npy'},
+            {'name': 'enemy_chopper', 'type': 'group', 'files': ['enemy_chopper/1.npy', 'enemy_chopper/2.npy']},
+            {'name': 'enemy_death', 'type': 'group', 'files': ['enemy_death/death_1.npy', 'enemy_death/death_2.npy', 'enemy_death/death_3.npy']},
+            {'name': 'enemy_missile', 'type': 'single', 'file': 'bomb/1.npy'},
+            {'name': 'player_missile', 'type': 'group', 'files': [f'player_missiles/missile_{i}.npy' for i in range(16)]},
+            {'name': 'digits', 'type': 'digits', 'pattern': 'score/{}.npy'},
+            {'name': 'life_indicator', 'type': 'single', 'file': 'score/chopper.npy'},
+            {'name': 'minimap_bg', 'type': 'single', 'file': 'minimap/background.npy'},
+            {'name': 'minimap_mountains', 'type': 'group', 'files': [f'minimap/mountains/{i}.npy' for i in range(1, 9)]},
+            {'name': 'minimap_player', 'type': 'single', 'file': 'minimap/player.npy'},
+            {'name': 'minimap_truck', 'type': 'single', 'file': 'minimap/truck.npy'},
+            {'name': 'minimap_enemy', 'type': 'single', 'file': 'minimap/enemy.npy'},
+            {'name': 'activision_logo', 'type': 'single', 'file': 'minimap/activision_logo.npy'},
+        ]
 
     @partial(jax.jit, static_argnums=(0,))
     def render(self, state):
@@ -1976,16 +1708,17 @@ class ChopperCommandRenderer(JAXGameRenderer):
         static_center_x_chopper = (self.consts.WIDTH // 2) + state.local_player_offset - (self.consts.CHOPPER_SIZE[0] // 2)
         static_center_x_truck = (self.consts.WIDTH // 2) + state.local_player_offset - (self.consts.TRUCK_SIZE[0] // 2)
 
-        #Initialisierung
-        raster = jnp.zeros((self.consts.HEIGHT, self.consts.WIDTH,  3))
-
         # Render Background
         frame_idx = jnp.asarray(state.local_player_offset + (-state.player_x % self.consts.WIDTH), dtype=jnp.int32) #local_player_offset = ob Heli links oder rechts auf Bildschirm ist, -state.player_x % WIDTH = Scrollen vom Hintergrund
-        frame_bg = jru.get_sprite_frame(SPRITE_BG, frame_idx)
+        bg_shift = jnp.round(jnp.mod(frame_idx, self.consts.WIDTH) * self.config.width_scaling).astype(jnp.int32)
+        raster = jnp.roll(self.BACKGROUND, bg_shift, axis=1)
 
-        raster = jru.render_at(raster, 0, 0, frame_bg)
+        # Animation frames: trucks and enemy choppers switch every 4 steps, the player rotor every PLAYER_ROTOR_SPEED steps
+        truck_anim_idx = (state.step_counter % 8) // 4
+        enemy_chopper_anim_idx = (state.step_counter % 8) // 4
+        player_anim_idx = (state.step_counter % (2 * self.consts.PLAYER_ROTOR_SPEED)) // self.consts.PLAYER_ROTOR_SPEED
 
-        frame_friendly_truck = jru.get_sprite_frame(SPRITE_FRIENDLY_TRUCK, state.step_counter)
+        frame_friendly_truck = self.SHAPE_MASKS['friendly_truck'][truck_anim_idx]
 
         def render_truck(i, raster_base):
             death_timer = state.truck_positions[i][3]
@@ -2015,12 +1748,13 @@ class ChopperCommandRenderer(JAXGameRenderer):
 
             return jax.lax.cond(
                 should_render,
-                lambda r: jru.render_at(
+                lambda r: self.jr.render_at_clipped(
                     r,
                     truck_screen_x,
                     truck_screen_y,
                     frame_friendly_truck,
                     flip_horizontal=(state.truck_positions[i][2] == -1),
+                    flip_offset=self.FLIP_OFFSETS['friendly_truck'],
                 ),
                 lambda r: r,
                 raster_base,
@@ -2028,8 +1762,16 @@ class ChopperCommandRenderer(JAXGameRenderer):
 
         raster = jax.lax.fori_loop(0, self.consts.MAX_TRUCKS, render_truck, raster)
 
+        def get_enemy_death_frame(death_timer):
+            phase0 = death_timer > (2 * self.consts.FRAMES_DEATH_ANIMATION_ENEMY) // 3
+            phase1 = jnp.logical_and(
+                death_timer <= (2 * self.consts.FRAMES_DEATH_ANIMATION_ENEMY) // 3,
+                death_timer > self.consts.FRAMES_DEATH_ANIMATION_ENEMY // 3
+            )
+            return jnp.where(phase0, 0, jnp.where(phase1, 1, 2))
+
         # -- JET Rendering --
-        frame_enemy_jet = jru.get_sprite_frame(SPRITE_ENEMY_JET, state.step_counter)
+        frame_enemy_jet = self.SHAPE_MASKS['enemy_jet']
 
         def render_enemy_jet(i, raster_base):
             death_timer = state.jet_positions[i][3]
@@ -2039,31 +1781,24 @@ class ChopperCommandRenderer(JAXGameRenderer):
             jet_screen_x = state.jet_positions[i][0] - state.player_x + static_center_x_jet
             jet_screen_y = state.jet_positions[i][1]
 
-            phase0 = death_timer > (2 * self.consts.FRAMES_DEATH_ANIMATION_ENEMY) // 3
-            phase1 = jnp.logical_and(
-                death_timer <= (2 * self.consts.FRAMES_DEATH_ANIMATION_ENEMY) // 3,
-                death_timer > self.consts.FRAMES_DEATH_ANIMATION_ENEMY // 3
-            )
-            death_sprite = jnp.where(
-                phase0, ENEMY_CHOPPER_DEATH_1,
-                jnp.where(phase1, ENEMY_CHOPPER_DEATH_2, ENEMY_CHOPPER_DEATH_3)
-            )
+            death_sprite = self.SHAPE_MASKS['enemy_death'][get_enemy_death_frame(death_timer)]
 
             def render_true(r):
                 # je nach death_timer richtigen Sprite rendern
                 return jax.lax.cond(
                     death_timer <= self.consts.FRAMES_DEATH_ANIMATION_ENEMY,
                     # Wenn in Death-Phase
-                    lambda rr: jru.render_at(
+                    lambda rr: self.jr.render_at_clipped(
                         rr, jet_screen_x, jet_screen_y - 2, death_sprite,
-                        flip_horizontal=(state.jet_positions[i][2] == -1)
+                        flip_horizontal=(state.jet_positions[i][2] == -1),
+                        flip_offset=self.FLIP_OFFSETS['enemy_death'],
                     ),
                     # Wenn jet lebt
-                    lambda rr: jru.render_at(
+                    lambda rr: self.jr.render_at_clipped(
                         rr, jet_screen_x, jet_screen_y, frame_enemy_jet,
                         flip_horizontal=(state.jet_positions[i][2] == -1)
                     ),
-                    raster_base
+                    r
                 )
 
             return jax.lax.cond(
@@ -2076,7 +1811,7 @@ class ChopperCommandRenderer(JAXGameRenderer):
         raster = jax.lax.fori_loop(0, self.consts.MAX_JETS, render_enemy_jet, raster)
 
         # -- CHOPPER Rendering --
-        frame_enemy_chopper = jru.get_sprite_frame(SPRITE_ENEMY_HELI, state.step_counter)
+        frame_enemy_chopper = self.SHAPE_MASKS['enemy_chopper'][enemy_chopper_anim_idx]
 
         def render_enemy_chopper(i, raster_base):
             death_timer = state.chopper_positions[i][3]
@@ -2086,20 +1821,11 @@ class ChopperCommandRenderer(JAXGameRenderer):
             chopper_screen_x = state.chopper_positions[i][0] - state.player_x + static_center_x_chopper
             chopper_screen_y = state.chopper_positions[i][1]
 
-            phase0 = death_timer > (2 * self.consts.FRAMES_DEATH_ANIMATION_ENEMY) // 3
-            phase1 = jnp.logical_and(
-                death_timer <= (2 * self.consts.FRAMES_DEATH_ANIMATION_ENEMY) // 3,
-                death_timer > self.consts.FRAMES_DEATH_ANIMATION_ENEMY // 3
-            )
-
-            death_sprite = jnp.where(
-                phase0, ENEMY_CHOPPER_DEATH_1,
-                jnp.where(phase1, ENEMY_CHOPPER_DEATH_2, ENEMY_CHOPPER_DEATH_3)
-            )
+            death_sprite = self.SHAPE_MASKS['enemy_death'][get_enemy_death_frame(death_timer)]
 
             return jax.lax.cond(
                 should_render,
-                lambda r: jru.render_at(
+                lambda r: self.jr.render_at_clipped(
                     r,
                     chopper_screen_x,
                     chopper_screen_y,
@@ -2109,6 +1835,7 @@ class ChopperCommandRenderer(JAXGameRenderer):
                         frame_enemy_chopper
                     ),
                     flip_horizontal=(state.chopper_positions[i][2] == -1),
+                    flip_offset=self.FLIP_OFFSETS['enemy_chopper'],
                 ),
                 lambda r: r,
                 raster_base,
@@ -2117,13 +1844,13 @@ class ChopperCommandRenderer(JAXGameRenderer):
         raster = jax.lax.fori_loop(0, self.consts.MAX_CHOPPERS, render_enemy_chopper, raster)
 
         # Render enemy missiles
-        frame_enemy_missile = jru.get_sprite_frame(SPRITE_ENEMY_MISSILE, state.step_counter)
+        frame_enemy_missile = self.SHAPE_MASKS['enemy_missile']
 
         def render_enemy_missile(i, raster_base):
             should_render = state.enemy_missile_positions[i][1] > 2
             return jax.lax.cond(
                 should_render,
-                lambda r: jru.render_at(
+                lambda r: self.jr.render_at_clipped(
                     r,
                     state.enemy_missile_positions[i][0] - state.player_x + static_center_x_chopper,
                     state.enemy_missile_positions[i][1],
@@ -2152,14 +1879,14 @@ class ChopperCommandRenderer(JAXGameRenderer):
 
             return jax.lax.cond(is_zero, on_zero, on_nonzero)
 
-        score_array = jru.int_to_digits(state.score, 6)
+        score_array = self.jr.int_to_digits(state.score, 6)
         trimmed_digits = trim_leading_zeros(score_array)
 
         # Nur gültige Digits rendern
         def render_digit(raster, x_offset, digit):
             return jax.lax.cond(
                 digit >= 0,
-                lambda d: jru.render_label(raster, x_offset, 2, jnp.array([d], dtype=jnp.int32), DIGITS, spacing=8),
+                lambda d: self.jr.render_at(raster, x_offset, 2, self.SHAPE_MASKS['digits'][d]),
                 lambda _: raster,
                 operand=digit
             )
@@ -2175,12 +1902,12 @@ class ChopperCommandRenderer(JAXGameRenderer):
 
 
         # Render lives
-        raster = jru.render_indicator(
-            raster, 16, 10, state.lives-1, LIFE_INDICATOR, spacing=9
+        raster = self.jr.render_indicator(
+            raster, 16, 10, state.lives-1, self.SHAPE_MASKS['life_indicator'], spacing=9, max_value=6
         )
 
         # Render Player
-        frame_pl_heli = jru.get_sprite_frame(SPRITE_PL_CHOPPER, state.step_counter)
+        frame_pl_heli = self.SHAPE_MASKS['player_chopper'][player_anim_idx]
 
         death_timer = state.pause_timer
         should_render = jnp.logical_and(death_timer != 0, death_timer != 1)
@@ -2197,17 +1924,14 @@ class ChopperCommandRenderer(JAXGameRenderer):
         )
 
         # Entsprechenden Sprite wählen
-        death_sprite = jnp.where(
-            phase0, PLAYER_DEATH_1,
-            jnp.where(phase1, PLAYER_DEATH_2, PLAYER_DEATH_3)
-        )
+        death_sprite = self.SHAPE_MASKS['player_death'][jnp.where(phase0, 0, jnp.where(phase1, 1, 2))]
 
         all_enemies_dead = jnp.logical_and(jnp.all(state.jet_positions == 0), jnp.all(state.chopper_positions == 0))
 
         # Cond. Rendern
         raster = jax.lax.cond(
             should_render,
-            lambda r: jru.render_at(
+            lambda r: self.jr.render_at_clipped(
                 r,
                 chopper_position,
                 state.player_y,
@@ -2217,6 +1941,7 @@ class ChopperCommandRenderer(JAXGameRenderer):
                     death_sprite
                 ),
                 flip_horizontal=(state.player_facing_direction == -1),
+                flip_offset=self.FLIP_OFFSETS['player_chopper'],
             ),
             lambda r: r,
             raster,
@@ -2236,17 +1961,18 @@ class ChopperCommandRenderer(JAXGameRenderer):
                 index = jnp.floor_divide(delta_curr_missile_spawn, self.consts.MISSILE_ANIMATION_SPEED)
                 index = jnp.clip(index, 0, 15)
                 return index.astype(jnp.int32)
-            frame_pl_missile = jru.get_sprite_frame(SPRITE_PL_MISSILE, get_pl_missile_frame())
+            frame_pl_missile = self.SHAPE_MASKS['player_missile'][get_pl_missile_frame()]
 
 
             return jax.lax.cond(
                 missile_active,
-                lambda r: jru.render_at(
+                lambda r: self.jr.render_at_clipped(
                     r,
                     missile_screen_x,
                     missile_screen_y,
                     frame_pl_missile,
                     flip_horizontal=(missile[2] == -1),
+                    flip_offset=self.FLIP_OFFSETS['player_missile'],
                 ),
                 lambda r: r,
                 raster,
@@ -2263,23 +1989,23 @@ class ChopperCommandRenderer(JAXGameRenderer):
         #Render minimap
         raster = self.render_minimap(chopper_position, raster, state)
 
-        return raster
+        return self.jr.render_from_palette(raster, self.PALETTE)
 
     def render_minimap(self, chopper_position, raster, state):
         # Render minimap background
-        raster = jru.render_at(
+        raster = self.jr.render_at(
             raster,
             self.consts.MINIMAP_POSITION_X,
             self.consts.MINIMAP_POSITION_Y,
-            MINIMAP_BG,
+            self.SHAPE_MASKS['minimap_bg'],
         )
 
         # Render minimap mountains
         def get_minimap_mountains_frame():
             return jnp.asarray(((-state.player_x // (self.consts.DOWNSCALING_FACTOR_WIDTH * 7)) % 8), dtype=jnp.int32)
 
-        frame_minimap_mountains = jru.get_sprite_frame(MINIMAP_MOUNTAINS, get_minimap_mountains_frame())
-        raster = jru.render_at(
+        frame_minimap_mountains = self.SHAPE_MASKS['minimap_mountains'][get_minimap_mountains_frame()]
+        raster = self.jr.render_at(
             raster,
             self.consts.MINIMAP_POSITION_X,
             self.consts.MINIMAP_POSITION_Y + 3,
@@ -2338,11 +2064,11 @@ class ChopperCommandRenderer(JAXGameRenderer):
 
             raster_base = jax.lax.cond(
                 should_render,
-                lambda r: jru.render_at(
+                lambda r: self.jr.render_at(
                     r,
                     self.consts.MINIMAP_POSITION_X + minimap_x,
                     self.consts.MINIMAP_POSITION_Y + 1 + minimap_y,
-                    MINIMAP_TRUCK
+                    self.SHAPE_MASKS['minimap_truck']
                 ),
                 lambda r: r,
                 raster_base,
@@ -2384,11 +2110,11 @@ class ChopperCommandRenderer(JAXGameRenderer):
                             (jet_world_x - state.player_x + chopper_position) // self.consts.DOWNSCALING_FACTOR_WIDTH // 6)
                 minimap_y = (lane_world_y // (self.consts.DOWNSCALING_FACTOR_HEIGHT + 1))
 
-                return jru.render_at(
+                return self.jr.render_at(
                     r,
                     self.consts.MINIMAP_POSITION_X + minimap_x,
                     self.consts.MINIMAP_POSITION_Y + 3 + minimap_y,
-                    MINIMAP_ENEMY
+                    self.SHAPE_MASKS['minimap_enemy']
                 )
 
             return jax.lax.cond(should_render, do_render, lambda r: r, raster_base)
@@ -2429,11 +2155,11 @@ class ChopperCommandRenderer(JAXGameRenderer):
                             (chopper_world_x - state.player_x + chopper_position) // self.consts.DOWNSCALING_FACTOR_WIDTH // 6)
                 minimap_y = (lane_world_y // (self.consts.DOWNSCALING_FACTOR_HEIGHT + 1))
 
-                return jru.render_at(
+                return self.jr.render_at(
                     r,
                     self.consts.MINIMAP_POSITION_X + minimap_x,
                     self.consts.MINIMAP_POSITION_Y + 3 + minimap_y,
-                    MINIMAP_ENEMY
+                    self.SHAPE_MASKS['minimap_enemy']
                 )
 
             return jax.lax.cond(should_render, do_render, lambda r: r, raster_base)
@@ -2442,19 +2168,19 @@ class ChopperCommandRenderer(JAXGameRenderer):
 
 
         # Render player on minimap
-        raster = jru.render_at(
+        raster = self.jr.render_at(
             raster,
             self.consts.MINIMAP_POSITION_X + 16 + (chopper_position // (self.consts.DOWNSCALING_FACTOR_WIDTH * 7)),
             self.consts.MINIMAP_POSITION_Y + 6 + (state.player_y // (self.consts.DOWNSCALING_FACTOR_HEIGHT + 7)),
-            MINIMAP_PLAYER,
+            self.SHAPE_MASKS['minimap_player'],
         )
 
         #Render activision logo
-        raster = jru.render_at(
+        raster = self.jr.render_at(
             raster,
             self.consts.MINIMAP_POSITION_X + (self.consts.MINIMAP_WIDTH - 32) // 2,
             self.consts.HEIGHT - 7 - 1, #7 = Sprite Height 1=One pixel headroom
-            MINIMAP_ACTIVISION_LOGO,
+            self.SHAPE_MASKS['activision_logo'],
         )
 
         return raster
\ No newline at end of file
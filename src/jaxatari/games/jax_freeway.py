@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Tuple, NamedTuple, List, Dict, Optional, Any
 
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rewards import RewardRegistry
 import jaxatari.spaces as spaces
 from jaxatari.renderers import JAXGameRenderer
 from jaxatari.rendering import jax_rendering_utils as render_utils
@@ -95,7 +96,7 @@ class JaxFreeway(JaxEnvironment[FreewayState, FreewayObservation, FreewayInfo, F
             consts = FreewayConstants()
         super().__init__(consts)
         if reward_funcs is not None:
-            reward_funcs = tuple(reward_funcs)
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
         self.state = self.reset()
         self.renderer = FreewayRenderer()
@@ -134,6 +135,21 @@ class JaxFreeway(JaxEnvironment[FreewayState, FreewayObservation, FreewayInfo, F
 
         return self._get_observation(state), state
 
+    def _update_cars(self, cars: chex.Array, time: chex.Array) -> chex.Array:
+        """Moves the car of every lane whose update tick is due one pixel in its direction and wraps it around the screen."""
+        car_update = jnp.array(self.consts.car_update)
+        # A lane moves when time is a multiple of its update frequency, the sign gives the direction
+        moves = jnp.mod(time, car_update) == 0
+        new_x = jnp.where(moves, cars[:, 0] + jnp.sign(car_update), cars[:, 0])
+
+        # Wrap around screen
+        new_x = jnp.where(
+            car_update > 0,
+            jnp.where(new_x > self.consts.screen_width, -self.consts.car_width, new_x),
+            jnp.where(new_x < -self.consts.car_width, self.consts.screen_width, new_x),
+        ).astype(jnp.int32)
+        return cars.at[:, 0].set(new_x)
+
     @partial(jax.jit, static_argnums=(0,))
     def step(self, state: FreewayState, action: int) -> tuple[FreewayObservation, FreewayState, float, bool, FreewayInfo]:
         """Take a step in the game given an action"""
@@ -162,52 +178,21 @@ class JaxFreeway(JaxEnvironment[FreewayState, FreewayObservation, FreewayInfo, F
             self.consts.bottom_border + self.consts.chicken_height - 1,
         ).astype(jnp.int32)
 
-        # Update car positions
-        new_cars = state.cars
-        for lane in range(self.consts.num_lanes):
-            # Update x position based on lane speed
-            dir = (
-                self.consts.car_update[lane] / jnp.abs(self.consts.car_update[lane])
-            ).astype(jnp.int32)
-            new_x = jax.lax.cond(
-                jnp.equal(jnp.mod(state.time, self.consts.car_update[lane]), 0),
-                lambda: state.cars[lane, 0] + dir,
-                lambda: state.cars[lane, 0],
-            )
-
-            # Wrap around screen
-            new_x = jnp.where(
-                self.consts.car_update[lane] > 0,
-                jnp.where(
-                    new_x > self.consts.screen_width, -self.consts.car_width, new_x
-                ),
-                jnp.where(
-                    new_x < -self.consts.car_width, self.consts.screen_width, new_x
-                ),
-            ).astype(jnp.int32)
-
-            new_cars = new_cars.at[lane, 0].set(new_x)
-
-        # Check for collisions
-        def check_collision(car_pos):
-            car_x, car_y = car_pos
-            return jnp.logical_and(
-                self.consts.chicken_x < car_x + self.consts.car_width,
-                jnp.logical_and(
-                    self.consts.chicken_x + self.consts.chicken_width > car_x,
-                    jnp.logical_and(
-                        state.chicken_y - self.consts.chicken_height < car_y,
-                        state.chicken_y > car_y - self.consts.car_height,
-                    ),
-                ),
-            )
+        # Update car positions of all lanes at once
+        new_cars = self._update_cars(state.cars, state.time)
 
         # Check collisions for all cars
-        collisions = jax.vmap(check_collision)(new_cars)
-        any_collision = jnp.any(collisions)
-        any_collision = jax.lax.cond(
-            state.cooldown > 0, lambda _: False, lambda _: any_collision, operand=None
+        collisions = jnp.logical_and(
+            jnp.logical_and(
+                self.consts.chicken_x < new_cars[:, 0] + self.consts.car_width,
+                self.consts.chicken_x + self.consts.chicken_width > new_cars[:, 0],
+            ),
+            jnp.logical_and(
+                state.chicken_y - self.consts.chicken_height < new_cars[:, 1],
+                state.chicken_y > new_cars[:, 1] - self.consts.car_height,
+            ),
         )
+        any_collision = jnp.logical_and(jnp.any(collisions), state.cooldown <= 0)
 
         # Update cooldown
         new_cooldown = jnp.where(
@@ -301,9 +286,7 @@ class JaxFreeway(JaxEnvironment[FreewayState, FreewayObservation, FreewayInfo, F
     def _get_all_reward(self, previous_state: FreewayState, state: FreewayState):
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array(
-            [reward_func(previous_state, state) for reward_func in self.reward_funcs]
-        )
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
     @partial(jax.jit, static_argnums=(0,))
@@ -337,12 +320,12 @@ class JaxFreeway(JaxEnvironment[FreewayState, FreewayObservation, FreewayInfo, F
 
     def image_space(self) -> spaces.Box:
         """Returns the image space for Freeway.
-        The image is a RGB image with shape (210, 160, 3).
+        The image is a RGB image with the frame shape of the renderer, (210, 160, 3) by default.
         """
         return spaces.Box(
             low=0,
             high=255,
-            shape=(210, 160, 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8
         )
     
@@ -368,13 +351,13 @@ class JaxFreeway(JaxEnvironment[FreewayState, FreewayObservation, FreewayInfo, F
 
 
 class FreewayRenderer(JAXGameRenderer):
-    def __init__(self, consts: FreewayConstants = None):
-        super().__init__()
+    def __init__(self, consts: FreewayConstants = None, config: render_utils.RendererConfig = None):
+        super().__init__(consts, config)
         self.consts = consts or FreewayConstants()
         self.config = render_utils.RendererConfig(
             game_dimensions=(210, 160),
-            channels=3,
-            #downscale=(84, 84)
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
         self.jr = render_utils.JaxRenderingUtils(self.config)
         
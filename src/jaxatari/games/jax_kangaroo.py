@@ -8,6 +8,8 @@ from jax import Array
 
 import jaxatari.spaces as spaces
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rewards import RewardRegistry
+from jaxatari.compact import compact_fields, expand_fields
 from jaxatari.renderers import JAXGameRenderer
 import jaxatari.rendering.jax_rendering_utils as render_utils
 from jaxatari.games.kangaroo_levels import (
@@ -15,6 +17,7 @@ from jaxatari.games.kangaroo_levels import (
     Kangaroo_Level_1,
     Kangaroo_Level_2,
     Kangaroo_Level_3,
+    MAX_PLATFORMS,
 )
 
 class KangarooConstants(NamedTuple):
@@ -107,13 +110,13 @@ class PlayerState(NamedTuple):
 
 
 class LevelState(NamedTuple):
-    """All level related state variables."""
+    """
+    All level related state variables.
+    The static level geometry (platforms and ladders) is not part of the state, it is looked up in the
+    shared level table by current_level (see level_constants_at).
+    """
 
     timer: chex.Array
-    platform_positions: chex.Array
-    platform_sizes: chex.Array
-    ladder_positions: chex.Array
-    ladder_sizes: chex.Array
     fruit_positions: chex.Array
     fruit_actives: chex.Array
     fruit_stages: chex.Array
@@ -167,6 +170,69 @@ class KangarooState(NamedTuple):
     lives: chex.Array
 
 
+# Storage layout of KangarooState for compact_state (see jaxatari.compact), with the range of the fields
+# stored in 8 bits. All fields hold whole numbers: screen coordinates (a few pixels outside the screen at most,
+# or sentinels such as 1000 and -10) and timers are stored as int16.
+COMPACT_STATE_LAYOUT = KangarooState(
+    player=PlayerState(
+        x=jnp.int16,
+        y=jnp.int16,
+        vel_x=jnp.int8,  # -1, 0 or 1
+        orientation=jnp.int8,  # -1 or 1
+        height=jnp.int16,
+        is_crouching=jnp.bool_,
+        is_jumping=jnp.bool_,
+        jump_base_y=jnp.int16,
+        jump_counter=jnp.int16,
+        jump_orientation=jnp.int8,  # -1, 0 or 1
+        landing_base_y=jnp.int16,
+        is_climbing=jnp.bool_,
+        climb_base_y=jnp.int16,
+        climb_counter=jnp.int16,
+        cooldown_counter=jnp.int16,
+        is_crashing=jnp.bool_,
+        chrash_timer=jnp.int16,
+        punch_left=jnp.bool_,
+        punch_right=jnp.bool_,
+        last_stood_on_platform_y=jnp.int16,
+        walk_animation=jnp.int8,  # [0, 15]
+        punch_counter=jnp.int32,  # counts up as long as fire is held
+        needs_release=jnp.bool_,
+    ),
+    level=LevelState(
+        timer=jnp.int16,
+        fruit_positions=jnp.int16,
+        fruit_actives=jnp.bool_,
+        fruit_stages=jnp.int8,  # [0, 3]
+        bell_position=jnp.int16,
+        bell_timer=jnp.int16,
+        child_position=jnp.int16,
+        child_velocity=jnp.int8,  # -1 or 1
+        child_timer=jnp.int16,
+        falling_coco_position=jnp.int16,
+        falling_coco_dropping=jnp.bool_,
+        falling_coco_counter=jnp.int16,
+        falling_coco_skip_update=jnp.bool_,
+        step_counter=jnp.uint8,  # wraps at 256
+        monkey_states=jnp.int8,  # [0, 5]
+        monkey_positions=jnp.int16,
+        monkey_throw_timers=jnp.int16,
+        spawn_protection=jnp.bool_,
+        coco_positions=jnp.int16,
+        coco_states=jnp.int8,  # [0, 2]
+        spawn_position=jnp.bool_,
+        bell_animation=jnp.int16,
+    ),
+    score=jnp.int32,
+    current_level=jnp.int8,  # [1, 3]
+    level_finished=jnp.bool_,
+    levelup_timer=jnp.int16,
+    reset_coords=jnp.bool_,
+    levelup=jnp.bool_,
+    lives=jnp.int8,  # at most 3
+)
+
+
 class KangarooObservation(NamedTuple):
     player_x: chex.Array
     player_y: chex.Array
@@ -187,12 +253,59 @@ class KangarooInfo(NamedTuple):
     all_rewards: chex.Array
 
 
+def _pad_array(arr: jax.Array, target_size: int) -> jax.Array:
+    current_size = arr.shape[0]
+
+    return jnp.pad(
+        arr,
+        ((0, target_size - current_size), (0, 0)),
+        mode="constant",
+        constant_values=-1,
+    )
+
+
+def stack_level_constants(levels: List[LevelConstants], max_platforms: int = MAX_PLATFORMS) -> LevelConstants:
+    """
+    Builds the level table: pads the ladder and platform arrays of all levels to max_platforms rows (with -1)
+    and stacks each field along a new leading level axis.
+    """
+    padded = [
+        level._replace(
+            ladder_positions=_pad_array(level.ladder_positions, max_platforms),
+            ladder_sizes=_pad_array(level.ladder_sizes, max_platforms),
+            platform_positions=_pad_array(level.platform_positions, max_platforms),
+            platform_sizes=_pad_array(level.platform_sizes, max_platforms),
+        )
+        for level in levels
+    ]
+    return jax.tree.map(lambda *fields: jnp.stack(fields), *padded)
+
+
+# Level tables keyed by the ids of the levels they were built from; each entry keeps its levels alive,
+# so the env and the renderer of the same constants index one shared table.
+_LEVEL_TABLES = {}
+
+
+def level_table_for(consts: "KangarooConstants") -> LevelConstants:
+    """Returns the level table of consts, built by stack_level_constants on first use and shared afterwards."""
+    levels = (consts.LEVEL_1, consts.LEVEL_2, consts.LEVEL_3)
+    cache_key = tuple(id(level) for level in levels)
+    if cache_key not in _LEVEL_TABLES:
+        _LEVEL_TABLES[cache_key] = (levels, stack_level_constants(list(levels)))
+    return _LEVEL_TABLES[cache_key][1]
+
+
+def level_constants_at(level_table: LevelConstants, current_level: chex.Array) -> LevelConstants:
+    """Looks up the constants of current_level (1-based) in a table built by stack_level_constants."""
+    index = jnp.clip(current_level - 1, 0, level_table.bell_position.shape[0] - 1)
+    return jax.tree.map(lambda field: field[index], level_table)
+
+
 class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInfo, KangarooConstants]):
     def __init__(self, consts: KangarooConstants = None, reward_funcs: list[callable]=None):
         super().__init__(consts)
-        self.frame_stack_size = 4
         if reward_funcs is not None:
-            reward_funcs = tuple(reward_funcs)
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
         self.action_set = [
             Action.NOOP,
@@ -216,6 +329,7 @@ class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInf
         ]
         self.consts = consts or KangarooConstants()
         self.obs_size = 111
+        self.level_table = level_table_for(self.consts)
         self.renderer = KangarooRenderer(self.consts)
 
     @partial(jax.jit, static_argnums=(0,))
@@ -719,46 +833,9 @@ class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInf
 
         return new_child_timer, new_child_x, new_child_y, new_child_velocity
 
-    def _pad_array(self, arr: jax.Array, target_size: int):
-        current_size = arr.shape[0]
-
-        return jnp.pad(
-            arr,
-            ((0, target_size - current_size), (0, 0)),
-            mode="constant",
-            constant_values=-1,
-        )
-
-    def _pad_to_size(self, level_constants: LevelConstants, max_platforms: int):
-        return LevelConstants(
-            ladder_positions=self._pad_array(level_constants.ladder_positions, max_platforms),
-            ladder_sizes=self._pad_array(level_constants.ladder_sizes, max_platforms),
-            platform_positions=self._pad_array(level_constants.platform_positions, max_platforms),
-            platform_sizes=self._pad_array(level_constants.platform_sizes, max_platforms),
-            fruit_positions=level_constants.fruit_positions,
-            bell_position=level_constants.bell_position,
-            child_position=level_constants.child_position,
-        )
-
     @partial(jax.jit, static_argnums=(0,))
     def _get_level_constants(self, current_level: int) -> LevelConstants:
-        max_platforms = 20
-
-        level1_padded = self._pad_to_size(self.consts.LEVEL_1, max_platforms)
-        level2_padded = self._pad_to_size(self.consts.LEVEL_2, max_platforms)
-        level3_padded = self._pad_to_size(self.consts.LEVEL_3, max_platforms)
-
-        return jax.lax.cond(
-            current_level == 1,
-            lambda _: level1_padded,
-            lambda _: jax.lax.cond(
-                current_level == 2,
-                lambda _: level2_padded,
-                lambda _: level3_padded,
-                operand=None,
-            ),
-            operand=None,
-        )
+        return level_constants_at(self.level_table, current_level)
 
     @partial(jax.jit, static_argnums=(0,), donate_argnums=(1,))
     def _player_step(self, state: KangarooState, action: chex.Array):
@@ -1622,7 +1699,7 @@ class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInf
         return spaces.Box(
             low=0,
             high=255,
-            shape=(210, 160, 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8
         )
 
@@ -1672,10 +1749,6 @@ class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInf
                 fruit_positions=level_constants.fruit_positions,
                 fruit_actives=jnp.ones(3, dtype=jnp.bool_),
                 fruit_stages=jnp.zeros(3, dtype=jnp.int32),
-                ladder_positions=level_constants.ladder_positions,
-                ladder_sizes=level_constants.ladder_sizes,
-                platform_positions=level_constants.platform_positions,
-                platform_sizes=level_constants.platform_sizes,
                 child_position=level_constants.child_position,
                 child_timer=jnp.array(0),
                 child_velocity=jnp.array(1),
@@ -1807,10 +1880,6 @@ class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInf
                 lambda: LevelState(
                     bell_position=state.level.bell_position,
                     fruit_positions=state.level.fruit_positions,
-                    ladder_positions=state.level.ladder_positions,
-                    ladder_sizes=state.level.ladder_sizes,
-                    platform_positions=state.level.platform_positions,
-                    platform_sizes=state.level.platform_sizes,
                     child_position=jnp.array([new_child_x, new_child_y]),
                     timer=new_main_timer,
                     bell_timer=bell_timer,
@@ -1920,6 +1989,7 @@ class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInf
 
     @partial(jax.jit, static_argnums=(0,))
     def _get_observation(self, state: KangarooState) -> KangarooObservation:
+        level_constants: LevelConstants = self._get_level_constants(state.current_level)
         fruit_mask = state.level.fruit_actives[:, jnp.newaxis]
         fruit_positions = jnp.where(
             fruit_mask, state.level.fruit_positions, jnp.array([-1, -1])
@@ -1949,8 +2019,8 @@ class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInf
             player_x=state.player.x,
             player_y=state.player.y,
             player_o=state.player.orientation,
-            platform_positions=state.level.platform_positions,
-            ladder_positions=state.level.ladder_positions,
+            platform_positions=level_constants.platform_positions,
+            ladder_positions=level_constants.ladder_positions,
             fruit_positions=fruit_positions,
             bell_position=bell_position,
             child_position=state.level.child_position,
@@ -1979,30 +2049,41 @@ class JaxKangaroo(JaxEnvironment[KangarooState, KangarooObservation, KangarooInf
     ) -> chex.Array:
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array(
-            [reward_func(previous_state, state) for reward_func in self.reward_funcs]
-        )
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
+    @partial(jax.jit, static_argnums=(0,))
+    def compact_state(self, state: KangarooState) -> KangarooState:
+        return compact_fields(state, COMPACT_STATE_LAYOUT)
+
+    @partial(jax.jit, static_argnums=(0,))
+    def expand_state(self, compact_state: KangarooState) -> KangarooState:
+        _, state_like = jax.eval_shape(self.reset)
+        return expand_fields(compact_state, COMPACT_STATE_LAYOUT, state_like)
+
     @partial(jax.jit, static_argnums=(0,))
     def _get_done(self, state: KangarooState) -> bool:
         return jnp.logical_and(state.lives <= 0, state.player.y == 188)
 
 
 class KangarooRenderer(JAXGameRenderer):
-    def __init__(self, consts=None):
+    def __init__(self, consts=None, config: render_utils.RendererConfig = None):
         """
         Initializes the renderer by loading sprites, including level backgrounds.
 
         Args:
-            sprite_path: Path to the directory containing sprite .npy files.
+            consts: The game constants.
+            config: Renderer config, only its channels and downscale are used.
         """
+        super().__init__(consts, config)
         self.consts = consts or KangarooConstants()
 
         self.rendering_config = render_utils.RendererConfig(
             game_dimensions=(210, 160),
-            channels=3,
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
+        self.config = self.rendering_config
 
         self.jr = render_utils.JaxRenderingUtils(self.rendering_config)
 
@@ -2022,6 +2103,9 @@ class KangarooRenderer(JAXGameRenderer):
         # Pre-calculate static ladder properties (these should be constant even for different sized ladders) -> meaning that ladder heights should be divisible by 4!!
         self.ladder_rung_height = 4
         self.ladder_space_height = 4
+
+        # Platforms and ladders are drawn from the shared level table
+        self.level_table = level_table_for(self.consts)
             
     
     def _load_sprites(self):
@@ -2071,18 +2155,19 @@ class KangarooRenderer(JAXGameRenderer):
     def render(self, state: KangarooState) -> chex.Array:
         # --- 1. Initialize Raster ---
         raster = self.jr.create_object_raster(self.BACKGROUND)
-        
+        level_constants = level_constants_at(self.level_table, state.current_level)
+
         raster = self.jr.draw_rects(
             raster,
-            state.level.platform_positions,
-            state.level.platform_sizes,
+            level_constants.platform_positions,
+            level_constants.platform_sizes,
             self.PLATFORM_COLOR_ID
         )
 
         raster = self.jr.draw_ladders(
             raster,
-            state.level.ladder_positions,
-            state.level.ladder_sizes,
+            level_constants.ladder_positions,
+            level_constants.ladder_sizes,
             self.ladder_rung_height,
             self.ladder_space_height,
             self.LADDER_COLOR_ID
@@ -9,6 +9,7 @@ import jaxatari.spaces as spaces
 from jaxatari.renderers import JAXGameRenderer
 from jaxatari.rendering import jax_rendering_utils as render_utils
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rewards import RewardRegistry
 
 class PongConstants(NamedTuple):
     MAX_SPEED: int = 12
@@ -82,7 +83,7 @@ class JaxPong(JaxEnvironment[PongState, PongObservation, PongInfo, PongConstants
         super().__init__(consts)
         self.renderer = PongRenderer(self.consts)
         if reward_funcs is not None:
-            reward_funcs = tuple(reward_funcs)
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
         self.action_set = [
             Action.NOOP,
@@ -526,7 +527,7 @@ class JaxPong(JaxEnvironment[PongState, PongObservation, PongInfo, PongConstants
         return spaces.Box(
             low=0,
             high=255,
-            shape=(210, 160, 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8
         )
 
@@ -544,9 +545,7 @@ class JaxPong(JaxEnvironment[PongState, PongObservation, PongInfo, PongConstants
     def _get_all_reward(self, previous_state: PongState, state: PongState):
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array(
-            [reward_func(previous_state, state) for reward_func in self.reward_funcs]
-        )
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
     @partial(jax.jit, static_argnums=(0,))
@@ -557,13 +556,13 @@ class JaxPong(JaxEnvironment[PongState, PongObservation, PongInfo, PongConstants
         )
 
 class PongRenderer(JAXGameRenderer):
-    def __init__(self, consts: PongConstants = None):
-        super().__init__()
+    def __init__(self, consts: PongConstants = None, config: render_utils.RendererConfig = None):
+        super().__init__(consts, config)
         self.consts = consts or PongConstants()
         self.config = render_utils.RendererConfig(
             game_dimensions=(210, 160),
-            channels=3,
-            #downscale=(84, 84)
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
         self.jr = render_utils.JaxRenderingUtils(self.config)
         # 1. Create any procedural assets first
@@ -8,6 +8,9 @@ import chex
 
 import jaxatari.spaces as spaces
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rewards import RewardRegistry
+from jaxatari.physics import aabb_overlap, pairwise_overlaps
+from jaxatari.compact import Columns, compact_fields, expand_fields
 from jaxatari.renderers import JAXGameRenderer
 from jaxatari.rendering import jax_rendering_utils as render_utils
 
@@ -124,6 +127,42 @@ class SeaquestState(NamedTuple):
     rng_key: chex.PRNGKey
 
 
+# Storage layout of SeaquestState for compact_state (see jaxatari.compact), with the range each field can take.
+# All fields hold whole numbers. Entity tables are [x, y, direction] rows: screen coordinates at most a few
+# pixels outside the 160x210 screen (entities spawn and leave off screen) and a direction of -1, 0 or 1.
+COMPACT_ENTITY_LAYOUT = Columns((jnp.int16, jnp.int16, jnp.int8))
+COMPACT_STATE_LAYOUT = SeaquestState(
+    player_x=jnp.int16,                         # screen x, PLAYER_BOUNDS[0], -100 while hidden
+    player_y=jnp.int16,                         # screen y, PLAYER_BOUNDS[1]
+    player_direction=jnp.int8,                  # -1 or 1
+    oxygen=jnp.uint8,                           # [0, 64]
+    divers_collected=jnp.int8,                  # [0, 6]
+    score=jnp.int32,
+    lives=jnp.int8,                             # [-1, 6]
+    spawn_state=SpawnState(
+        difficulty=jnp.int16,                   # one step per successful rescue
+        lane_dependent_pattern=jnp.int16,       # wave counter per lane
+        to_be_spawned=jnp.int8,                 # 0 or 1
+        survived=jnp.int8,                      # -1, 0 or 1
+        prev_sub=jnp.int8,                      # 0 or 1
+        spawn_timers=jnp.int16,                 # [0, 337]
+        diver_array=jnp.int8,                   # -1, 0 or 1
+        lane_directions=jnp.int8,               # -1, 0 or 1
+    ),
+    diver_positions=COMPACT_ENTITY_LAYOUT,
+    shark_positions=COMPACT_ENTITY_LAYOUT,
+    sub_positions=COMPACT_ENTITY_LAYOUT,
+    enemy_missile_positions=COMPACT_ENTITY_LAYOUT,
+    surface_sub_position=COMPACT_ENTITY_LAYOUT,
+    player_missile_position=COMPACT_ENTITY_LAYOUT,
+    step_counter=jnp.int32,
+    just_surfaced=jnp.int8,                     # -1, 0 or 1
+    successful_rescues=jnp.int16,
+    death_counter=jnp.int16,                    # [-(96 + 2 * 64), 90]
+    rng_key=jnp.uint32,
+)
+
+
 class PlayerEntity(NamedTuple):
     x: jnp.ndarray
     y: jnp.ndarray
@@ -217,62 +256,12 @@ class JaxSeaquest(JaxEnvironment[SeaquestState, SeaquestObservation, SeaquestInf
     @partial(jax.jit, static_argnums=(0,))
     def check_collision_single(self, pos1, size1, pos2, size2):
         """Check collision between two single entities"""
-        # Calculate edges for rectangle 1
-        rect1_left = pos1[0]
-        rect1_right = pos1[0] + size1[0]
-        rect1_top = pos1[1]
-        rect1_bottom = pos1[1] + size1[1]
-
-        # Calculate edges for rectangle 2
-        rect2_left = pos2[0]
-        rect2_right = pos2[0] + size2[0]
-        rect2_top = pos2[1]
-        rect2_bottom = pos2[1] + size2[1]
-
-        # Check overlap
-        horizontal_overlap = jnp.logical_and(
-            rect1_left < rect2_right,
-            rect1_right > rect2_left
-        )
-
-        vertical_overlap = jnp.logical_and(
-            rect1_top < rect2_bottom,
-            rect1_bottom > rect2_top
-        )
-
-        return jnp.logical_and(horizontal_overlap, vertical_overlap)
+        return aabb_overlap(pos1[0], pos1[1], size1[0], size1[1], pos2[0], pos2[1], size2[0], size2[1])
 
     @partial(jax.jit, static_argnums=(0,))
     def check_collision_batch(self, pos1, size1, pos2_array, size2):
         """Check collision between one entity and an array of entities"""
-        # Calculate edges for rectangle 1
-        rect1_left = pos1[0]
-        rect1_right = pos1[0] + size1[0]
-        rect1_top = pos1[1]
-        rect1_bottom = pos1[1] + size1[1]
-
-        # Calculate edges for all rectangles in pos2_array
-        rect2_left = pos2_array[:, 0]
-        rect2_right = pos2_array[:, 0] + size2[0]
-        rect2_top = pos2_array[:, 1]
-        rect2_bottom = pos2_array[:, 1] + size2[1]
-
-        # Check overlap for all entities
-        horizontal_overlaps = jnp.logical_and(
-            rect1_left < rect2_right,
-            rect1_right > rect2_left
-        )
-
-        vertical_overlaps = jnp.logical_and(
-            rect1_top < rect2_bottom,
-            rect1_bottom > rect2_top
-        )
-
-        # Combine checks for each entity
-        collisions = jnp.logical_and(horizontal_overlaps, vertical_overlaps)
-
-        # Return true if any collision detected
-        return jnp.any(collisions)
+        return jnp.any(pairwise_overlaps(jnp.asarray(pos1)[None], size1, pos2_array, size2))
 
 
     @partial(jax.jit, static_argnums=(0,))
@@ -299,13 +288,9 @@ class JaxSeaquest(JaxEnvironment[SeaquestState, SeaquestObservation, SeaquestInf
             jnp.repeat(jnp.array(self.consts.ENEMY_SUB_SIZE)[None, :], sub_positions.shape[0], axis=0)
         ], axis=0)
 
-        def check_single_enemy(enemy_pos, enemy_size):
-            return self.check_collision_single(
-                missile_rect_pos, self.consts.MISSILE_SIZE, enemy_pos[:2], enemy_size
-            )
-
-        all_collision_mask = jax.vmap(check_single_enemy, in_axes=(0, 0))(all_enemies, enemy_sizes)
-        all_collision_mask = jnp.logical_and(missile_active, all_collision_mask)
+        all_collision_mask = pairwise_overlaps(
+            missile_rect_pos[None], self.consts.MISSILE_SIZE, all_enemies, enemy_sizes, active1=missile_active[None]
+        )[0]
 
         shark_collision_mask = all_collision_mask[:shark_positions.shape[0]]
         sub_collision_mask = all_collision_mask[shark_positions.shape[0]:]
@@ -2004,7 +1989,7 @@ class JaxSeaquest(JaxEnvironment[SeaquestState, SeaquestObservation, SeaquestInf
         consts = consts or SeaquestConstants()
         super().__init__(consts)
         if reward_funcs is not None:
-            reward_funcs = tuple(reward_funcs)
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
         self.action_set = [
             Action.NOOP,
@@ -2026,7 +2011,6 @@ class JaxSeaquest(JaxEnvironment[SeaquestState, SeaquestObservation, SeaquestInf
             Action.DOWNRIGHTFIRE,
             Action.DOWNLEFTFIRE
         ]
-        self.frame_stack_size = 4
         self.obs_size = 6 + 12 * 5 + 12 * 5 + 4 * 5 + 4 * 5 + 5 + 5 + 4
         self.renderer = SeaquestRenderer(self.consts)
 
@@ -2124,12 +2108,12 @@ class JaxSeaquest(JaxEnvironment[SeaquestState, SeaquestObservation, SeaquestInf
 
     def image_space(self) -> spaces.Box:
         """Returns the image space for Seaquest.
-        The image is a RGB image with shape (210, 160, 3).
+        The image is a RGB image with the frame shape of the renderer, (210, 160, 3) by default.
         """
         return spaces.Box(
             low=0,
             high=255,
-            shape=(210, 160, 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8
         )
 
@@ -2229,9 +2213,18 @@ class JaxSeaquest(JaxEnvironment[SeaquestState, SeaquestObservation, SeaquestInf
     def _get_all_rewards(self, previous_state: SeaquestState, state: SeaquestState) -> jnp.ndarray:
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array([reward_func(previous_state, state) for reward_func in self.reward_funcs])
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
+    @partial(jax.jit, static_argnums=(0,))
+    def compact_state(self, state: SeaquestState) -> SeaquestState:
+        return compact_fields(state, COMPACT_STATE_LAYOUT)
+
+    @partial(jax.jit, static_argnums=(0,))
+    def expand_state(self, compact_state: SeaquestState) -> SeaquestState:
+        _, state_like = jax.eval_shape(self.reset, jax.random.PRNGKey(0))
+        return expand_fields(compact_state, COMPACT_STATE_LAYOUT, state_like)
+
     @partial(jax.jit, static_argnums=(0,))
     def _get_done(self, state: SeaquestState) -> bool:
         return state.lives < 0
@@ -2661,12 +2654,13 @@ class JaxSeaquest(JaxEnvironment[SeaquestState, SeaquestObservation, SeaquestInf
 
 
 class SeaquestRenderer(JAXGameRenderer):
-    def __init__(self, consts: SeaquestConstants = None):
-        super().__init__()
+    def __init__(self, consts: SeaquestConstants = None, config: render_utils.RendererConfig = None):
+        super().__init__(consts, config)
         self.consts = consts or SeaquestConstants()
         self.config = render_utils.RendererConfig(
             game_dimensions=(210, 160),
-            channels=3,
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
         self.jr = render_utils.JaxRenderingUtils(self.config)
 
@@ -6,6 +6,7 @@ from functools import partial
 from typing import NamedTuple, Tuple, Optional, Callable, Sequence
 
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rewards import RewardRegistry
 from jaxatari.renderers import JAXGameRenderer
 from jaxatari.rendering import jax_rendering_utils as render_utils
 import jaxatari.spaces as spaces
@@ -139,6 +140,8 @@ class JaxSurround(
         ]
         # Wichtig: reward_funcs für _get_all_rewards speichern.
         # Bleibt während der Laufzeit statisch -> JAX-jit-freundlich.
+        if reward_funcs is not None:
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
 
     # --- Internal AI helper for P1 (left player) ---
@@ -545,9 +548,8 @@ class JaxSurround(
         # Statische Verzweigung: self ist per static_argnums=(0,) statisch.
         if self.reward_funcs is None:
             return jnp.zeros((1,), dtype=jnp.float32)
-        # reward_funcs ist eine Sequenz von Callables: rf(prev, curr) -> scalar/array
-        rewards = [rf(previous_state, state) for rf in self.reward_funcs]
-        return jnp.asarray(rewards, dtype=jnp.float32)
+        # reward_funcs ist eine RewardRegistry: liefert alle Rewards rf(prev, curr) als einen Vektor
+        return jnp.asarray(self.reward_funcs(previous_state, state), dtype=jnp.float32)
 
     
     @partial(jax.jit, static_argnums=(0,))
@@ -589,7 +591,7 @@ class JaxSurround(
         return spaces.Box(
             low=0,
             high=255,
-            shape=(self.consts.SCREEN_SIZE[1], self.consts.SCREEN_SIZE[0], 3),
+            shape=self.renderer.jr.config.frame_shape,
             dtype=jnp.uint8,
         )
 
@@ -602,12 +604,13 @@ class JaxSurround(
 
 
 class SurroundRenderer(JAXGameRenderer):
-    def __init__(self, consts: Optional[SurroundConstants] = None):
-        super().__init__()
+    def __init__(self, consts: Optional[SurroundConstants] = None, config: Optional[render_utils.RendererConfig] = None):
+        super().__init__(consts, config)
         self.consts = consts or SurroundConstants()
         self.config = render_utils.RendererConfig(
             game_dimensions=(self.consts.SCREEN_SIZE[1], self.consts.SCREEN_SIZE[0]),
-            channels=3,
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
         self.jr = render_utils.JaxRenderingUtils(self.config)
 
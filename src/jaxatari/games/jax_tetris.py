@@ -10,6 +10,7 @@ from jax import random as jrandom
 
 import jaxatari.spaces as spaces
 from jaxatari.environment import JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rewards import RewardRegistry
 from jaxatari.rendering import jax_rendering_utils as render_utils
 import numpy as np
 from jaxatari.renderers import JAXGameRenderer
@@ -142,6 +143,8 @@ class JaxTetris(JaxEnvironment[TetrisState, TetrisObservation, TetrisInfo, Tetri
         super().__init__(consts)
         self.renderer = TetrisRenderer(self.consts)
         self.instant_drop = instant_drop
+        if reward_funcs is not None:
+            reward_funcs = RewardRegistry(reward_funcs)
         self.reward_funcs = reward_funcs
 
     # ----- Helpers -----
@@ -353,7 +356,7 @@ class JaxTetris(JaxEnvironment[TetrisState, TetrisObservation, TetrisInfo, Tetri
         """
         Return the image space for rendering.
         """
-        return spaces.Box(low=0, high=255, shape=(210, 160, 3), dtype=jnp.uint8)
+        return spaces.Box(low=0, high=255, shape=self.renderer.jr.config.frame_shape, dtype=jnp.uint8)
 
     # ----- Public API -----
     @partial(jax.jit, static_argnums=(0,))
@@ -569,9 +572,7 @@ class JaxTetris(JaxEnvironment[TetrisState, TetrisObservation, TetrisInfo, Tetri
     def _get_all_reward(self, previous_state: TetrisState, state: TetrisState):
         if self.reward_funcs is None:
             return jnp.zeros(1)
-        rewards = jnp.array(
-            [reward_func(previous_state, state) for reward_func in self.reward_funcs]
-        )
+        rewards = self.reward_funcs(previous_state, state)
         return rewards
 
 
@@ -597,13 +598,13 @@ class JaxTetris(JaxEnvironment[TetrisState, TetrisObservation, TetrisInfo, Tetri
 
 # ======================= Renderer (pure JAX) =============
 class TetrisRenderer(JAXGameRenderer):
-    def __init__(self, consts: TetrisConstants = None):
-        super().__init__()
+    def __init__(self, consts: TetrisConstants = None, config: render_utils.RendererConfig = None):
+        super().__init__(consts, config)
         self.consts = consts or TetrisConstants()
         self.config = render_utils.RendererConfig(
             game_dimensions=(210, 160),
-            channels=3,
-            #downscale=(84, 84)
+            channels=self.config.channels,
+            downscale=self.config.downscale,
         )
         self.jr = render_utils.JaxRenderingUtils(self.config)
 
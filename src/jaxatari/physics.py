@@ -0,0 +1,93 @@
+"""Vectorized collision helpers for fixed-capacity entity tables."""
+
+from typing import Optional
+
+import chex
+import jax.numpy as jnp
+
+
+def aabb_overlap(
+    e1_x: chex.Array,
+    e1_y: chex.Array,
+    e1_w: chex.Array,
+    e1_h: chex.Array,
+    e2_x: chex.Array,
+    e2_y: chex.Array,
+    e2_w: chex.Array,
+    e2_h: chex.Array,
+) -> chex.Array:
+    """
+    Returns True where the axis-aligned boxes (x, y, w, h) of two entities overlap.
+    Boxes that only touch and boxes of zero width or height do not overlap. All arguments broadcast
+    against each other, so one entity can be tested against a table of entities without a vmap.
+    """
+    overlap_start_x = jnp.maximum(e1_x, e2_x)
+    overlap_end_x = jnp.minimum(e1_x + e1_w, e2_x + e2_w)
+    overlap_start_y = jnp.maximum(e1_y, e2_y)
+    overlap_end_y = jnp.minimum(e1_y + e1_h, e2_y + e2_h)
+    return jnp.logical_and(overlap_start_x < overlap_end_x, overlap_start_y < overlap_end_y)
+
+
+def pairwise_overlaps(
+    pos1: chex.Array,
+    size1: chex.Array,
+    pos2: chex.Array,
+    size2: chex.Array,
+    active1: Optional[chex.Array] = None,
+    active2: Optional[chex.Array] = None,
+) -> chex.Array:
+    """
+    Returns the (N, M) overlap matrix between a table of N entities and a table of M entities.
+    Args:
+        pos1: (N, 2+) positions, only the x and y columns are used.
+        size1: (2,) size shared by all entities, or (N, 2) sizes.
+        pos2: (M, 2+) positions.
+        size2: (2,) or (M, 2) sizes.
+        active1: Optional (N,) mask, inactive entities overlap nothing.
+        active2: Optional (M,) mask.
+    """
+    pos1, pos2 = jnp.asarray(pos1), jnp.asarray(pos2)
+    size1 = jnp.broadcast_to(jnp.asarray(size1), (pos1.shape[0], 2))
+    size2 = jnp.broadcast_to(jnp.asarray(size2), (pos2.shape[0], 2))
+    overlaps = aabb_overlap(
+        pos1[:, None, 0], pos1[:, None, 1], size1[:, None, 0], size1[:, None, 1],
+        pos2[None, :, 0], pos2[None, :, 1], size2[None, :, 0], size2[None, :, 1],
+    )
+    if active1 is not None:
+        overlaps = jnp.logical_and(overlaps, jnp.asarray(active1)[:, None])
+    if active2 is not None:
+        overlaps = jnp.logical_and(overlaps, jnp.asarray(active2)[None, :])
+    return overlaps
+
+
+def first_hit(mask: chex.Array, last: bool = False) -> chex.Array:
+    """
+    Returns the index of the first True entry along the last axis of mask, or -1 where there is none.
+    With last=True, the index of the last True entry is returned instead.
+    """
+    indices = jnp.arange(mask.shape[-1])
+    if last:
+        return jnp.max(jnp.where(mask, indices, -1), axis=-1)
+    return jnp.where(jnp.any(mask, axis=-1), jnp.argmax(mask, axis=-1), -1)
+
+
+def masked_scatter(
+    table: chex.Array,
+    indices: chex.Array,
+    rows: chex.Array,
+    mask: Optional[chex.Array] = None,
+) -> chex.Array:
+    """
+    Writes rows[k] to table[indices[k]] for all k with one scatter.
+    Writes that are masked out or whose index lies outside the table (including -1) are dropped.
+    If several writes target the same row, the last one wins, so the result matches writing them one after the other.
+    """
+    capacity = table.shape[0]
+    indices = jnp.asarray(indices)
+    valid = jnp.logical_and(indices >= 0, indices < capacity)
+    if mask is not None:
+        valid = jnp.logical_and(valid, mask)
+    indices = jnp.where(valid, indices, capacity)
+    superseded = jnp.any(jnp.triu(indices[:, None] == indices[None, :], k=1), axis=1)
+    indices = jnp.where(superseded, capacity, indices)
+    return table.at[indices].set(jnp.asarray(rows).astype(table.dtype), mode="drop")
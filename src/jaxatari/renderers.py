@@ -7,7 +7,10 @@ class PyGameRenderer:
 
 EnvConstants = TypeVar("EnvConstants")
 class JAXGameRenderer():
-    # TODO: include this properly in the workflow so the config can be set from the core!
+    """
+    Base class of the game renderers. The config passed in (e.g. by core.make_renderer) selects the
+    output channels and downscale, game renderers keep their own game_dimensions.
+    """
     def __init__(self, consts: EnvConstants = None, config: RendererConfig = None):
         self.config = config or RendererConfig()
 
@@ -1,4 +1,5 @@
 import os
+import hashlib
 import jax.numpy as jnp
 import jax
 from functools import partial
@@ -22,6 +23,27 @@ class RendererConfig(NamedTuple):
     def height_scaling(self) -> float:
         return self.downscale[0] / self.game_dimensions[0] if self.downscale else 1.0
 
+    @property
+    def frame_shape(self) -> Tuple[int, int, int]:
+        """(height, width, channels) of the frames rendered with this config."""
+        height, width = self.downscale or self.game_dimensions
+        return height, width, self.channels
+
+# Processed asset tables (palette, shape masks, background, ...) keyed by asset config, sprite path and renderer config.
+# Building them walks every sprite pixel in Python, so renderers of the same game and config share one copy.
+_ASSET_CACHE = {}
+
+def _freeze_asset_value(value):
+    """Turns an asset config value into something hashable. Array data is keyed by shape, dtype and content."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_asset_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_asset_value(v) for v in value)
+    if hasattr(value, "shape") and hasattr(value, "dtype"):
+        data = np.ascontiguousarray(np.asarray(value))
+        return (data.shape, data.dtype.str, hashlib.sha1(data.tobytes()).hexdigest())
+    return value
+
 class JaxRenderingUtils:
     def __init__(self, config: RendererConfig, transparent_id: int = 255):
         self.config = config
@@ -265,10 +287,10 @@ class JaxRenderingUtils:
                 if data.ndim == 4: # Batched sprites
                     scaled_masks = []
                     for mask in shape_masks[name]:
-                        # Calculate new dimensions based on scaling factors
+                        # Calculate new dimensions based on scaling factors, thin sprites keep at least one pixel
                         original_h, original_w = mask.shape
-                        scaled_h = int(original_h * self.config.height_scaling)
-                        scaled_w = int(original_w * self.config.width_scaling)
+                        scaled_h = max(1, int(original_h * self.config.height_scaling))
+                        scaled_w = max(1, int(original_w * self.config.width_scaling))
                         
                         scaled_mask = jax.image.resize(
                             mask, 
@@ -278,10 +300,10 @@ class JaxRenderingUtils:
                         scaled_masks.append(scaled_mask)
                     shape_masks[name] = jnp.stack(scaled_masks)
                 else: # Single sprite
-                    # Calculate new dimensions based on scaling factors
+                    # Calculate new dimensions based on scaling factors, thin sprites keep at least one pixel
                     original_h, original_w = shape_masks[name].shape
-                    scaled_h = int(original_h * self.config.height_scaling)
-                    scaled_w = int(original_w * self.config.width_scaling)
+                    scaled_h = max(1, int(original_h * self.config.height_scaling))
+                    scaled_w = max(1, int(original_w * self.config.width_scaling))
                     
                     scaled_mask = jax.image.resize(
                         shape_masks[name], 
@@ -320,6 +342,9 @@ class JaxRenderingUtils:
         - Calculating and storing flip offsets correctly and internally.
         - Generating the palette, shape masks, and background raster.
 
+        The processed tables are cached per asset config, base path and renderer config,
+        so building a second renderer for the same game does not reprocess the sprites.
+
         Args:
             base_path: The directory path where sprite .npy files are located.
             asset_config: A list of dictionaries defining the assets to load.
@@ -328,6 +353,16 @@ class JaxRenderingUtils:
         Returns:
             A tuple: (PALETTE, SHAPE_MASKS, BACKGROUND, COLOR_TO_ID, FLIP_OFFSETS)
         """
+        cache_key = (_freeze_asset_value(asset_config), os.path.abspath(base_path), self.config, self.TRANSPARENT_ID)
+        if cache_key not in _ASSET_CACHE:
+            _ASSET_CACHE[cache_key] = self._load_and_setup_assets(asset_config, base_path)
+
+        # Hand out fresh dicts so a renderer that swaps single entries does not affect the others
+        PALETTE, SHAPE_MASKS, BACKGROUND, COLOR_TO_ID, FLIP_OFFSETS = _ASSET_CACHE[cache_key]
+        return PALETTE, dict(SHAPE_MASKS), BACKGROUND, dict(COLOR_TO_ID), dict(FLIP_OFFSETS)
+
+    def _load_and_setup_assets(self, asset_config: list, base_path: str):
+        """Uncached implementation of load_and_setup_assets."""
         raw_sprites_dict = {}
         FLIP_OFFSETS = {}
         background_rgba = None
@@ -482,13 +517,45 @@ class JaxRenderingUtils:
         scaled_x = jnp.round(corrected_x * self.config.width_scaling).astype(jnp.int32)
         scaled_y = jnp.round(corrected_y * self.config.height_scaling).astype(jnp.int32)
         
-        # --- 4. NEW: Create Sprite Coordinate Maps for the Full Raster ---
+        sprite_h, sprite_w = flipped_mask.shape
+        raster_h, raster_w = object_raster.shape[:2]
+        if sprite_h > raster_h or sprite_w > raster_w:
+            # Sprites larger than the raster have no window inside it, sample over the full raster instead
+            return self._render_clipped_full_raster(object_raster, scaled_x, scaled_y, flipped_mask)
+
+        # --- 4. Pick a Sprite-Sized Window inside the Raster ---
+        # The window covers the visible part of the sprite; clamping keeps it inside the raster,
+        # so the cost scales with the sprite area instead of the screen area.
+        window_y = jnp.clip(scaled_y, 0, raster_h - sprite_h)
+        window_x = jnp.clip(scaled_x, 0, raster_w - sprite_w)
+
+        # --- 5. Sample the Sprite Mask for Every Window Pixel ---
+        # Window pixels that fall outside the sprite (clipped parts, or a sprite that is fully
+        # off-screen) get the transparent value.
+        sprite_coords_y = window_y + jnp.arange(sprite_h) - scaled_y
+        sprite_coords_x = window_x + jnp.arange(sprite_w) - scaled_x
+        valid_y = (sprite_coords_y >= 0) & (sprite_coords_y < sprite_h)
+        valid_x = (sprite_coords_x >= 0) & (sprite_coords_x < sprite_w)
+        sampled_sprite_ids = flipped_mask[
+            jnp.clip(sprite_coords_y, 0, sprite_h - 1)[:, None],
+            jnp.clip(sprite_coords_x, 0, sprite_w - 1)[None, :]
+        ]
+        sampled_sprite_ids = jnp.where(
+            valid_y[:, None] & valid_x[None, :], sampled_sprite_ids, self.TRANSPARENT_ID
+        ).astype(object_raster.dtype)
+
+        # --- 6. Merge the Window back into the Raster ---
+        target_slice = jax.lax.dynamic_slice(object_raster, (window_y, window_x), (sprite_h, sprite_w))
+        updated_slice = jnp.where(sampled_sprite_ids != self.TRANSPARENT_ID, sampled_sprite_ids, target_slice)
+        return jax.lax.dynamic_update_slice(object_raster, updated_slice, (window_y, window_x))
+
+    def _render_clipped_full_raster(self, object_raster: jnp.ndarray, scaled_x: jnp.ndarray, scaled_y: jnp.ndarray, flipped_mask: jnp.ndarray) -> jnp.ndarray:
+        """Clipped stamping by sampling the sprite at every raster pixel, for sprites larger than the raster."""
         # For each pixel on the main raster (self._xx, self._yy), calculate its
         # corresponding coordinate on the sprite mask.
         sprite_coords_y = self._yy - scaled_y
         sprite_coords_x = self._xx - scaled_x
-        
-        # --- 5. NEW: Sample the Sprite Mask using Inverse Mapping ---
+
         # map_coordinates will look up the values from flipped_mask at each of the
         # coordinates we just calculated.
         # - order=0: Use nearest-neighbor lookup (no interpolation).
@@ -501,10 +568,8 @@ class JaxRenderingUtils:
             cval=self.TRANSPARENT_ID
         ).astype(object_raster.dtype)
 
-        # --- 6. NEW: Merge the Sampled Sprite onto the Raster ---
         # Where the sampled map is not transparent, use its value. Otherwise,
-        # keep the original raster's value. This works for both on- and off-screen
-        # parts of the sprite in a single, vectorized operation.
+        # keep the original raster's value.
         return jnp.where(
             sampled_sprite_ids != self.TRANSPARENT_ID,
             sampled_sprite_ids,
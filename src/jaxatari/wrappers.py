@@ -1,27 +1,93 @@
 """Jaxatari Wrappers"""
 
 import functools
-from typing import Any, Dict, Tuple, Union, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
 
 import chex
 from flax import struct
 import jax
 import jax.image as jim
 import jax.numpy as jnp
-from jaxatari.environment import EnvState, JAXAtariAction as Action
+from jax.experimental.shard_map import shard_map
+from jax.sharding import Mesh, PartitionSpec
+from jaxatari.environment import EnvState, JaxEnvironment, JAXAtariAction as Action
+from jaxatari.rendering.jax_rendering_utils import RendererConfig
 import jaxatari.spaces as spaces
 import numpy as np
 
 class JaxatariWrapper(object):
-    """Base class for JAXAtark wrappers."""
+    """
+    Base class for JAXAtark wrappers.
+    With donate_state, step donates the incoming state to XLA, which can then write the new state into its
+    buffers instead of keeping both alive. The passed state must not be used after the call. Donation only
+    takes effect on the outermost jitted call, so set it on the last wrapper of the stack.
+    """
 
-    def __init__(self, env):
+    def __init__(self, env, donate_state: bool = False):
         self._env = env
+        self.donate_state = donate_state
+        if donate_state and hasattr(type(self), "step"):
+            step_fn = getattr(type(self).step, "__wrapped__", type(self).step)
+            self.step = jax.jit(functools.partial(step_fn, self), donate_argnums=(0,))
+
+    # selects outputs of this wrapper's step (instead of proxying to the wrapped env's lean_step)
+    lean_step = JaxEnvironment.lean_step
 
     # provide proxy access to regular attributes of wrapped object
     def __getattr__(self, name):
         return getattr(self._env, name)
 
+@struct.dataclass
+class FrameStack:
+    """
+    Ring buffer of stacked frames. Pushing a frame overwrites the oldest slot in place
+    instead of shifting the whole stack, the oldest-to-newest view is only built on request.
+    """
+    frames: chex.Array  # pytree of arrays with the stack as leading axis
+    index: chex.Array  # slot of the newest frame
+
+    @classmethod
+    def create(cls, frame: chex.Array, stack_size: int) -> "FrameStack":
+        """Creates a stack filled with copies of frame."""
+        frames = jax.tree.map(lambda x: jnp.stack([x] * stack_size), frame)
+        return cls(frames, jnp.array(stack_size - 1, dtype=jnp.int32))
+
+    def push(self, frame: chex.Array) -> "FrameStack":
+        """Writes frame into the slot of the oldest frame."""
+        stack_size = jax.tree.leaves(self.frames)[0].shape[0]
+        index = (self.index + 1) % stack_size
+        frames = jax.tree.map(
+            lambda stack, x: jax.lax.dynamic_update_index_in_dim(stack, x.astype(stack.dtype), index, axis=0),
+            self.frames, frame
+        )
+        return FrameStack(frames, index)
+
+    def ordered(self) -> chex.Array:
+        """Returns the frames ordered from oldest to newest, like a concatenate-shifted stack."""
+        stack_size = jax.tree.leaves(self.frames)[0].shape[0]
+        order = (self.index + 1 + jnp.arange(stack_size)) % stack_size
+        return jax.tree.map(lambda stack: jnp.take(stack, order, axis=0), self.frames)
+
+
+def _stack_frames(frame: chex.Array, stack_size: int, ring_buffer: bool):
+    """Creates a frame stack filled with copies of frame."""
+    if ring_buffer:
+        return FrameStack.create(frame, stack_size)
+    return jax.tree.map(lambda x: jnp.stack([x] * stack_size), frame)
+
+def _push_frame(stack, frame: chex.Array, ring_buffer: bool):
+    """Pushes frame as the newest frame of the stack, dropping the oldest one."""
+    if ring_buffer:
+        return stack.push(frame)
+    return jax.tree.map(lambda s, x: jnp.concatenate([s[1:], jnp.expand_dims(x, axis=0)], axis=0), stack, frame)
+
+def _ordered_frames(stack, ring_buffer: bool) -> chex.Array:
+    """Returns the frames of the stack ordered from oldest to newest."""
+    if ring_buffer:
+        return stack.ordered()
+    return stack
+
+
 @struct.dataclass
 class AtariState:
     env_state: EnvState
@@ -39,10 +105,19 @@ class AtariWrapper(JaxatariWrapper):
         sticky_actions: Whether to use sticky actions.
         frame_stack_size: The number of frames to stack.
         frame_skip: The number of frames to skip.
+        reset_pool_size: If > 0, the number of reset states that are precomputed once at construction.
+            On episode end a random state from this pool is swapped in instead of running a full reset, which
+            avoids computing reset (incl. noop reset and first fire) for every env on every step under vmap.
+            Envs that draw the same pool entry start from the same game state, so choose a large enough pool.
+        reset_pool_seed: The seed used to generate the reset pool.
+        donate_state: If True, step donates the incoming state (see JaxatariWrapper).
+        ring_buffer_stack: If True, the frame stacks of this wrapper and of the pixel wrappers on top of it are
+            kept as FrameStack ring buffers in the state. A step then writes one frame in place instead of
+            copying the whole stack. The returned observations are still ordered from oldest to newest.
     """
     # TODO: change sticky_actions to float
-    def __init__(self, env, sticky_actions: bool = True, frame_stack_size: int = 4, frame_skip: int = 4, max_episode_length: int = 10_000, episodic_life: bool = True, first_fire: bool = True, noop_reset: int = 0, clip_reward: bool = False, max_pooling: bool = False):
-        super().__init__(env)
+    def __init__(self, env, sticky_actions: bool = True, frame_stack_size: int = 4, frame_skip: int = 4, max_episode_length: int = 10_000, episodic_life: bool = True, first_fire: bool = True, noop_reset: int = 0, clip_reward: bool = False, max_pooling: bool = False, reset_pool_size: int = 0, reset_pool_seed: int = 0, ring_buffer_stack: bool = False, donate_state: bool = False):
+        super().__init__(env, donate_state)
         self._env = env
         self.sticky_actions = sticky_actions
         self.frame_stack_size = frame_stack_size
@@ -54,9 +129,17 @@ class AtariWrapper(JaxatariWrapper):
         self.noop_max = noop_reset
         self.clip_reward = clip_reward
         self.max_pooling = max_pooling
+        self.reset_pool_size = reset_pool_size
+        self.ring_buffer_stack = ring_buffer_stack
 
         self._observation_space = spaces.stack_space(self._env.observation_space(), self.frame_stack_size)
 
+        # Precompute the reset pool once. Each entry is a complete AtariState (incl. the initial obs stack).
+        self._reset_pool = None
+        if self.reset_pool_size > 0:
+            pool_keys = jax.random.split(jax.random.PRNGKey(reset_pool_seed), self.reset_pool_size)
+            _, self._reset_pool = jax.vmap(self.reset)(pool_keys)
+
     def observation_space(self) -> spaces.Space:
         """Returns the stacked observation space."""
         return self._observation_space
@@ -123,12 +206,30 @@ class AtariWrapper(JaxatariWrapper):
         )
 
         # Create the initial frame stack from the final observation.
-        obs = jax.tree.map(lambda x: jnp.stack([x] * self.frame_stack_size), obs)
+        obs_stack = _stack_frames(obs, self.frame_stack_size, self.ring_buffer_stack)
+
+        return _ordered_frames(obs_stack, self.ring_buffer_stack), AtariState(env_state, wrapper_key, step, prev_action, obs_stack)
 
-        return obs, AtariState(env_state, wrapper_key, step, prev_action, obs)
+    def _sample_reset_state(self, key: chex.PRNGKey) -> AtariState:
+        """Picks a random state from the precomputed reset pool."""
+        idx = jax.random.randint(key, shape=(), minval=0, maxval=self.reset_pool_size)
+        return jax.tree.map(lambda x: x[idx], self._reset_pool)
 
     @functools.partial(jax.jit, static_argnums=(0,))
     def step(self, state: AtariState, action: Union[int, float]) -> Tuple[Tuple[chex.Array, chex.Array], AtariState, float, bool, Dict[Any, Any]]:
+        new_obs, new_state, reward, done, info, _ = self._step(state, action, render=False)
+        return new_obs, new_state, reward, done, info
+
+    @functools.partial(jax.jit, static_argnums=(0,))
+    def step_with_image(self, state: AtariState, action: Union[int, float]) -> Tuple[Tuple[chex.Array, chex.Array], AtariState, float, bool, Dict[Any, Any], chex.Array]:
+        """
+        Same as step, but additionally returns the rendered frame of the new state.
+        Like in ALE, the frame is the pixel-wise maximum of the renders of the last two sub-frames of the frame skip.
+        If the episode ended, it is the render of the reset state instead. Only these two renders are computed.
+        """
+        return self._step(state, action, render=True)
+
+    def _step(self, state: AtariState, action: Union[int, float], render: bool):
         step_key, next_state_key = jax.random.split(state.key)
 
         new_action = action
@@ -142,12 +243,27 @@ class AtariWrapper(JaxatariWrapper):
             obs, new_env_state, reward, done, info = self._env.step(env_state, action) 
             return (new_env_state, action), (obs, reward, done, info)
 
-        (new_env_state, new_action), (obs, rewards, dones, infos) = jax.lax.scan(
-            body_fn,
-            (state.env_state, new_action),
-            None,
-            length=self.frame_skip,
-        )
+        if render and self.frame_skip > 1:
+            # Stop the scan one sub-frame early to render the second-to-last sub-frame for the pixel max-pool.
+            # The last sub-frame is rendered after the reset handling below, so no sub-frame is rendered twice.
+            (prev_env_state, new_action), scanned = jax.lax.scan(
+                body_fn,
+                (state.env_state, new_action),
+                None,
+                length=self.frame_skip - 1,
+            )
+            prev_image = self._env.render(prev_env_state)
+            (new_env_state, new_action), last = body_fn((prev_env_state, new_action), None)
+            obs, rewards, dones, infos = jax.tree.map(
+                lambda xs, x: jnp.concatenate([xs, jnp.expand_dims(x, axis=0)], axis=0), scanned, last
+            )
+        else:
+            (new_env_state, new_action), (obs, rewards, dones, infos) = jax.lax.scan(
+                body_fn,
+                (state.env_state, new_action),
+                None,
+                length=self.frame_skip,
+            )
 
         # ========== MAX POOLING LOGIC ==========
         def do_max_pool(obs_pytree):
@@ -164,7 +280,7 @@ class AtariWrapper(JaxatariWrapper):
         latest_obs = jax.lax.cond(self.max_pooling, do_max_pool, take_last_frame, obs)
 
         # push latest obs into the stack
-        new_obs_stack = jax.tree.map(lambda stack, obs_leaf: jnp.concatenate([stack[1:], jnp.expand_dims(obs_leaf, axis=0)], axis=0), state.obs_stack, latest_obs)
+        new_obs_stack = _push_frame(state.obs_stack, latest_obs, self.ring_buffer_stack)
 
         reward = jnp.sum(rewards)
         done = jnp.logical_or(dones.any(), state.step >= self.max_episode_length)
@@ -198,9 +314,21 @@ class AtariWrapper(JaxatariWrapper):
         def _step_fn(_):
             # When not done, create the next state, passing next_state_key for the *next* step.
             next_state = AtariState(new_env_state, next_state_key, state.step + 1, new_action, new_obs_stack)
-            return new_obs_stack, next_state
-
-        new_obs, new_state = jax.lax.cond(done, _reset_fn, _step_fn, operand=None)
+            return _ordered_frames(new_obs_stack, self.ring_buffer_stack), next_state
+
+        if self.reset_pool_size > 0:
+            # Swap in a pooled reset state with a cheap select instead of computing a full reset.
+            # The key is excluded from the select since both branches continue with next_state_key.
+            reset_state = self._sample_reset_state(jax.random.fold_in(step_key, 1))
+            _, step_state = _step_fn(None)
+            new_state = jax.tree.map(
+                lambda r, s: jnp.where(done, r, s),
+                reset_state.replace(key=None),
+                step_state.replace(key=None),
+            ).replace(key=next_state_key)
+            new_obs = _ordered_frames(new_state.obs_stack, self.ring_buffer_stack)
+        else:
+            new_obs, new_state = jax.lax.cond(done, _reset_fn, _step_fn, operand=None)
 
         reward = jax.lax.cond(
             self.clip_reward,
@@ -209,7 +337,14 @@ class AtariWrapper(JaxatariWrapper):
             reward
         )
 
-        return new_obs, new_state, reward, done, info_dict
+        image = None
+        if render:
+            # The new env state is the last sub-frame, or the reset state if the episode ended
+            image = self._env.render(new_state.env_state)
+            if self.frame_skip > 1:
+                image = jnp.where(done, image, jnp.maximum(prev_image, image))
+
+        return new_obs, new_state, reward, done, info_dict, image
 
 
 class ObjectCentricWrapper(JaxatariWrapper):
@@ -219,8 +354,8 @@ class ObjectCentricWrapper(JaxatariWrapper):
     Apply this wrapper after the AtariWrapper!
     """
 
-    def __init__(self, env):
-        super().__init__(env)
+    def __init__(self, env, donate_state: bool = False):
+        super().__init__(env, donate_state)
         assert isinstance(env, AtariWrapper), "ObjectCentricWrapper must be applied after AtariWrapper"
 
         # First, get the space for a SINGLE, UNSTACKED frame from the base env.
@@ -284,6 +419,56 @@ class ObjectCentricWrapper(JaxatariWrapper):
         return flat_obs, state, reward, done, info
 
 
+# numbers for grayscale transformation as in https://en.wikipedia.org/wiki/Luma_(video)
+GRAYSCALE_WEIGHTS = (0.2989, 0.5870, 0.1140)
+
+def _rendered_frame_shape(env) -> Tuple[int, int, int]:
+    """
+    Returns the (height, width, channels) of the frames the env renders.
+    Renderers set up with a RendererConfig downscale and/or grayscale already at render time.
+    """
+    renderer_utils = getattr(getattr(env, "renderer", None), "jr", None)
+    config = getattr(renderer_utils, "config", None)
+    if isinstance(config, RendererConfig):
+        return config.frame_shape
+    return env.image_space().shape
+
+def _resize_weights(in_size: int, out_size: int) -> jnp.ndarray:
+    """
+    Returns the (out_size, in_size) matrix of the bilinear (antialiased) resize along one axis.
+    jax.image.resize is linear and separable, so resizing the identity yields its weights.
+    """
+    return jim.resize(jnp.eye(in_size, dtype=jnp.float32), (out_size, in_size), method='bilinear')
+
+def _make_preprocess_fn(frame_shape: Tuple[int, int, int], resize_shape: Optional[Tuple[int, int]], grayscale: bool):
+    """
+    Builds the preprocessing of a single uint8 frame of frame_shape.
+    Resizing and grayscaling are fused into one pass with precomputed weights: the channels are
+    contracted with the grayscale weights first, then rows and columns with the resize matrices.
+    Steps the renderer already did (downscale, grayscale) are skipped.
+    """
+    height, width, channels = frame_shape
+    do_resize = resize_shape is not None and tuple(resize_shape) != (height, width)
+    do_grayscale = grayscale and channels != 1
+
+    if not (do_resize or do_grayscale):
+        return lambda image: image.astype(jnp.uint8)
+
+    row_weights = _resize_weights(height, resize_shape[0]) if do_resize else None
+    col_weights = _resize_weights(width, resize_shape[1]) if do_resize else None
+    gray_weights = jnp.array(GRAYSCALE_WEIGHTS, dtype=jnp.float32)
+
+    def preprocess(image: chex.Array) -> chex.Array:
+        image = image.astype(jnp.float32)
+        if do_grayscale:
+            image = jnp.dot(image, gray_weights)[..., jnp.newaxis]
+        if do_resize:
+            image = jnp.einsum('ih,hwc,jw->ijc', row_weights, image, col_weights)
+        return jnp.clip(image, 0, 255).astype(jnp.uint8)
+
+    return preprocess
+
+
 @struct.dataclass 
 class PixelState:
     atari_state: AtariState
@@ -293,20 +478,23 @@ class PixelState:
 class PixelObsWrapper(JaxatariWrapper):
     """
     Wrapper for Atari environments that returns the flattened pixel observations.
+    With max_pool_pixels, each frame is the pixel-wise maximum of the last two frame-skip sub-frames (as in ALE)
+    instead of the render of the final sub-frame.
     Apply this wrapper after the AtariWrapper!
     """
 
-    def __init__(self, env, do_pixel_resize: bool = False, pixel_resize_shape: tuple[int, int] = (84, 84), grayscale: bool = False):
-        super().__init__(env)
+    def __init__(self, env, do_pixel_resize: bool = False, pixel_resize_shape: tuple[int, int] = (84, 84), grayscale: bool = False, max_pool_pixels: bool = False, donate_state: bool = False):
+        super().__init__(env, donate_state)
         assert isinstance(env, AtariWrapper), "PixelObsWrapper has to be applied after AtariWrapper"
 
         self.do_pixel_resize = do_pixel_resize
         self.pixel_resize_shape = pixel_resize_shape
         self.grayscale = grayscale
+        self.max_pool_pixels = max_pool_pixels
 
         # Dynamically calculate the final observation space shape
-        base_shape = self._env.image_space().shape
-        height, width, channels = base_shape
+        frame_shape = _rendered_frame_shape(self._env)
+        height, width, channels = frame_shape
 
         if self.do_pixel_resize:
             height, width = self.pixel_resize_shape
@@ -314,6 +502,7 @@ class PixelObsWrapper(JaxatariWrapper):
             channels = 1
         
         final_shape = (height, width, channels)
+        self._preprocess = _make_preprocess_fn(frame_shape, self.pixel_resize_shape if self.do_pixel_resize else None, self.grayscale)
         # Create the space for a single preprocessed frame
         image_space = spaces.Box(low=0, high=255, shape=final_shape, dtype=jnp.uint8)
         # Stack the single-frame space
@@ -325,17 +514,7 @@ class PixelObsWrapper(JaxatariWrapper):
     
     def _preprocess_image(self, image: chex.Array) -> chex.Array:
         """Applies resizing and grayscaling to a single image frame."""
-        image = image.astype(jnp.float32)
-
-        # Has to use a standard Python `if` since jax.lax.cond would fail due to different shapes. This is possible since do_pixel_resize is a static parameter.
-        if self.do_pixel_resize:
-            image = jim.resize(image, (self.pixel_resize_shape[0], self.pixel_resize_shape[1], image.shape[-1]), method='bilinear')
-        
-        # applies grayscale if enabled with the same method as for resize
-        if self.grayscale:
-            image = jnp.dot(image, jnp.array([0.2989, 0.5870, 0.1140]))[..., jnp.newaxis] # numbers for grayscale transformation as in https://en.wikipedia.org/wiki/Luma_(video)
-        
-        return image.astype(jnp.uint8)
+        return self._preprocess(image)
 
     @functools.partial(jax.jit, static_argnums=(0,))
     def reset(self, key: chex.PRNGKey) -> Tuple[chex.Array, PixelState]:
@@ -346,9 +525,9 @@ class PixelObsWrapper(JaxatariWrapper):
         processed_image = self._preprocess_image(image)
 
         # Create a stack of identical processed images for the initial state
-        image_stack = jnp.stack([processed_image] * self._env.frame_stack_size)
+        image_stack = _stack_frames(processed_image, self._env.frame_stack_size, self._env.ring_buffer_stack)
         
-        return image_stack, PixelState(atari_state, image_stack)
+        return _ordered_frames(image_stack, self._env.ring_buffer_stack), PixelState(atari_state, image_stack)
     
     @functools.partial(jax.jit, static_argnums=(0,))
     def step(
@@ -357,17 +536,20 @@ class PixelObsWrapper(JaxatariWrapper):
         action: Union[int, float],
     ) -> Tuple[chex.Array, EnvState, float, bool, Any]:
         # Pass the nested atari_state to the underlying wrapper's step function
-        _, atari_state, reward, done, info = self._env.step(state.atari_state, action)
-        
-        image = self._env.render(atari_state.env_state)
+        if self.max_pool_pixels:
+            _, atari_state, reward, done, info, image = self._env.step_with_image(state.atari_state, action)
+        else:
+            _, atari_state, reward, done, info = self._env.step(state.atari_state, action)
+            image = self._env.render(atari_state.env_state)
+
         processed_image = self._preprocess_image(image)
 
-        # Update the image stack by shifting and adding the new processed image
-        image_stack = jnp.concatenate([state.image_stack[1:], jnp.expand_dims(processed_image, axis=0)], axis=0)
+        # Update the image stack by adding the new processed image as the newest frame
+        image_stack = _push_frame(state.image_stack, processed_image, self._env.ring_buffer_stack)
 
         # Create the new state with the *new* atari_state from the step
         new_state = PixelState(atari_state, image_stack)
-        return image_stack, new_state, reward, done, info
+        return _ordered_frames(image_stack, self._env.ring_buffer_stack), new_state, reward, done, info
 
 
 @struct.dataclass 
@@ -379,25 +561,28 @@ class PixelAndObjectCentricState:
 class PixelAndObjectCentricWrapper(JaxatariWrapper):
     """
     Wrapper for Atari environments that returns the flattened pixel observations and object-centric observations.
+    With max_pool_pixels, each pixel frame is the pixel-wise maximum of the last two frame-skip sub-frames (as in ALE).
     Apply this wrapper after the AtariWrapper!
     """
     
-    def __init__(self, env, do_pixel_resize: bool = False, pixel_resize_shape: tuple[int, int] = (84, 84), grayscale: bool = False):
-        super().__init__(env)
+    def __init__(self, env, do_pixel_resize: bool = False, pixel_resize_shape: tuple[int, int] = (84, 84), grayscale: bool = False, max_pool_pixels: bool = False, donate_state: bool = False):
+        super().__init__(env, donate_state)
         assert isinstance(env, AtariWrapper), "PixelAndObjectCentricWrapper must be applied after AtariWrapper"
         
         # Part 1: Define the stacked image space.
         self.do_pixel_resize = do_pixel_resize
         self.pixel_resize_shape = pixel_resize_shape
         self.grayscale = grayscale
+        self.max_pool_pixels = max_pool_pixels
 
-        base_shape = self._env.image_space().shape
-        height, width, channels = base_shape
+        frame_shape = _rendered_frame_shape(self._env)
+        height, width, channels = frame_shape
         if self.do_pixel_resize:
             height, width = self.pixel_resize_shape
         if self.grayscale:
             channels = 1
         final_shape = (height, width, channels)
+        self._preprocess = _make_preprocess_fn(frame_shape, self.pixel_resize_shape if self.do_pixel_resize else None, self.grayscale)
         image_space = spaces.Box(low=0, high=255, shape=final_shape, dtype=jnp.uint8)
         stacked_image_space = spaces.stack_space(image_space, self._env.frame_stack_size)
 
@@ -445,17 +630,7 @@ class PixelAndObjectCentricWrapper(JaxatariWrapper):
     
     def _preprocess_image(self, image: chex.Array) -> chex.Array:
         """Applies resizing and grayscaling to a single image frame."""
-        image = image.astype(jnp.float32)
-
-        # Has to use a standard Python `if` since jax.lax.cond would fail due to different shapes. This is possible since do_pixel_resize is a static parameter.
-        if self.do_pixel_resize:
-            image = jim.resize(image, (self.pixel_resize_shape[0], self.pixel_resize_shape[1], image.shape[-1]), method='bilinear')
-        
-        # applies grayscale if enabled with the same method as for resize
-        if self.grayscale:
-            image = jnp.dot(image, jnp.array([0.2989, 0.5870, 0.1140]))[..., jnp.newaxis] # numbers for grayscale transformation as in https://en.wikipedia.org/wiki/Luma_(video)
-        
-        return image.astype(jnp.uint8)
+        return self._preprocess(image)
     
     @functools.partial(jax.jit, static_argnums=(0,))
     def reset(
@@ -470,11 +645,11 @@ class PixelAndObjectCentricWrapper(JaxatariWrapper):
         # 3. Render and preprocess the image
         image = self._env.render(atari_state.env_state)
         processed_image = self._preprocess_image(image)
-        image_stack = jnp.stack([processed_image] * self._env.frame_stack_size)
+        image_stack = _stack_frames(processed_image, self._env.frame_stack_size, self._env.ring_buffer_stack)
 
         # 4. Create the state and observation tuple
         new_state = PixelAndObjectCentricState(atari_state, image_stack, flat_obs)
-        return (image_stack, flat_obs), new_state
+        return (_ordered_frames(image_stack, self._env.ring_buffer_stack), flat_obs), new_state
     
     @functools.partial(jax.jit, static_argnums=(0,))
     def step(
@@ -483,21 +658,24 @@ class PixelAndObjectCentricWrapper(JaxatariWrapper):
         action: Union[int, float],
     ) -> Tuple[chex.Array, EnvState, float, bool, Any]:
         # 1. Step the underlying environment using its state
-        obs_stack, atari_state, reward, done, info = self._env.step(state.atari_state, action)
+        if self.max_pool_pixels:
+            obs_stack, atari_state, reward, done, info, image = self._env.step_with_image(state.atari_state, action)
+        else:
+            obs_stack, atari_state, reward, done, info = self._env.step(state.atari_state, action)
+            image = self._env.render(atari_state.env_state)
 
         # 2. Flatten the new object-centric observation stack
         flat_obs = jax.vmap(self._env.obs_to_flat_array)(obs_stack)
 
-        # 3. Render and preprocess the new image
-        image = self._env.render(atari_state.env_state)
+        # 3. Preprocess the new image
         processed_image = self._preprocess_image(image)
         
         # 4. Update the image stack with the new processed image
-        image_stack = jnp.concatenate([state.image_stack[1:], jnp.expand_dims(processed_image, axis=0)], axis=0)
+        image_stack = _push_frame(state.image_stack, processed_image, self._env.ring_buffer_stack)
         
         # 5. Create the new state with the new atari_state
         new_state = PixelAndObjectCentricState(atari_state, image_stack, flat_obs)
-        return (image_stack, flat_obs), new_state, reward, done, info
+        return (_ordered_frames(image_stack, self._env.ring_buffer_stack), flat_obs), new_state, reward, done, info
 
 
 class FlattenObservationWrapper(JaxatariWrapper):
@@ -507,8 +685,8 @@ class FlattenObservationWrapper(JaxatariWrapper):
     Compatible with all the other wrappers, flattens the observations whilst preserving the overarching structure (i.e. if the observation is a tuple of multiple observations, the flattened observation will be a tuple of flattened observations).
     """
 
-    def __init__(self, env):
-        super().__init__(env)
+    def __init__(self, env, donate_state: bool = False):
+        super().__init__(env, donate_state)
 
         # build the new (flattened) observation space
         original_space = self._env.observation_space()
@@ -562,8 +740,8 @@ class NormalizeObservationWrapper(JaxatariWrapper):
     This wrapper is compatible with any observation structure (Pytrees).
     """
 
-    def __init__(self, env, to_neg_one: bool = False):
-        super().__init__(env)
+    def __init__(self, env, to_neg_one: bool = False, donate_state: bool = False):
+        super().__init__(env, donate_state)
         self._to_neg_one = to_neg_one
 
         original_space = self._env.observation_space()
@@ -669,15 +847,81 @@ class LogState:
     returned_episode_returns: float
     returned_episode_lengths: int
 
+@struct.dataclass
+class EpisodeStats:
+    """Returns and lengths of the last `window` finished episodes, kept on device as ring buffers."""
+    returns: chex.Array
+    lengths: chex.Array
+    index: chex.Array  # slot the next finished episode is written to
+    count: chex.Array  # number of finished episodes so far
+
+    @classmethod
+    def create(cls, window: int) -> "EpisodeStats":
+        return cls(
+            returns=jnp.zeros(window, dtype=jnp.float32),
+            lengths=jnp.zeros(window, dtype=jnp.int32),
+            index=jnp.array(0, dtype=jnp.int32),
+            count=jnp.array(0, dtype=jnp.int32),
+        )
+
+    def push(self, episode_return: chex.Array, episode_length: chex.Array, done: chex.Array) -> "EpisodeStats":
+        """Records a finished episode if done, otherwise returns the stats unchanged."""
+        window = self.returns.shape[-1]
+        return EpisodeStats(
+            returns=jnp.where(done, self.returns.at[self.index].set(episode_return), self.returns),
+            lengths=jnp.where(done, self.lengths.at[self.index].set(episode_length), self.lengths),
+            index=(self.index + done) % window,
+            count=self.count + done,
+        )
+
+@struct.dataclass
+class LogStatsState(LogState):
+    episode_stats: EpisodeStats = None
+
+def _window_summary(values: chex.Array, valid: chex.Array, bins: Optional[chex.Array], prefix: str) -> Dict[str, chex.Array]:
+    """Mean, min, max and optionally histogram bucket counts of the valid values."""
+    count = valid.sum()
+    values = values.astype(jnp.float32)
+    summary = {
+        f"{prefix}_mean": jnp.where(valid, values, 0.0).sum() / count,
+        f"{prefix}_min": jnp.where(count > 0, jnp.where(valid, values, jnp.inf).min(), jnp.nan),
+        f"{prefix}_max": jnp.where(count > 0, jnp.where(valid, values, -jnp.inf).max(), jnp.nan),
+    }
+    if bins is not None:
+        # Bucket i counts bins[i - 1] <= value < bins[i]; the first and last buckets catch values outside the edges
+        buckets = jnp.searchsorted(bins, values.ravel(), side="right")
+        summary[f"{prefix}_histogram"] = jnp.bincount(buckets, weights=valid.ravel().astype(jnp.int32), length=bins.shape[0] + 1)
+    return summary
+
 class LogWrapper(JaxatariWrapper):
-    """Log the episode returns and lengths."""
+    """
+    Log the episode returns and lengths.
+    With stats_window > 0, the returns and lengths of the last stats_window finished episodes (per env) are also
+    kept in the state and updated inside the jitted step. episode_statistics(state) aggregates them on device,
+    so they only need to be transferred to the host when they are read.
+    Args:
+        env: The environment to wrap.
+        stats_window: Number of finished episodes per env kept for episode_statistics. 0 disables the statistics.
+        return_bins: Optional increasing bucket edges for a histogram of episode returns.
+        length_bins: Optional increasing bucket edges for a histogram of episode lengths.
+        donate_state: If True, step donates the incoming state (see JaxatariWrapper).
+    """
+
+    def __init__(self, env, stats_window: int = 0, return_bins: Optional[Sequence[float]] = None, length_bins: Optional[Sequence[float]] = None, donate_state: bool = False):
+        super().__init__(env, donate_state)
+        self.stats_window = stats_window
+        self.return_bins = None if return_bins is None else np.asarray(return_bins, dtype=np.float32)
+        self.length_bins = None if length_bins is None else np.asarray(length_bins, dtype=np.float32)
 
     @functools.partial(jax.jit, static_argnums=(0,))
     def reset(
         self, key: chex.PRNGKey
     ) -> Tuple[chex.Array, LogState]:
         obs, atari_state = self._env.reset(key)
-        state = LogState(atari_state, 0.0, 0, 0.0, 0)
+        if self.stats_window > 0:
+            state = LogStatsState(atari_state, 0.0, 0, 0.0, 0, EpisodeStats.create(self.stats_window))
+        else:
+            state = LogState(atari_state, 0.0, 0, 0.0, 0)
         return obs, state
 
     @functools.partial(jax.jit, static_argnums=(0,))
@@ -689,7 +933,7 @@ class LogWrapper(JaxatariWrapper):
         obs, atari_state, reward, done, info = self._env.step(state.atari_state, action)
         new_episode_return = state.episode_returns + reward
         new_episode_length = state.episode_lengths + 1
-        state = LogState(
+        state = state.replace(
             atari_state=atari_state,
             episode_returns=new_episode_return * (1 - done),
             episode_lengths=new_episode_length * (1 - done),
@@ -698,11 +942,33 @@ class LogWrapper(JaxatariWrapper):
             returned_episode_lengths=state.returned_episode_lengths * (1 - done)
             + new_episode_length * done,
         )
+        if self.stats_window > 0:
+            state = state.replace(episode_stats=state.episode_stats.push(new_episode_return, new_episode_length, done))
         info["returned_episode_returns"] = state.returned_episode_returns
         info["returned_episode_lengths"] = state.returned_episode_lengths
         info["returned_episode"] = done
         return obs, state, reward, done, info
 
+    @functools.partial(jax.jit, static_argnums=(0,))
+    def episode_statistics(self, state: LogStatsState) -> Dict[str, chex.Array]:
+        """
+        Aggregates the recorded episodes of a (possibly batched) state over the window and all envs.
+        Returns the number of episodes in the window ("count"), the total number of finished episodes
+        ("total_episodes"), and mean/min/max (and histograms if bins are set) of returns and lengths.
+        Mean, min and max are NaN while no episode has finished.
+        """
+        if self.stats_window == 0:
+            raise ValueError("episode_statistics needs a LogWrapper with stats_window > 0")
+        stats = state.episode_stats
+        filled = jnp.minimum(stats.count, self.stats_window)
+        valid = jnp.arange(self.stats_window) < filled[..., None]
+        return {
+            "count": valid.sum(),
+            "total_episodes": stats.count.sum(),
+            **_window_summary(stats.returns, valid, self.return_bins, "return"),
+            **_window_summary(stats.lengths, valid, self.length_bins, "length"),
+        }
+
 @struct.dataclass
 class MultiRewardLogState:
     atari_state: Any # Can be any of the states from wrappers above
@@ -714,17 +980,25 @@ class MultiRewardLogState:
     returned_episode_lengths: int
 
 class MultiRewardLogWrapper(JaxatariWrapper):
-    """Log the episode returns and lengths for multiple rewards."""
+    """
+    Log the episode returns and lengths for multiple rewards.
+    The returns of the reward functions (info["all_rewards"]) are logged stacked, as one array
+    info["returned_episode_reward_returns"]. info["returned_episode_returns"] is left to LogWrapper, which
+    logs the scalar env return under it.
+    """
+
+    def _all_rewards_shape_dtype(self, atari_state) -> jax.ShapeDtypeStruct:
+        """Returns the shape and dtype of info["all_rewards"] by tracing step abstractly, without running it."""
+        _, _, _, _, info = jax.eval_shape(self._env.step, atari_state, 0)
+        return info.get("all_rewards", jax.ShapeDtypeStruct((1,), jnp.float32))
 
     @functools.partial(jax.jit, static_argnums=(0,))
     def reset(
         self, key: chex.PRNGKey,
     ) -> Tuple[chex.Array, MultiRewardLogState]:
         obs, atari_state = self._env.reset(key)
-        # Dummy step to get info structure
-        _, _, _, _, dummy_info = self._env.step(atari_state, 0)
-        rewards_shape_provider = dummy_info.get("all_rewards", jnp.zeros(1))
-        episode_returns_init = jnp.zeros_like(rewards_shape_provider)
+        rewards_shape_dtype = self._all_rewards_shape_dtype(atari_state)
+        episode_returns_init = jnp.zeros(rewards_shape_dtype.shape, rewards_shape_dtype.dtype)
         state = MultiRewardLogState(atari_state, 0.0, episode_returns_init, 0, 0.0, episode_returns_init, 0)
         return obs, state
 
@@ -753,8 +1027,69 @@ class MultiRewardLogWrapper(JaxatariWrapper):
             + new_episode_length * done,
         )
         info["returned_episode_env_returns"] = state.returned_episode_returns_env
-        for i, r in enumerate(new_episode_return):
-            info[f"returned_episode_returns_{i}"] = state.returned_episode_returns[i]
+        info["returned_episode_reward_returns"] = state.returned_episode_returns
         info["returned_episode_lengths"] = state.returned_episode_lengths
         info["returned_episode"] = done
-        return obs, state, reward, done, info
\ No newline at end of file
+        return obs, state, reward, done, info
+
+class VecEnvWrapper(JaxatariWrapper):
+    """
+    Runs num_envs copies of a wrapped environment as one batched environment.
+    reset takes one key per env (or a single key that is split) and step takes batched states and actions.
+    Both are vmapped and jitted once. With donate_state (the default), step donates the incoming states so XLA
+    can update them in place. With shard, the env batch is split across all local devices with shard_map,
+    each device steps its own slice of envs (and of their keys) without communicating with the others.
+    Episodes are reset automatically by the AtariWrapper in the stack when they end.
+    The spaces are those of a single env. Apply this wrapper last!
+    """
+
+    def __init__(self, env, num_envs: int, donate_state: bool = True, shard: bool = False):
+        # The batched step below handles the donation itself
+        super().__init__(env)
+        inner = env
+        while not isinstance(inner, AtariWrapper):
+            if not isinstance(inner, JaxatariWrapper):
+                raise ValueError("VecEnvWrapper needs an AtariWrapper in the wrapper stack for the auto-reset")
+            inner = inner._env
+
+        self.num_envs = num_envs
+        self.donate_state = donate_state
+        batched_reset = jax.vmap(self._env.reset)
+        batched_step = jax.vmap(self._env.step)
+
+        self.mesh = None
+        if shard:
+            devices = jax.local_devices()
+            if num_envs % len(devices) != 0:
+                raise ValueError(f"num_envs ({num_envs}) must be divisible by the number of local devices ({len(devices)})")
+            self.mesh = Mesh(np.array(devices), ("envs",))
+            # Every leaf of the states, observations and keys is split along its leading env axis
+            envs_spec = PartitionSpec("envs")
+            batched_reset = shard_map(batched_reset, mesh=self.mesh, in_specs=envs_spec, out_specs=envs_spec, check_rep=False)
+            batched_step = shard_map(batched_step, mesh=self.mesh, in_specs=(envs_spec, envs_spec), out_specs=envs_spec, check_rep=False)
+
+        self._batched_reset = jax.jit(batched_reset)
+        self._batched_step = jax.jit(batched_step, donate_argnums=(0,) if donate_state else ())
+
+    def _split_keys(self, key: chex.PRNGKey) -> chex.PRNGKey:
+        """Returns one key per env, splitting key if it is a single key."""
+        key_ndim = 0 if jax.dtypes.issubdtype(key.dtype, jax.dtypes.prng_key) else 1
+        if key.ndim == key_ndim:
+            return jax.random.split(key, self.num_envs)
+        if key.shape[0] != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} reset keys, got {key.shape[0]}")
+        return key
+
+    def reset(self, key: chex.PRNGKey) -> Tuple[chex.ArrayTree, Any]:
+        """Resets all envs. Returns the batched observations and states."""
+        return self._batched_reset(self._split_keys(key))
+
+    def step(
+        self,
+        state: Any,
+        action: chex.Array,
+    ) -> Tuple[chex.ArrayTree, Any, chex.Array, chex.Array, Dict[Any, Any]]:
+        """
+        Steps all envs with one action per env. With donate_state, the passed states must not be used afterwards.
+        """
+        return self._batched_step(state, action)
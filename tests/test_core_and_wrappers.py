@@ -1,20 +1,34 @@
 import collections
+import copy
+import os
+import subprocess
+import sys
 import jax
 import jax.numpy as jnp
 import pytest
 import jaxatari
-from jaxatari.environment import EnvInfo, EnvObs, EnvState
+import jaxatari.core
+from jaxatari.environment import EnvInfo, EnvObs, EnvState, JaxEnvironment
+from jaxatari.rendering import jax_rendering_utils
+from jaxatari.rendering.jax_rendering_utils import JaxRenderingUtils, RendererConfig
 from jaxatari.wrappers import (
     NormalizeObservationWrapper,
     ObjectCentricWrapper,
     PixelObsWrapper,
+    PixelState,
     AtariWrapper,
+    FrameStack,
     PixelAndObjectCentricWrapper,
     LogWrapper,
+    LogState,
+    LogStatsState,
     MultiRewardLogWrapper, 
     FlattenObservationWrapper
 )
 import jaxatari.spaces as spaces
+from jaxatari.rewards import RewardRegistry
+from jaxatari.physics import aabb_overlap, first_hit, masked_scatter, pairwise_overlaps
+from jaxatari.compact import Columns, FixedPoint, compact_fields, expand_fields, fits_layout
 import numpy as np
 import warnings
 
@@ -255,11 +269,21 @@ def test_multi_reward_log_wrapper(raw_env):
             assert jnp.all(state.returned_episode_returns == total_rewards)
             assert state.returned_episode_lengths == steps
             assert info["returned_episode_env_returns"] == total_reward_env
-            for i, r in enumerate(total_rewards):
-                assert info[f"returned_episode_returns_{i}"] == r
+            assert jnp.array_equal(info["returned_episode_reward_returns"], total_rewards)
             assert info["returned_episode_lengths"] == steps
             assert info["returned_episode"] == True
 
+    # Per-reward returns are logged as one stacked array, under a key of their own
+    assert info["returned_episode_reward_returns"].shape == state.episode_returns.shape
+    assert not any(key.startswith("returned_episode_returns") for key in info)
+
+    # Stacked on a LogWrapper, the scalar env return keeps its key
+    env = MultiRewardLogWrapper(LogWrapper(AtariWrapper(base_env)))
+    obs, state = env.reset(key)
+    obs, state, reward, done, info = env.step(state, 0)
+    assert info["returned_episode_returns"].shape == ()
+    assert info["returned_episode_reward_returns"].shape == state.episode_returns.shape
+
 
 def test_flatten_observation_wrapper(raw_env):
     """Test that FlattenObservationWrapper correctly flattens each observation type."""
@@ -493,5 +517,531 @@ def test_atari_wrapper_features_and_pixel_preprocessing(raw_env):
     assert pix_obs.shape == expected_shape
     assert obj_obs.ndim == 2
 
+def test_atari_wrapper_reset_pool(raw_env):
+    """Tests that the reset pool swaps in precomputed reset states on episode end."""
+    key = jax.random.PRNGKey(0)
+    num_envs = 16
+    pool_size = 4
+
+    # max_episode_length=0 forces done on every step, so every step has to swap in a pooled state
+    env = AtariWrapper(raw_env, max_episode_length=0, reset_pool_size=pool_size, reset_pool_seed=3)
+    pool = env._reset_pool
+    assert pool.step.shape == (pool_size,)
+
+    # The pool is made of the resets for reset_pool_seed, so the same seed always gives the same pool
+    _, expected_pool = jax.vmap(env.reset)(jax.random.split(jax.random.PRNGKey(3), pool_size))
+    same_seed_pool = AtariWrapper(raw_env, max_episode_length=0, reset_pool_size=pool_size, reset_pool_seed=3)._reset_pool
+    for leaf, expected, same_seed in zip(jax.tree.leaves(pool), jax.tree.leaves(expected_pool), jax.tree.leaves(same_seed_pool)):
+        assert jnp.array_equal(leaf, expected) and jnp.array_equal(leaf, same_seed)
+
+    # Tag the pool entries through their step counter to see which entry each env continues with
+    env._reset_pool = pool.replace(step=jnp.arange(pool_size, dtype=pool.step.dtype))
+
+    obs, state = jax.vmap(env.reset)(jax.random.split(key, num_envs))
+    obs, state, reward, done, info = jax.vmap(env.step)(state, jnp.zeros(num_envs, dtype=jnp.int32))
+
+    assert jnp.all(done)
+    # Different keys draw different pool entries
+    assert len(set(state.step.tolist())) > 1
+    # Each env continues with exactly the pooled state it drew, and its own key
+    for i, pool_index in enumerate(state.step.tolist()):
+        drawn = jax.tree.map(lambda x: x[i], state.replace(key=None))
+        entry = jax.tree.map(lambda x: x[pool_index], env._reset_pool.replace(key=None))
+        for leaf, expected in zip(jax.tree.leaves(drawn), jax.tree.leaves(entry)):
+            assert jnp.array_equal(leaf, expected)
+    # The returned observation is the initial stack of the pooled state
+    for leaf, expected in zip(jax.tree.leaves(obs), jax.tree.leaves(state.obs_stack)):
+        assert jnp.array_equal(leaf, expected)
+    assert state.key.shape[0] == num_envs
+    assert len({tuple(k) for k in state.key.tolist()}) == num_envs
+
+
+def test_pixel_obs_wrapper_max_pool_pixels(raw_env):
+    """Tests that max_pool_pixels pools the renders of the last two frame-skip sub-frames."""
+    key = jax.random.PRNGKey(0)
+    atari_env = AtariWrapper(raw_env, sticky_actions=False, frame_skip=4, episodic_life=False)
+    env = PixelObsWrapper(atari_env, max_pool_pixels=True)
+
+    obs, state = env.reset(key)
+    assert obs.shape == env.observation_space().shape
+
+    action = jnp.array(0, dtype=jnp.int32)
+    obs, new_state, reward, done, info = env.step(state, action)
+    assert obs.shape == env.observation_space().shape
+    assert obs.dtype == jnp.uint8
+
+    # Replay the sub-frames by hand and pool the last two renders
+    env_state = state.atari_state.env_state
+    images = []
+    for _ in range(atari_env.frame_skip):
+        _, env_state, _, _, _ = raw_env.step(env_state, action)
+        images.append(raw_env.render(env_state))
+    expected = jnp.where(done, raw_env.render(new_state.atari_state.env_state), jnp.maximum(images[-2], images[-1]))
+    assert jnp.array_equal(obs[-1], expected)
+    # The earlier frames of the stack are unchanged
+    assert jnp.array_equal(obs[:-1], state.image_stack[1:])
+
+
+def test_pixel_preprocessing_matches_reference(raw_env):
+    """Tests that the fused resize + grayscale preprocessing matches jax.image.resize followed by grayscaling."""
+    key = jax.random.PRNGKey(0)
+    atari_env = AtariWrapper(raw_env)
+    _, state = atari_env.reset(key)
+    image = atari_env.render(state.env_state)
+    luma = jnp.array([0.2989, 0.5870, 0.1140])
+
+    for resize, grayscale in [(True, True), (True, False), (False, True)]:
+        env = PixelObsWrapper(atari_env, do_pixel_resize=resize, pixel_resize_shape=(84, 84), grayscale=grayscale)
+        expected = image.astype(jnp.float32)
+        if resize:
+            expected = jax.image.resize(expected, (84, 84, expected.shape[-1]), method='bilinear')
+        if grayscale:
+            expected = jnp.dot(expected, luma)[..., jnp.newaxis]
+        processed = env._preprocess_image(image)
+        assert processed.dtype == jnp.uint8
+        assert processed.shape == env.observation_space().shape[1:]
+        # Only float rounding at the uint8 truncation may differ
+        assert jnp.max(jnp.abs(processed.astype(jnp.int32) - expected.astype(jnp.uint8).astype(jnp.int32))) <= 1
+
+
+def test_ring_buffer_frame_stacks(raw_env):
+    """Tests that ring buffer frame stacks return the same observations as the shifted stacks."""
+    key = jax.random.PRNGKey(0)
+    shifted_env = PixelAndObjectCentricWrapper(AtariWrapper(raw_env, sticky_actions=False))
+    ring_env = PixelAndObjectCentricWrapper(AtariWrapper(raw_env, sticky_actions=False, ring_buffer_stack=True))
+
+    shifted_obs, shifted_state = shifted_env.reset(key)
+    ring_obs, ring_state = ring_env.reset(key)
+    assert isinstance(ring_state.image_stack, FrameStack)
+    assert isinstance(ring_state.atari_state.obs_stack, FrameStack)
+
+    for i in range(6):
+        assert jax.tree.all(jax.tree.map(jnp.array_equal, shifted_obs, ring_obs))
+        action = jnp.array(i % raw_env.action_space().n, dtype=jnp.int32)
+        shifted_obs, shifted_state, _, _, _ = shifted_env.step(shifted_state, action)
+        ring_obs, ring_state, _, _, _ = ring_env.step(ring_state, action)
+    assert jax.tree.all(jax.tree.map(jnp.array_equal, shifted_obs, ring_obs))
+    assert jax.tree.all(jax.tree.map(jnp.array_equal, shifted_state.atari_state.obs_stack, ring_state.atari_state.obs_stack.ordered()))
+
+
+def test_core_registers_game(game_name):
+    """Tests that every game in the games directory can be created through jaxatari.core."""
+    assert game_name in jaxatari.list_available_games()
+
+    env = jaxatari.core.make(game_name)
+    renderer = jaxatari.core.make_renderer(game_name)
+
+    _, state = env.reset(jax.random.PRNGKey(0))
+    image = renderer.render(state)
+    assert image.dtype == jnp.uint8
+    assert env.image_space().contains(image)
+
+
+def test_core_registry_caches_renderers(game_name):
+    """Tests that renderers and their asset tables are built once per game."""
+    renderer = jaxatari.core.make_renderer(game_name)
+    assert jaxatari.core.make_renderer(game_name) is renderer
+
+    # A fresh env builds its own renderer instance, but reuses the processed assets
+    cached_assets = len(jax_rendering_utils._ASSET_CACHE)
+    env_renderer = jaxatari.core.make(game_name).renderer
+    assert len(jax_rendering_utils._ASSET_CACHE) == cached_assets
+    assert env_renderer.PALETTE is renderer.PALETTE
+
+
+def test_core_make_with_renderer_config(game_name):
+    """Tests that a renderer config set through core renders grayscale, downscaled frames directly."""
+    config = RendererConfig(channels=1, downscale=(84, 84))
+    env = jaxatari.core.make(game_name, renderer_config=config)
+    assert env.renderer is jaxatari.core.make_renderer(game_name, config)
+    assert jaxatari.core.make_renderer(game_name) is not env.renderer
+
+    _, state = env.reset(jax.random.PRNGKey(0))
+    image = env.render(state)
+    assert image.shape == (84, 84, 1)
+    assert image.dtype == jnp.uint8
+    assert env.image_space().contains(image)
+    # The image space comes from the renderer, not from a patched attribute, so copies keep it
+    assert "image_space" not in vars(env)
+    assert copy.copy(env).image_space().shape == (84, 84, 1)
+
+    # The pixel wrapper has nothing left to resize or grayscale
+    pixel_env = PixelObsWrapper(AtariWrapper(env), do_pixel_resize=True, pixel_resize_shape=(84, 84), grayscale=True)
+    obs, pixel_state = pixel_env.reset(jax.random.PRNGKey(0))
+    assert obs.shape == pixel_env.observation_space().shape == (4, 84, 84, 1)
+    assert jnp.array_equal(obs[-1], env.render(pixel_state.atari_state.env_state))
+
+
+def test_render_at_clipped_matches_full_raster_sampling():
+    """Tests that the windowed clipped blit matches sampling the sprite over the full raster."""
+    jr = JaxRenderingUtils(RendererConfig(game_dimensions=(30, 20)))
+    raster = jnp.arange(30 * 20, dtype=jnp.uint8).reshape(30, 20) % 7
+    sprite = jnp.arange(5 * 4, dtype=jnp.uint8).reshape(5, 4) % 9
+    sprite = sprite.at[0, 0].set(jr.TRANSPARENT_ID)
+    offset = jnp.array([1, 2])
+
+    for x in (-10, -4, -2, 0, 3, 16, 18, 25):
+        for y in (-8, -5, -1, 0, 12, 26, 29, 40):
+            for flip in (False, True):
+                clipped = jr.render_at_clipped(raster, x, y, sprite, flip_horizontal=flip, flip_vertical=flip, flip_offset=offset)
+                corrected_x, corrected_y = (x - 1, y - 2) if flip else (x, y)
+                flipped = jnp.flip(sprite, axis=(0, 1)) if flip else sprite
+                expected = jr._render_clipped_full_raster(raster, jnp.array(corrected_x), jnp.array(corrected_y), flipped)
+                assert jnp.array_equal(clipped, expected), (x, y, flip)
+
+
+def test_make_vec(game_name):
+    """Tests that make_vec batches reset and step and matches the unbatched wrapper stack."""
+    num_envs = 3
+    vec_env = jaxatari.core.make_vec(game_name, num_envs, wrappers=[AtariWrapper, ObjectCentricWrapper])
+    single_env = ObjectCentricWrapper(AtariWrapper(jaxatari.core.make(game_name)))
+    assert vec_env.observation_space() == single_env.observation_space()
+
+    keys = jax.random.split(jax.random.PRNGKey(0), num_envs)
+    obs, states = vec_env.reset(keys)
+    assert obs.shape == (num_envs,) + single_env.observation_space().shape
+    single_obs, single_state = single_env.reset(keys[1])
+    assert jnp.array_equal(obs[1], single_obs)
+
+    actions = jnp.arange(num_envs, dtype=jnp.int32) % vec_env.action_space().n
+    old_leaf = jax.tree.leaves(states)[0]
+    obs, states, rewards, dones, _ = vec_env.step(states, actions)
+    assert rewards.shape == dones.shape == (num_envs,)
+    # The incoming states are donated to the step
+    assert old_leaf.is_deleted()
+
+    single_obs, single_state, _, _, _ = single_env.step(single_state, actions[1])
+    assert jnp.array_equal(obs[1], single_obs)
+
+    # A single key is split into one key per env
+    obs, _ = vec_env.reset(jax.random.PRNGKey(1))
+    assert obs.shape[0] == num_envs
+
+
+def test_wrapper_donate_state(raw_env):
+    """Tests that donate_state donates the incoming state without changing the results."""
+    key = jax.random.PRNGKey(0)
+    env = LogWrapper(PixelObsWrapper(AtariWrapper(raw_env)))
+    donating_env = LogWrapper(PixelObsWrapper(AtariWrapper(raw_env)), donate_state=True)
+
+    _, state = env.reset(key)
+    _, donated_state = donating_env.reset(key)
+    for i in range(3):
+        action = jnp.array(i % raw_env.action_space().n, dtype=jnp.int32)
+        obs, state, reward, done, _ = env.step(state, action)
+        old_image_stack = donated_state.atari_state.image_stack
+        donated_obs, donated_state, donated_reward, donated_done, _ = donating_env.step(donated_state, action)
+        assert old_image_stack.is_deleted()
+        assert jnp.array_equal(obs, donated_obs)
+        assert reward == donated_reward and done == donated_done
+
+    # Without donation, the incoming state stays usable
+    old_image_stack = state.atari_state.image_stack
+    env.step(state, jnp.array(0, dtype=jnp.int32))
+    assert not old_image_stack.is_deleted()
+
+
+SHARDED_MAKE_VEC_SCRIPT = """
+import sys
+import jax, jax.numpy as jnp
+import jaxatari.core
+from jaxatari.wrappers import AtariWrapper, ObjectCentricWrapper
+
+game_name = sys.argv[1]
+assert jax.local_device_count() == 4
+results = []
+for shard in (False, True):
+    env = jaxatari.core.make_vec(game_name, 8, wrappers=[AtariWrapper, ObjectCentricWrapper], shard=shard)
+    obs, states = env.reset(jax.random.PRNGKey(0))
+    actions = jnp.arange(8, dtype=jnp.int32) % env.action_space().n
+    for _ in range(2):
+        obs, states, rewards, dones, _ = env.step(states, actions)
+    results.append(obs)
+assert len(obs.sharding.device_set) == 4
+assert jnp.array_equal(results[0], results[1])
+"""
+
+def test_make_vec_sharded(game_name):
+    """Tests that a sharded make_vec splits the envs across devices and matches the unsharded batch."""
+    env_vars = dict(os.environ, XLA_FLAGS="--xla_force_host_platform_device_count=4")
+    result = subprocess.run(
+        [sys.executable, "-c", SHARDED_MAKE_VEC_SCRIPT, game_name], env=env_vars, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    # The env count has to split evenly across the devices
+    if jax.local_device_count() > 1:
+        with pytest.raises(ValueError):
+            jaxatari.core.make_vec(game_name, jax.local_device_count() + 1, shard=True)
+
+
+def test_rollout(game_name):
+    """Tests that rollout records the same trajectory as stepping the batched env by hand."""
+    env = ObjectCentricWrapper(AtariWrapper(jaxatari.core.make(game_name)))
+    num_envs, num_steps = 2, 5
+
+    def policy_fn(params, obs, key):
+        actions = jax.random.randint(key, (obs.shape[0],), 0, env.action_space().n)
+        return actions, {"params": jnp.full(obs.shape[0], params)}
+
+    key = jax.random.PRNGKey(0)
+    trajectory, rollout_state = jaxatari.rollout(env, policy_fn, num_steps, num_envs=num_envs, key=key, params=1.0)
+    assert trajectory.actions.shape == trajectory.rewards.shape == trajectory.dones.shape == (num_steps, num_envs)
+    assert trajectory.obs.shape == (num_steps, num_envs) + env.observation_space().shape
+    assert jnp.all(trajectory.policy_info["params"] == 1.0)
+
+    key, reset_key = jax.random.split(key)
+    obs, states = jax.vmap(env.reset)(jax.random.split(reset_key, num_envs))
+    for t in range(num_steps):
+        key, policy_key = jax.random.split(key)
+        actions, _ = policy_fn(1.0, obs, policy_key)
+        assert jnp.array_equal(trajectory.obs[t], obs)
+        assert jnp.array_equal(trajectory.actions[t], actions)
+        obs, states, rewards, dones, _ = jax.vmap(env.step)(states, actions)
+        assert jnp.array_equal(trajectory.rewards[t], rewards)
+        assert jnp.array_equal(trajectory.dones[t], dones)
+    assert jnp.array_equal(rollout_state.obs, obs)
+
+    # Continuing from the returned state with donated buffers reuses their memory
+    next_trajectory, _ = jaxatari.rollout(env, policy_fn, num_steps, params=1.0, rollout_state=rollout_state, buffers=trajectory, donate=True)
+    assert trajectory.rewards.is_deleted()
+    assert next_trajectory.rewards.shape == (num_steps, num_envs)
+
+
+def test_compact_state_round_trip(game_name):
+    """
+    Tests that compact_state/expand_state restore batched states exactly, that every visited value lies within
+    the range of its storage dtype, and that the compact state is substantially smaller.
+    """
+    env = jaxatari.core.make(game_name)
+    if type(env).compact_state is JaxEnvironment.compact_state:
+        pytest.skip(f"{game_name} stores its state as is (identity compact_state)")
+    layout = sys.modules[type(env).__module__].COMPACT_STATE_LAYOUT
+    _, state = env.reset(jax.random.PRNGKey(0))
+
+    def step_fn(state, action):
+        _, state, _, _, _ = env.step(state, action)
+        return state, state
+
+    random_actions = jax.random.randint(jax.random.PRNGKey(1), (1000,), 0, env.action_space().n)
+    _, states = jax.lax.scan(step_fn, state, random_actions)
+    restored = env.expand_state(env.compact_state(states))
+    assert jax.tree.structure(restored) == jax.tree.structure(states)
+    for leaf, restored_leaf in zip(jax.tree.leaves(states), jax.tree.leaves(restored)):
+        assert restored_leaf.dtype == leaf.dtype
+        assert jnp.array_equal(restored_leaf, leaf)
+
+    # Holding one action for long drives counters furthest (e.g. counters that run while fire is held)
+    held_actions = jnp.broadcast_to(jnp.arange(env.action_space().n)[:, None], (env.action_space().n, 500))
+    _, held_states = jax.vmap(lambda actions: jax.lax.scan(step_fn, state, actions))(held_actions)
+    for trajectory in (states, held_states):
+        for path, fits in jax.tree_util.tree_flatten_with_path(fits_layout(trajectory, layout))[0]:
+            assert fits, f"{jax.tree_util.keystr(path)} leaves the range of its compact dtype"
+
+    compact_bytes = sum(leaf.nbytes for leaf in jax.tree.leaves(env.compact_state(state)))
+    assert sum(leaf.nbytes for leaf in jax.tree.leaves(state)) >= 1.5 * compact_bytes
+
+
+def test_compact_fields():
+    """Tests fixed point fields and per-column table layouts of jaxatari.compact."""
+    state = {
+        "position": jnp.array([[-1.5, 3.25, 2.0], [7.0, -0.75, 1.0]], dtype=jnp.float32),
+        "counter": jnp.array(300, dtype=jnp.int32),
+    }
+    layout = {
+        "position": Columns((FixedPoint(jnp.int16, 2), FixedPoint(jnp.int8, 4), jnp.uint8)),
+        "counter": jnp.int16,
+    }
+    compact = compact_fields(state, layout)
+    assert [column.dtype for column in compact["position"]] == [jnp.int16, jnp.int8, jnp.uint8]
+    assert compact["position"][0].tolist() == [-3, 14]
+    assert compact["counter"].dtype == jnp.int16
+    restored = jax.jit(lambda compact: expand_fields(compact, layout, state))(compact)
+    for key in state:
+        assert restored[key].dtype == state[key].dtype
+        assert jnp.array_equal(restored[key], state[key])
+    assert all(jax.tree.leaves(fits_layout(state, layout)))
+
+    # values that the casts would wrap or truncate are reported
+    assert not fits_layout(jnp.array([1.0, 128.0]), jnp.int8)
+    assert not fits_layout(jnp.array([0.25]), FixedPoint(jnp.int16, 2))
+    assert not fits_layout(jnp.array([-1]), jnp.uint8)
+    assert fits_layout(jnp.array([-128, 127]), jnp.int8)
+
+
+def test_lean_step(raw_env):
+    """Tests that lean_step returns the selected outputs of step, also through wrappers."""
+    _, state = raw_env.reset(jax.random.PRNGKey(0))
+    # some games donate the state passed to step, so each call gets its own copy
+    obs, next_state, reward, done, _ = raw_env.step(jax.tree.map(jnp.copy, state), 0)
+    lean_state, lean_reward, lean_done = raw_env.lean_step(jax.tree.map(jnp.copy, state), 0)
+    assert jax.tree.all(jax.tree.map(jnp.array_equal, lean_state, next_state))
+    assert lean_reward == reward and lean_done == done
+    lean_obs, lean_reward = raw_env.lean_step(state, 0, ("obs", "reward"))
+    assert jax.tree.all(jax.tree.map(jnp.array_equal, lean_obs, obs))
+
+    env = PixelObsWrapper(AtariWrapper(raw_env))
+    _, state = env.reset(jax.random.PRNGKey(0))
+    _, next_state, reward, _, _ = env.step(state, 0)
+    lean_state, lean_reward = env.lean_step(state, 0, ("state", "reward"))
+    assert isinstance(lean_state, PixelState)
+    assert jax.tree.all(jax.tree.map(jnp.array_equal, lean_state, next_state))
+    assert lean_reward == reward
+
+    with pytest.raises(ValueError):
+        raw_env.lean_step(state.atari_state.env_state, 0, ("observation",))
+
+
+def test_reward_registry(game_name):
+    """Tests that plain and vmapped parameterized reward functions are stacked in registration order."""
+    def leaf_sum(state):
+        return sum(jnp.sum(leaf.astype(jnp.float32)) for leaf in jax.tree.leaves(state) if leaf.dtype != jnp.uint32)
+
+    def change(previous_state, state):
+        return leaf_sum(state) - leaf_sum(previous_state)
+
+    def scaled_change(scale, previous_state, state):
+        return scale * change(previous_state, state)
+
+    scales = jnp.array([0.5, 2.0, -1.0])
+    registry = RewardRegistry([change]).register(scaled_change, scales).register(lambda previous_state, state: 1.0)
+    assert registry.num_rewards == 5 and registry.reward_shape == (5,)
+
+    env = jaxatari.core.make(game_name, reward_funcs=registry)
+    _, state = env.reset(jax.random.PRNGKey(0))
+    previous_state = jax.tree.map(jnp.copy, state)  # some games donate the state passed to step
+    _, next_state, _, _, info = env.step(state, 0)
+    reward_change = change(previous_state, next_state)
+    expected = jnp.concatenate([reward_change[None], scales * reward_change, jnp.ones(1)])
+    assert info.all_rewards.shape == registry.reward_shape
+    assert jnp.allclose(info.all_rewards, expected)
+
+    with pytest.raises(ValueError):
+        RewardRegistry().register(scaled_change, {"a": jnp.zeros(2), "b": jnp.zeros(3)})
+
+
+def test_physics():
+    """Tests the pairwise overlap matrix, hit selection and masked scatter against straightforward loops."""
+    # touching boxes and zero sized boxes do not overlap
+    assert aabb_overlap(0, 0, 2, 2, 1, 1, 2, 2)
+    assert not aabb_overlap(0, 0, 2, 2, 2, 0, 2, 2)
+    assert not aabb_overlap(0, 0, 4, 4, 1, 1, 0, 0)
+
+    key_1, key_2 = jax.random.split(jax.random.PRNGKey(0))
+    pos1 = jax.random.randint(key_1, (5, 2), 0, 20)
+    pos2 = jax.random.randint(key_2, (7, 3), 0, 20)
+    size2 = jnp.arange(14).reshape(7, 2) % 6
+    active2 = jnp.array([True, True, False, True, True, True, False])
+    overlaps = pairwise_overlaps(pos1, (4, 3), pos2, size2, active2=active2)
+    assert overlaps.shape == (5, 7)
+    for i in range(5):
+        for j in range(7):
+            expected = active2[j] and aabb_overlap(pos1[i, 0], pos1[i, 1], 4, 3, pos2[j, 0], pos2[j, 1], size2[j, 0], size2[j, 1])
+            assert overlaps[i, j] == expected
+
+    mask = jnp.array([[False, True, True], [False, False, False]])
+    assert first_hit(mask).tolist() == [1, -1]
+    assert first_hit(mask, last=True).tolist() == [2, -1]
+
+    table = jnp.zeros((4, 2), dtype=jnp.int32)
+    indices = jnp.array([1, 3, 1, -1, 4, 2])
+    rows = jnp.arange(12).reshape(6, 2)
+    write_mask = jnp.array([True, True, True, True, True, False])
+    expected = table
+    for index, row, write in zip(indices.tolist(), rows, write_mask.tolist()):
+        if write and 0 <= index < 4:
+            expected = expected.at[index].set(row)
+    assert jnp.array_equal(masked_scatter(table, indices, rows, write_mask), expected)
+    assert jnp.array_equal(jax.jit(masked_scatter)(table, indices, rows, write_mask), expected)
+
+
+def test_log_wrapper_episode_statistics(raw_env):
+    """Tests that the on-device episode statistics match the episodes reported in info."""
+    window, num_envs = 2, 2
+    return_bins, length_bins = [-1.0, 0.0, 1.0], [4.0, 6.0]
+    env = LogWrapper(AtariWrapper(raw_env, max_episode_length=5), stats_window=window, return_bins=return_bins, length_bins=length_bins)
+    obs, state = jax.vmap(env.reset)(jax.random.split(jax.random.PRNGKey(0), num_envs))
+    assert isinstance(state, LogStatsState)
+    assert jnp.isnan(env.episode_statistics(state)["return_mean"])
+
+    step_fn = jax.jit(jax.vmap(env.step))
+    episodes = [[] for _ in range(num_envs)]
+    key = jax.random.PRNGKey(1)
+    for _ in range(20):
+        key, action_key = jax.random.split(key)
+        actions = jax.random.randint(action_key, (num_envs,), 0, env.action_space().n)
+        obs, state, reward, done, info = step_fn(state, actions)
+        for i in np.nonzero(np.asarray(done))[0]:
+            episodes[i].append((float(info["returned_episode_returns"][i]), int(info["returned_episode_lengths"][i])))
+
+    stats = env.episode_statistics(state)
+    recent = [episode for env_episodes in episodes for episode in env_episodes[-window:]]
+    returns = np.array([episode[0] for episode in recent])
+    lengths = np.array([episode[1] for episode in recent])
+    assert stats["total_episodes"] == sum(len(env_episodes) for env_episodes in episodes)
+    assert stats["count"] == len(recent)
+    assert np.isclose(stats["return_mean"], returns.mean())
+    assert stats["return_min"] == returns.min() and stats["return_max"] == returns.max()
+    assert np.isclose(stats["length_mean"], lengths.mean())
+    assert stats["length_min"] == lengths.min() and stats["length_max"] == lengths.max()
+    assert np.array_equal(stats["return_histogram"], np.bincount(np.searchsorted(return_bins, returns, side="right"), minlength=4))
+    assert np.array_equal(stats["length_histogram"], np.bincount(np.searchsorted(length_bins, lengths, side="right"), minlength=3))
+
+    # Without a window the state layout is unchanged
+    _, state = LogWrapper(AtariWrapper(raw_env)).reset(jax.random.PRNGKey(0))
+    assert type(state) is LogState
+    with pytest.raises(ValueError):
+        LogWrapper(AtariWrapper(raw_env)).episode_statistics(state)
+
+
+def test_compile_env(game_name):
+    """Tests that the ahead-of-time compiled reset and step match the jitted env."""
+    env = ObjectCentricWrapper(AtariWrapper(jaxatari.core.make(game_name)))
+    batch_size = 2
+    compiled = jaxatari.compile_env(env, batch_size=batch_size)
+    assert compiled.batch_size == batch_size
+
+    keys = jax.random.split(jax.random.PRNGKey(0), batch_size)
+    actions = jnp.arange(batch_size, dtype=jnp.int32) % env.action_space().n
+    obs, states = compiled.reset(keys)
+    expected_obs, expected_states = jax.vmap(env.reset)(keys)
+    assert jnp.array_equal(obs, expected_obs)
+    obs, states, rewards, dones, _ = compiled.step(states, actions)
+    expected_obs, _, expected_rewards, expected_dones, _ = jax.vmap(env.step)(expected_states, actions)
+    assert jnp.array_equal(obs, expected_obs)
+    assert jnp.array_equal(rewards, expected_rewards) and jnp.array_equal(dones, expected_dones)
+
+    # A VecEnvWrapper is compiled for its number of envs
+    vec_env = jaxatari.core.make_vec(game_name, batch_size, wrappers=[AtariWrapper, ObjectCentricWrapper])
+    assert jaxatari.compile_env(vec_env).batch_size == batch_size
+
+    # Star imports must not shadow the builtin compile
+    namespace = {}
+    exec("from jaxatari import *\nfrom jaxatari.core import *", namespace)
+    assert "compile" not in namespace
+
+
+COMPILATION_CACHE_SCRIPT = """
+import sys
+import jaxatari
+from jaxatari.wrappers import AtariWrapper
+
+game_name, cache_dir = sys.argv[1], sys.argv[2]
+jaxatari.enable_compilation_cache(cache_dir, min_compile_time_secs=0)
+jaxatari.compile_env(AtariWrapper(jaxatari.make(game_name)), batch_size=2)
+"""
+
+def test_compilation_cache(game_name, tmp_path):
+    """Tests that compile_env with the persistent cache enabled writes the executables to the cache dir."""
+    # The cache is configured globally, so it is enabled in a separate process
+    result = subprocess.run(
+        [sys.executable, "-c", COMPILATION_CACHE_SCRIPT, game_name, str(tmp_path)], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    cached = os.listdir(tmp_path)
+    assert any(name.startswith("jit_reset") for name in cached)
+    assert any(name.startswith("jit_step") for name in cached)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
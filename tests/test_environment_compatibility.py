@@ -737,8 +737,7 @@ class TestAdvancedWrapperFeatures:
                 assert jnp.all(state.returned_episode_returns == total_rewards), "Returned episode returns should match total rewards"
                 assert state.returned_episode_lengths == steps, "Returned episode lengths should match step count"
                 assert info["returned_episode_env_returns"] == total_reward_env, "Info should contain correct episode returns env"
-                for i, r in enumerate(total_rewards):
-                    assert info[f"returned_episode_returns_{i}"] == r, f"Info should contain correct episode returns {i}"
+                assert jnp.array_equal(info["returned_episode_reward_returns"], total_rewards), "Info should contain correct episode returns per reward"
                 assert info["returned_episode_lengths"] == steps, "Info should contain correct episode lengths"
                 assert info["returned_episode"] == True, "Info should indicate episode returned"
 